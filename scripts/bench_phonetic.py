@@ -0,0 +1,91 @@
+"""ベンチマーク: _phonetic_fallback の大規模な英単語リストでの性能と出力の一致確認。
+
+使い方:
+    uv run python scripts/bench_phonetic.py [単語リストのパス]
+
+単語リスト（デフォルトは /usr/share/dict/words、無ければ疑似英単語 20 万語）を
+読み込み、パターンを 1 つずつ startswith で試していた旧実装と、トライ木を使う
+現在の実装の所要時間を比較する。キャッシュなし（全単語が初出）と、
+キャッシュあり（同じ単語の繰り返し）の両方を計測し、出力の一致も確認する。
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+from obsidian_podcast.llm.tts_prep import _PHONETIC_MAP, _phonetic_fallback
+
+DEFAULT_WORDS = Path("/usr/share/dict/words")
+
+
+def legacy_phonetic(word: str) -> str:
+    """パターンを順に試していた旧実装（比較用）。"""
+    lower = word.lower()
+    result = []
+    i = 0
+    while i < len(lower):
+        matched = False
+        for pattern, kana in _PHONETIC_MAP:
+            if lower[i:].startswith(pattern):
+                result.append(kana)
+                i += len(pattern)
+                matched = True
+                break
+        if not matched:
+            result.append(lower[i])
+            i += 1
+    return "".join(result)
+
+
+def load_words(path: Path | None) -> list[str]:
+    """英字のみの単語を読み込む。ファイルが無ければ疑似英単語を生成する。"""
+    path = path or DEFAULT_WORDS
+    if path.exists():
+        words = path.read_text(errors="ignore").split()
+        return [w for w in words if w.isascii() and w.isalpha()]
+    rng = random.Random(0)
+    syllables = [p for p, _ in _PHONETIC_MAP] + ["str", "pl", "br", "ing"]
+    return [
+        "".join(rng.choice(syllables) for _ in range(rng.randint(1, 5)))
+        for _ in range(200_000)
+    ]
+
+
+def timed(fn, words: list[str]) -> tuple[float, list[str]]:
+    start = time.perf_counter()
+    result = [fn(w) for w in words]
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    words = load_words(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+    distinct = list(dict.fromkeys(words))
+    print(f"vocabulary: {len(distinct):,} distinct words")
+
+    legacy_time, legacy_out = timed(legacy_phonetic, distinct)
+    _phonetic_fallback.cache_clear()
+    new_time, new_out = timed(_phonetic_fallback.__wrapped__, distinct)
+    status = "OK" if new_out == legacy_out else "MISMATCH"
+    print(
+        f"uncached: legacy {legacy_time:.3f}s, trie {new_time:.3f}s "
+        f"({legacy_time / new_time:.1f}x), output {status}"
+    )
+    if status != "OK":
+        sys.exit(1)
+
+    # 台本では同じ単語が何度も出てくるので、頻出語の繰り返しを再現する
+    rng = random.Random(0)
+    hot = distinct[:1000]
+    script_words = [rng.choice(hot) for _ in range(200_000)]
+    legacy_time, _ = timed(legacy_phonetic, script_words)
+    _phonetic_fallback.cache_clear()
+    new_time, _ = timed(_phonetic_fallback, script_words)
+    print(
+        f"repeated words: legacy {legacy_time:.3f}s, trie+LRU {new_time:.3f}s "
+        f"({legacy_time / new_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""ベンチマーク: 記事抽出 + 前処理の bs4 経路と lxml 経路の性能と出力の一致確認。
+
+使い方:
+    uv run python scripts/bench_preprocess.py [保存済みHTMLのディレクトリ]
+
+ディレクトリ内の *.html（保存済みの記事ページ）を読み込み、
+extract_content → preprocess（HTML 文字列を html.parser で再パース）と
+extract_content_tree → preprocess_tree（readability の lxml ツリーをそのまま使用）
+の所要時間を比較する。ディレクトリを省略した場合は、見出し・コード・画像・表を含む
+擬似的な記事ページを生成して使う。あわせて、両経路が同じテキストを返すことを確認する。
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from obsidian_podcast.preprocessor.text import preprocess, preprocess_tree
+from obsidian_podcast.scraper.extractor import extract_content, extract_content_tree
+
+
+def make_corpus(pages: int = 50) -> list[str]:
+    """ナビゲーションやフッターに囲まれた長めの記事ページを作る。
+
+    実際のページと同じく、タグの間には改行とインデントの空白を入れる。
+    """
+    corpus = []
+    for n in range(pages):
+        body = "\n  ".join(
+            f"<h2>セクション{i}</h2>"
+            f"<p>記事{n}の段落{i}です。Next.js と React の話をします。"
+            "十分な長さの本文があると readability が本文と判断しやすくなります。</p>"
+            f"<p>Paragraph {i} of article {n} with <a href='#'>a link</a> and "
+            "<b>bold text</b>, long enough to score as content.</p>"
+            "\n  <pre><code>const answer = 42;\nconsole.log(answer);</code></pre> \n"
+            f"<figure>\n  <img src='{i}.png'/>\n  <figcaption>図{i}</figcaption>"
+            "</figure>\n<table>\n  <tr><th>名前</th><th>値</th></tr>\n"
+            f"  <tr><td>item{i}</td><td>{i * 10}</td></tr>\n</table>"
+            for i in range(40)
+        )
+        corpus.append(
+            "<!DOCTYPE html><html><head><title>記事</title></head><body>"
+            "<nav><a href='/'>Home</a><a href='/about'>About</a></nav>"
+            f"<article><h1>記事{n}</h1>{body}</article>"
+            "<footer>Footer content</footer></body></html>"
+        )
+    return corpus
+
+
+def load_corpus(directory: Path | None) -> list[str]:
+    if directory is None:
+        return make_corpus()
+    return [
+        path.read_text(errors="ignore") for path in sorted(directory.glob("*.html"))
+    ]
+
+
+def bs4_path(html: str) -> str | None:
+    content = extract_content(html)
+    return preprocess(content) if content is not None else None
+
+
+def lxml_path(html: str) -> str | None:
+    tree = extract_content_tree(html)
+    return preprocess_tree(tree) if tree is not None else None
+
+
+def timed(fn, corpus: list[str]) -> tuple[float, list[str | None]]:
+    start = time.perf_counter()
+    result = [fn(html) for html in corpus]
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    corpus = load_corpus(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+    size = sum(len(html.encode()) for html in corpus)
+    print(f"corpus: {len(corpus)} pages, {size / 1024 / 1024:.1f} MB")
+
+    bs4_time, bs4_out = timed(bs4_path, corpus)
+    lxml_time, lxml_out = timed(lxml_path, corpus)
+    mismatches = sum(a != b for a, b in zip(bs4_out, lxml_out, strict=True))
+    print(
+        f"bs4 {bs4_time:.3f}s, lxml {lxml_time:.3f}s "
+        f"({bs4_time / lxml_time:.1f}x), {mismatches} mismatched pages"
+    )
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""ベンチマーク: split_text_for_llm の大規模入力での性能とチャンク境界の一致確認。
+
+使い方:
+    uv run python scripts/bench_split_text.py [MB数]
+
+ドキュメントダンプや長い書き起こしを想定した入力（デフォルト 5MB）を生成し、
+文字列連結ベースの旧実装と現在の実装の所要時間を比較する。
+あわせて、両者が同じチャンク境界を返すことを確認する。
+"""
+
+import sys
+import time
+
+from obsidian_podcast.llm.base import split_text_for_llm
+
+
+def legacy_split(text: str, max_chars: int = 4000) -> list[str]:
+    """文字列連結と .replace を使っていた旧実装（比較用）。"""
+    if not text or not text.strip():
+        return []
+    if len(text) <= max_chars:
+        return [text]
+    paragraphs = text.split("\n\n")
+    chunks: list[str] = []
+    current_chunk = ""
+    for para in paragraphs:
+        if not para.strip():
+            continue
+        if len(current_chunk) + len(para) + 2 <= max_chars:
+            if current_chunk:
+                current_chunk += "\n\n" + para
+            else:
+                current_chunk = para
+        else:
+            if current_chunk:
+                chunks.append(current_chunk)
+            if len(para) <= max_chars:
+                current_chunk = para
+            else:
+                sentences = (
+                    para.replace("。", "。\n").replace(". ", ".\n").split("\n")
+                )
+                current_chunk = ""
+                for sentence in sentences:
+                    if not sentence.strip():
+                        continue
+                    if len(current_chunk) + len(sentence) + 1 <= max_chars:
+                        if current_chunk:
+                            current_chunk += " " + sentence
+                        else:
+                            current_chunk = sentence
+                    else:
+                        if current_chunk:
+                            chunks.append(current_chunk)
+                        current_chunk = sentence
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def make_document(size_bytes: int) -> str:
+    """通常の段落と、段落区切りのない巨大な書き起こしを混ぜた文書を作る。"""
+    normal = "\n\n".join(
+        f"段落{i}です。Next.jsとReactの話をします。" * 8 for i in range(50)
+    )
+    transcript = "\n".join(
+        f"Speaker {i % 3}: this is line {i} of the transcript. It keeps going."
+        for i in range(2000)
+    )
+    parts: list[str] = []
+    total = 0
+    while total < size_bytes:
+        for part in (normal, transcript):
+            parts.append(part)
+            total += len(part.encode())
+    return "\n\n".join(parts)
+
+
+def timed(fn, text: str, max_chars: int) -> tuple[float, list[str]]:
+    start = time.perf_counter()
+    result = fn(text, max_chars=max_chars)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    text = make_document(int(megabytes * 1024 * 1024))
+    print(f"input: {len(text.encode()) / 1024 / 1024:.1f} MB, {len(text):,} chars")
+
+    for max_chars in (1000, 4000, 16000, 1_000_000):
+        legacy_time, legacy_chunks = timed(legacy_split, text, max_chars)
+        new_time, new_chunks = timed(split_text_for_llm, text, max_chars)
+        status = "OK" if new_chunks == legacy_chunks else "MISMATCH"
+        print(
+            f"max_chars={max_chars:>6}: legacy {legacy_time:.3f}s, "
+            f"current {new_time:.3f}s ({legacy_time / new_time:.1f}x), "
+            f"{len(new_chunks):,} chunks, boundaries {status}"
+        )
+        if status != "OK":
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""ベンチマーク: StateDB の1件ずつの書き込みと一括書き込みの比較。
+
+使い方:
+    uv run python scripts/bench_state_db.py [件数]
+
+add_article / update_status を1件ずつ呼ぶ場合と、
+add_articles_bulk / update_status_bulk で1トランザクションにまとめる場合の
+所要時間を計測する（デフォルト 10,000 件）。
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from obsidian_podcast.db.state import StateDB
+from obsidian_podcast.models import Article
+
+FEED_URL = "https://example.com/feed.xml"
+
+
+def make_articles(n: int) -> list[Article]:
+    return [
+        Article(url=f"https://example.com/posts/{i}", feed_url=FEED_URL, title=f"#{i}")
+        for i in range(n)
+    ]
+
+
+def bench_per_row(db: StateDB, articles: list[Article]) -> tuple[float, float]:
+    start = time.perf_counter()
+    ids = [
+        db.add_article(url=a.url, feed_url=a.feed_url, title=a.title)
+        for a in articles
+    ]
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for article_id in ids:
+        db.update_status(article_id, "completed", audio_url="https://cdn/a.mp3")
+    update_time = time.perf_counter() - start
+    return insert_time, update_time
+
+
+def bench_bulk(db: StateDB, articles: list[Article]) -> tuple[float, float]:
+    start = time.perf_counter()
+    ids = db.add_articles_bulk(articles)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    db.update_status_bulk(
+        (article_id, "completed", "https://cdn/a.mp3", None) for article_id in ids
+    )
+    update_time = time.perf_counter() - start
+    return insert_time, update_time
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    articles = make_articles(n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for name, bench in (("per-row", bench_per_row), ("bulk", bench_bulk)):
+            with StateDB(Path(tmp) / f"{name}.db") as db:
+                db.initialize()
+                results[name] = bench(db, articles)
+
+    print(f"{n:,} articles")
+    print(f"{'':10} {'insert':>10} {'update':>10}")
+    for name, (insert_time, update_time) in results.items():
+        print(f"{name:10} {insert_time:>9.3f}s {update_time:>9.3f}s")
+    per_row, bulk = results["per-row"], results["bulk"]
+    print(
+        f"{'speedup':10} {per_row[0] / bulk[0]:>9.1f}x {per_row[1] / bulk[1]:>9.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""ベンチマーク: sanitize_for_tts の長い台本での性能と出力の一致確認。
+
+使い方:
+    uv run python scripts/bench_tts_prep.py [KB数]
+
+Markdown・絵文字・英単語・数字を含む LLM 出力風の台本（デフォルト 500KB）を生成し、
+パスごとに新しい文字列を作っていた旧実装と現在の実装の所要時間を比較する。
+あわせて、両者がバイト単位で同じ出力を返すことを確認する。
+"""
+
+import re
+import sys
+import time
+import unicodedata
+
+from obsidian_podcast.llm.tts_prep import (
+    english_to_katakana,
+    remove_tts_unsafe_chars,
+    sanitize_for_tts,
+)
+
+
+def legacy_remove_unsafe(text: str) -> str:
+    """re.sub と .replace を順に重ねていた旧 remove_tts_unsafe_chars（比較用）。"""
+    text = re.sub(r"```[\s\S]*?```", "", text)
+    text = text.replace("`", "")
+    text = re.sub(r"^#{1,6}\s*", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\*+", "", text)
+    text = text.replace("！", "").replace("!", "")
+    text = text.replace("？", "").replace("?", "")
+    text = "".join(c for c in text if unicodedata.category(c) not in ("So", "Sk"))
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    return text.strip()
+
+
+def legacy_sanitize(text: str) -> str:
+    """旧 sanitize_for_tts（比較用）。"""
+    if not text:
+        return ""
+    text = legacy_remove_unsafe(text)
+    text = english_to_katakana(text)
+    text = re.sub(r"(?<![0-9])\.(?![0-9])", "", text)
+    text = re.sub(r"。(?!\n)", "。\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def make_script(size_bytes: int) -> str:
+    """見出し・太字・コードブロック・絵文字を含む台本を作る。"""
+    block = (
+        "# 今日のテックニュース 🎉\n\n"
+        "**Next.js** 15 がリリースされました！バージョン3.14です。"
+        "ReactとTypeScriptの対応も強化されています。\n\n\n\n"
+        "```ts\nconst answer = 42;\n```\n"
+        "`npm install` で入れられます。どう思いますか？ ✨\n"
+        "それでは次の話題です。。Thank you for listening...\n\n"
+    )
+    count = max(1, size_bytes // len(block.encode()))
+    return block * count
+
+
+def timed(fn, text: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = fn(text)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    kilobytes = float(sys.argv[1]) if len(sys.argv) > 1 else 500
+    text = make_script(int(kilobytes * 1024))
+    print(f"input: {len(text.encode()) / 1024:.0f} KB, {len(text):,} chars")
+
+    # alkana の辞書読み込みを計測から外す
+    sanitize_for_tts("warm up")
+
+    stages = [
+        ("remove_tts_unsafe_chars", legacy_remove_unsafe, remove_tts_unsafe_chars),
+        ("sanitize_for_tts", legacy_sanitize, sanitize_for_tts),
+    ]
+    for name, legacy, current in stages:
+        legacy_time, legacy_out = timed(legacy, text)
+        new_time, new_out = timed(current, text)
+        status = "OK" if new_out == legacy_out else "MISMATCH"
+        print(
+            f"{name}: legacy {legacy_time:.3f}s, current {new_time:.3f}s "
+            f"({legacy_time / new_time:.1f}x), output {status}"
+        )
+        if status != "OK":
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
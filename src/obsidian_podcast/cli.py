@@ -4,7 +4,13 @@ from pathlib import Path
 
 import typer
 
-from obsidian_podcast.config import generate_default_config, get_config_dir
+from obsidian_podcast.config import (
+    generate_default_config,
+    get_config_dir,
+    get_data_dir,
+)
+from obsidian_podcast.db.state import StateDB
+from obsidian_podcast.metrics import METRICS_FORMATS, MetricsCollector
 
 app = typer.Typer(
     name="obsidian-podcast",
@@ -32,10 +38,47 @@ def run(
     config: Path | None = typer.Option(
         None, "--config", help="Path to configuration file"
     ),
+    metrics_out: Path | None = typer.Option(
+        None, "--metrics-out", help="Write run metrics to this file"
+    ),
+    metrics_format: str = typer.Option(
+        "jsonl", "--metrics-format", help="Metrics file format: jsonl or prometheus"
+    ),
+    llm_cache: bool = typer.Option(
+        True, "--llm-cache/--no-llm-cache", help="Reuse cached LLM responses"
+    ),
 ) -> None:
     """Run the podcast pipeline (stub)."""
+    if metrics_format not in METRICS_FORMATS:
+        msg = f"must be one of {', '.join(METRICS_FORMATS)}"
+        raise typer.BadParameter(msg, param_hint="--metrics-format")
     if config:
         typer.echo(f"Using config: {config}")
     if feed:
         typer.echo(f"Processing feed: {feed}")
+    if not llm_cache:
+        typer.echo("LLM response cache disabled")
+    metrics = MetricsCollector()
     typer.echo("Pipeline execution (stub) - not yet implemented")
+    typer.echo(metrics.format_table())
+    if metrics_out:
+        metrics.write(metrics_out, metrics_format)
+
+
+@app.command("list")
+def list_articles(
+    status: str | None = typer.Option(
+        None, "--status", help="Only list articles with this status"
+    ),
+    db: Path | None = typer.Option(None, "--db", help="Path to state database"),
+) -> None:
+    """List tracked articles."""
+    db_path = db or get_data_dir() / "state.db"
+    if not db_path.exists():
+        typer.echo(f"State database not found: {db_path}")
+        raise typer.Exit(code=1)
+
+    with StateDB(db_path) as state:
+        state.initialize()
+        for row in state.iter_articles(status=status):
+            typer.echo(f"{row['id']}\t{row['status']}\t{row['url']}")
@@ -19,12 +19,49 @@ class FeedConfigModel(BaseModel):
     type: str = "article"
 
 
+class FetchConfig(BaseModel):
+    """Concurrent feed fetching configuration."""
+
+    max_concurrency: int = 16
+    per_host_limit: int = 4
+    retries: int = 2
+    backoff_base: float = 0.5
+    timeout: float = 30.0
+
+
 class TTSConfig(BaseModel):
     """TTS engine configuration."""
 
     engine: str = "edge-tts"
     language_detection: bool = True
     code_block_handling: str = "skip"
+    # Extra readings for English words in scripts, e.g. {"Hono": "ホノ"}.
+    # terms_path may point to a YAML file with more; inline terms win.
+    terms: dict[str, str] = Field(default_factory=dict)
+    terms_path: str = ""
+
+    def load_terms(self) -> dict[str, str]:
+        """Return the configured term dictionary (terms_path, then terms)."""
+        loaded: dict[str, str] = {}
+        if self.terms_path:
+            path = Path(self.terms_path).expanduser()
+            if not path.exists():
+                msg = f"Term dictionary not found: {path}"
+                raise FileNotFoundError(msg)
+            with open(path) as f:
+                data = yaml.safe_load(f) or {}
+            loaded.update({str(k): str(v) for k, v in data.items()})
+        loaded.update(self.terms)
+        return loaded
+
+
+class PreprocessConfig(BaseModel):
+    """Process-pool configuration for extraction and preprocessing."""
+
+    # Worker processes; 0 uses every CPU available to this process.
+    workers: int = 0
+    # Articles sent to a worker at once.
+    batch_size: int = 8
 
 
 class StorageConfig(BaseModel):
@@ -60,13 +97,37 @@ class LLMConfig(BaseModel):
     api_key_env: str = ""
     base_url: str | None = None
     max_chunk_chars: int = 4000
+    # Token budget per chunk; replaces max_chunk_chars when set. Tokens are
+    # counted with tiktoken for models it knows, else approximated. Unset by
+    # default, as the right budget depends on the model and the language.
+    # Keep it below the provider's max output tokens, since a script is about
+    # as long as its source chunk.
+    max_chunk_tokens: int | None = None
+    max_concurrency: int = 4
+    # Floor for the adaptive (AIMD) concurrency limit under rate limiting.
+    min_concurrency: int = 1
+    timeout: float = 120.0
+    max_connections: int = 16
+    max_keepalive_connections: int = 8
+    max_retries: int = 3
+    retry_backoff_base: float = 1.0
+    retry_max_delay: float = 60.0
+    # Mark the system prompt cacheable (Anthropic prompt caching). Only takes
+    # effect for prompts of at least 1024 tokens (2048 on Haiku); the default
+    # prompt is shorter, so it is not cached.
+    prompt_cache: bool = True
+    cache_enabled: bool = True
+    cache_path: str = ""
+    cache_max_mb: int = 512
 
 
 class AppConfig(BaseModel):
     """Root application configuration."""
 
     feeds: list[FeedConfigModel] = Field(default_factory=list)
+    fetch: FetchConfig = Field(default_factory=FetchConfig)
     tts: TTSConfig = Field(default_factory=TTSConfig)
+    preprocess: PreprocessConfig = Field(default_factory=PreprocessConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
     obsidian: ObsidianConfig = Field(default_factory=ObsidianConfig)
     summary: SummaryConfig = Field(default_factory=SummaryConfig)
@@ -93,6 +154,16 @@ def get_config_dir() -> Path:
     return base / APP_NAME
 
 
+def get_data_dir() -> Path:
+    """Get the XDG-compliant data directory (state database, caches)."""
+    xdg_data = os.environ.get("XDG_DATA_HOME")
+    if xdg_data:
+        base = Path(xdg_data)
+    else:
+        base = Path.home() / ".local" / "share"
+    return base / APP_NAME
+
+
 def generate_default_config(path: Path) -> None:
     """Generate a default configuration YAML file."""
     config = AppConfig()
@@ -0,0 +1,13 @@
+"""Fixtures shared across the package's tests."""
+
+import pytest
+
+
+@pytest.fixture
+def state_db(tmp_path):
+    from obsidian_podcast.db.state import StateDB
+
+    db = StateDB(tmp_path / "state.db")
+    db.initialize()
+    yield db
+    db.close()
@@ -0,0 +1,126 @@
+"""Versioned schema migrations for the state database.
+
+The applied version is stored in `PRAGMA user_version`. MIGRATIONS[n - 1]
+holds the statements that upgrade a database from version n - 1 to n;
+append new entries, never edit released ones. Versions 1-3 use IF NOT EXISTS
+so databases created before versioning was introduced are adopted in place.
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+CREATE_ARTICLES_TABLE = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT UNIQUE NOT NULL,
+    feed_url TEXT NOT NULL,
+    title TEXT,
+    author TEXT,
+    published_at TIMESTAMP,
+    status TEXT NOT NULL DEFAULT 'pending',
+    audio_url TEXT,
+    error_message TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    processed_at TIMESTAMP
+)
+"""
+
+CREATE_FEED_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS feed_state (
+    feed_url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+CREATE_ARTICLE_INDEXES = (
+    """CREATE INDEX IF NOT EXISTS idx_articles_created
+       ON articles (created_at, id)""",
+    """CREATE INDEX IF NOT EXISTS idx_articles_status_created
+       ON articles (status, created_at, id)""",
+    """CREATE INDEX IF NOT EXISTS idx_articles_feed_published
+       ON articles (feed_url, published_at)""",
+)
+
+ADD_JOB_LEASES = (
+    "ALTER TABLE articles ADD COLUMN lease_owner TEXT",
+    "ALTER TABLE articles ADD COLUMN lease_expires_at REAL",
+    "ALTER TABLE articles ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0",
+    """CREATE INDEX idx_articles_status_lease
+       ON articles (status, lease_expires_at)""",
+)
+
+ADD_LLM_BATCHES = (
+    "ALTER TABLE articles ADD COLUMN script TEXT",
+    """CREATE TABLE llm_batches (
+           id TEXT PRIMARY KEY,
+           engine TEXT NOT NULL,
+           status TEXT NOT NULL DEFAULT 'submitted',
+           error_message TEXT,
+           submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+           completed_at TIMESTAMP
+       )""",
+    """CREATE TABLE llm_batch_items (
+           batch_id TEXT NOT NULL REFERENCES llm_batches (id),
+           custom_id TEXT NOT NULL,
+           article_id INTEGER NOT NULL REFERENCES articles (id),
+           chunk_index INTEGER NOT NULL,
+           source TEXT NOT NULL,
+           result TEXT,
+           error_message TEXT,
+           PRIMARY KEY (batch_id, custom_id)
+       )""",
+    """CREATE INDEX idx_llm_batches_status
+       ON llm_batches (status, engine)""",
+)
+
+MIGRATIONS: tuple[tuple[str, ...], ...] = (
+    # 1: articles table
+    (CREATE_ARTICLES_TABLE,),
+    # 2: conditional GET state per feed
+    (CREATE_FEED_STATE_TABLE,),
+    # 3: listing indexes
+    CREATE_ARTICLE_INDEXES,
+    # 4: job queue leases
+    ADD_JOB_LEASES,
+    # 5: offline LLM batches and generated scripts
+    ADD_LLM_BATCHES,
+)
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in the database file."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations and return the resulting schema version.
+
+    A current database costs a single PRAGMA read. Otherwise all pending
+    migrations run in one IMMEDIATE transaction, and the version is
+    re-read under the write lock so concurrent processes starting at the
+    same time apply each migration exactly once.
+    """
+    version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        return version
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = get_schema_version(conn)
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            logger.info("Applying state database migration %d", target)
+            for statement in MIGRATIONS[target - 1]:
+                conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {max(version, SCHEMA_VERSION)}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return max(version, SCHEMA_VERSION)
@@ -1,40 +1,127 @@
 """SQLite state management for article processing."""
 
+import os
 import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
 
-CREATE_ARTICLES_TABLE = """
-CREATE TABLE IF NOT EXISTS articles (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    url TEXT UNIQUE NOT NULL,
-    feed_url TEXT NOT NULL,
-    title TEXT,
-    author TEXT,
-    published_at TIMESTAMP,
-    status TEXT NOT NULL DEFAULT 'pending',
-    audio_url TEXT,
-    error_message TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    processed_at TIMESTAMP
+from obsidian_podcast.db.migrations import migrate
+from obsidian_podcast.models import Article
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older SQLite builds).
+MAX_QUERY_PARAMS = 500
+
+# Seconds a writer waits for a lock held by another connection.
+BUSY_TIMEOUT = 30.0
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA temp_store=MEMORY",
 )
+
+INSERT_ARTICLE = """
+INSERT INTO articles (url, feed_url, title, author, published_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+INSERT_ARTICLE_OR_IGNORE = """
+INSERT OR IGNORE INTO articles (url, feed_url, title, author, published_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+UPDATE_STATUS = """
+UPDATE articles
+SET status = ?, audio_url = ?, error_message = ?,
+    lease_owner = NULL, lease_expires_at = NULL,
+    processed_at = CASE WHEN ? IN ('completed', 'failed')
+                        THEN CURRENT_TIMESTAMP ELSE processed_at END
+WHERE id = ?
 """
 
 
 class StateDB:
-    """SQLite-based state management for article processing."""
+    """SQLite-based state management for article processing.
+
+    Connections are long-lived and owned by one thread each: every thread
+    (and every forked process) lazily opens its own WAL-mode connection and
+    reuses it for all later calls. Methods never await, so asyncio tasks on
+    the same event loop thread can safely share that thread's connection;
+    worker threads (e.g. via asyncio.to_thread) get their own. WAL lets
+    readers proceed while one writer commits; concurrent writers wait up to
+    BUSY_TIMEOUT seconds for the lock.
+    """
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._schema_current = False
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        if self._pid != os.getpid():
+            # Never reuse connections inherited across fork().
+            self._local = threading.local()
+            self._connections = []
+            self._pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
         return conn
 
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in a BEGIN IMMEDIATE transaction.
+
+        Takes the database write lock up front, so read-then-write sequences
+        cannot interleave with other connections or processes.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def close(self) -> None:
+        """Close every connection opened by this instance.
+
+        Call once no other thread is using the database.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self) -> "StateDB":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def initialize(self) -> None:
-        """Create the database schema."""
-        with self._connect() as conn:
-            conn.execute(CREATE_ARTICLES_TABLE)
+        """Create or upgrade the database schema to SCHEMA_VERSION."""
+        if self._schema_current:
+            return
+        migrate(self._connect())
+        self._schema_current = True
 
     def add_article(
         self,
@@ -47,12 +134,43 @@ class StateDB:
         """Add an article and return its id."""
         with self._connect() as conn:
             cursor = conn.execute(
-                """INSERT INTO articles (url, feed_url, title, author, published_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (url, feed_url, title, author, published_at),
+                INSERT_ARTICLE, (url, feed_url, title, author, published_at)
             )
             return cursor.lastrowid  # type: ignore[return-value]
 
+    def add_articles_bulk(self, articles: Iterable[Article]) -> list[int]:
+        """Insert many articles in one transaction and return their ids.
+
+        Uses INSERT OR IGNORE, so URLs that already exist are left untouched.
+        The returned ids line up with the input order; a URL that was already
+        present maps to the id of the existing row.
+        """
+        rows = [
+            (
+                a.url,
+                a.feed_url,
+                a.title,
+                a.author,
+                a.published_at.isoformat() if a.published_at else None,
+            )
+            for a in articles
+        ]
+        if not rows:
+            return []
+        urls = list(dict.fromkeys(row[0] for row in rows))
+        ids: dict[str, int] = {}
+        with self._connect() as conn:
+            conn.executemany(INSERT_ARTICLE_OR_IGNORE, rows)
+            for start in range(0, len(urls), MAX_QUERY_PARAMS):
+                batch = urls[start : start + MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT id, url FROM articles WHERE url IN ({placeholders})",
+                    batch,
+                )
+                ids.update((row["url"], row["id"]) for row in cursor)
+        return [ids[row[0]] for row in rows]
+
     def get_article_by_url(self, url: str) -> dict | None:
         """Get an article by its URL."""
         with self._connect() as conn:
@@ -62,6 +180,27 @@ class StateDB:
                 return None
             return dict(row)
 
+    def get_known_urls(self, urls: Iterable[str]) -> set[str]:
+        """Return the subset of urls that already exist in the database.
+
+        Looks up the batch with `WHERE url IN (...)` against the unique url
+        index, MAX_QUERY_PARAMS urls per query, on a single connection.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        known: set[str] = set()
+        if not unique_urls:
+            return known
+        with self._connect() as conn:
+            for start in range(0, len(unique_urls), MAX_QUERY_PARAMS):
+                batch = unique_urls[start : start + MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT url FROM articles WHERE url IN ({placeholders})",
+                    batch,
+                )
+                known.update(row[0] for row in cursor)
+        return known
+
     def update_status(
         self,
         article_id: int,
@@ -72,24 +211,373 @@ class StateDB:
         """Update the status of an article."""
         with self._connect() as conn:
             conn.execute(
-                """UPDATE articles
-                   SET status = ?, audio_url = ?, error_message = ?,
-                       processed_at = CASE WHEN ? IN ('completed', 'failed')
-                                           THEN CURRENT_TIMESTAMP ELSE processed_at END
-                   WHERE id = ?""",
+                UPDATE_STATUS,
                 (status, audio_url, error_message, status, article_id),
             )
 
+    def update_status_bulk(
+        self,
+        updates: Iterable[tuple[int, str, str | None, str | None]],
+    ) -> None:
+        """Apply many status updates in one transaction.
+
+        Each update is an (article_id, status, audio_url, error_message)
+        tuple with the same meaning as the update_status arguments.
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                UPDATE_STATUS,
+                (
+                    (status, audio_url, error_message, status, article_id)
+                    for article_id, status, audio_url, error_message in updates
+                ),
+            )
+
     def list_articles(self, status: str | None = None) -> list[dict]:
         """List articles, optionally filtered by status."""
+        return list(self.iter_articles(status=status))
+
+    def iter_articles(
+        self, status: str | None = None, page_size: int = 500
+    ) -> Iterator[dict]:
+        """Yield articles in creation order, optionally filtered by status.
+
+        Pages through the table with keyset pagination on (created_at, id),
+        so each page is an index range scan and at most page_size rows are
+        held in memory at a time.
+        """
+        where = "WHERE status = ?" if status else ""
+        keyset = "AND" if status else "WHERE"
+        first_page = f"SELECT * FROM articles {where} ORDER BY created_at, id LIMIT ?"
+        next_page = (
+            f"SELECT * FROM articles {where} {keyset} (created_at, id) > (?, ?) "
+            "ORDER BY created_at, id LIMIT ?"
+        )
+        params: tuple = (status,) if status else ()
+        conn = self._connect()
+        rows = conn.execute(first_page, (*params, page_size)).fetchall()
+        while rows:
+            yield from (dict(row) for row in rows)
+            if len(rows) < page_size:
+                return
+            last = rows[-1]
+            rows = conn.execute(
+                next_page, (*params, last["created_at"], last["id"], page_size)
+            ).fetchall()
+
+    def claim_articles(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        now: float | None = None,
+    ) -> list[dict]:
+        """Atomically claim up to limit pending articles for a worker.
+
+        Expired leases are returned to the queue first (see requeue_expired).
+        Claimed rows move to 'processing' with a lease owned by worker_id that
+        expires after lease_seconds unless extended with heartbeat(). Safe to
+        call from several processes sharing the same database file.
+        """
+        now = time.time() if now is None else now
+        with self._write_transaction() as conn:
+            self._requeue_expired(conn, max_attempts, now)
+            rows = conn.execute(
+                """UPDATE articles
+                   SET status = 'processing', lease_owner = ?,
+                       lease_expires_at = ?, attempts = attempts + 1
+                   WHERE id IN (
+                       SELECT id FROM articles WHERE status = 'pending'
+                       ORDER BY created_at, id LIMIT ?
+                   )
+                   RETURNING *""",
+                (worker_id, now + lease_seconds, limit),
+            ).fetchall()
+        claimed = [dict(row) for row in rows]
+        claimed.sort(key=lambda row: (row["created_at"], row["id"]))
+        return claimed
+
+    def heartbeat(
+        self,
+        worker_id: str,
+        article_ids: Iterable[int],
+        lease_seconds: float = 300.0,
+        now: float | None = None,
+    ) -> int:
+        """Extend the leases worker_id still holds; return how many were extended.
+
+        A count lower than the number of ids means some leases were lost
+        (expired and reclaimed), and the worker should drop those articles.
+        """
+        now = time.time() if now is None else now
         with self._connect() as conn:
-            if status:
-                cursor = conn.execute(
-                    "SELECT * FROM articles WHERE status = ? ORDER BY created_at",
-                    (status,),
-                )
-            else:
-                cursor = conn.execute(
-                    "SELECT * FROM articles ORDER BY created_at"
-                )
-            return [dict(row) for row in cursor.fetchall()]
+            cursor = conn.executemany(
+                """UPDATE articles SET lease_expires_at = ?
+                   WHERE id = ? AND lease_owner = ? AND status = 'processing'""",
+                (
+                    (now + lease_seconds, article_id, worker_id)
+                    for article_id in article_ids
+                ),
+            )
+            return cursor.rowcount
+
+    def requeue_expired(
+        self, max_attempts: int = 3, now: float | None = None
+    ) -> int:
+        """Return articles with expired leases to the queue.
+
+        Articles that already used max_attempts claims are marked failed
+        instead. Returns the number of articles affected.
+        """
+        now = time.time() if now is None else now
+        with self._write_transaction() as conn:
+            return self._requeue_expired(conn, max_attempts, now)
+
+    @staticmethod
+    def _requeue_expired(
+        conn: sqlite3.Connection, max_attempts: int, now: float
+    ) -> int:
+        failed = conn.execute(
+            """UPDATE articles
+               SET status = 'failed', lease_owner = NULL, lease_expires_at = NULL,
+                   error_message = 'lease expired after ' || attempts || ' attempts',
+                   processed_at = CURRENT_TIMESTAMP
+               WHERE status = 'processing' AND lease_expires_at < ?
+                 AND attempts >= ?""",
+            (now, max_attempts),
+        ).rowcount
+        requeued = conn.execute(
+            """UPDATE articles
+               SET status = 'pending', lease_owner = NULL, lease_expires_at = NULL
+               WHERE status = 'processing' AND lease_expires_at < ?""",
+            (now,),
+        ).rowcount
+        return failed + requeued
+
+    def lease_articles(
+        self,
+        owner: str,
+        article_ids: Iterable[int],
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        now: float | None = None,
+    ) -> list[int]:
+        """Atomically lease the given articles to owner; return the leased ids.
+
+        Like claim_articles, but for specific articles: expired leases are
+        returned to the queue first, then only those of article_ids that are
+        'pending' are leased. Articles another worker or batch holds, or that
+        are already done, are skipped.
+        """
+        now = time.time() if now is None else now
+        unique_ids = list(dict.fromkeys(article_ids))
+        leased: list[int] = []
+        with self._write_transaction() as conn:
+            self._requeue_expired(conn, max_attempts, now)
+            for start in range(0, len(unique_ids), MAX_QUERY_PARAMS):
+                batch = unique_ids[start : start + MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(batch))
+                rows = conn.execute(
+                    f"""UPDATE articles
+                        SET status = 'processing', lease_owner = ?,
+                            lease_expires_at = ?, attempts = attempts + 1
+                        WHERE status = 'pending' AND id IN ({placeholders})
+                        RETURNING id""",
+                    (owner, now + lease_seconds, *batch),
+                ).fetchall()
+                leased.extend(row[0] for row in rows)
+        return sorted(leased)
+
+    def release_articles(self, owner: str) -> int:
+        """Return every article leased to owner to 'pending', unused.
+
+        For a lease that was never acted on (e.g. a batch submission that
+        failed), so the claim does not count towards max_attempts.
+        """
+        with self._write_transaction() as conn:
+            return conn.execute(
+                """UPDATE articles
+                   SET status = 'pending', lease_owner = NULL,
+                       lease_expires_at = NULL, attempts = MAX(attempts - 1, 0)
+                   WHERE status = 'processing' AND lease_owner = ?""",
+                (owner,),
+            ).rowcount
+
+    def record_llm_batch(
+        self,
+        batch_id: str,
+        engine: str,
+        items: Iterable[tuple[str, int, int, str]],
+        lease_seconds: float,
+        claimed_by: str,
+        now: float | None = None,
+    ) -> None:
+        """Record a submitted LLM batch and hand its articles' leases to it.
+
+        Each item is a (custom_id, article_id, chunk_index, source) tuple.
+        The articles must be leased to claimed_by (see lease_articles); their
+        leases move to "batch:<batch_id>" for lease_seconds, so workers and
+        later submissions skip them until the batch is collected or the
+        lease expires.
+        """
+        now = time.time() if now is None else now
+        items = list(items)
+        article_ids = sorted({item[1] for item in items})
+        with self._write_transaction() as conn:
+            conn.execute(
+                "INSERT INTO llm_batches (id, engine) VALUES (?, ?)",
+                (batch_id, engine),
+            )
+            conn.executemany(
+                """INSERT INTO llm_batch_items
+                       (batch_id, custom_id, article_id, chunk_index, source)
+                   VALUES (?, ?, ?, ?, ?)""",
+                ((batch_id, *item) for item in items),
+            )
+            conn.executemany(
+                """UPDATE articles SET lease_owner = ?, lease_expires_at = ?
+                   WHERE id = ? AND lease_owner = ? AND status = 'processing'""",
+                (
+                    (f"batch:{batch_id}", now + lease_seconds, article_id, claimed_by)
+                    for article_id in article_ids
+                ),
+            )
+
+    def list_llm_batches(
+        self, engine: str | None = None, status: str = "submitted"
+    ) -> list[dict]:
+        """List LLM batches with the given status, oldest first."""
+        query = "SELECT * FROM llm_batches WHERE status = ?"
+        params: tuple = (status,)
+        if engine:
+            query += " AND engine = ?"
+            params += (engine,)
+        with self._connect() as conn:
+            rows = conn.execute(f"{query} ORDER BY submitted_at, id", params)
+            return [dict(row) for row in rows]
+
+    def get_llm_batch_items(self, batch_id: str) -> list[dict]:
+        """Return a batch's items ordered by article and chunk."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT * FROM llm_batch_items WHERE batch_id = ?
+                   ORDER BY article_id, chunk_index""",
+                (batch_id,),
+            )
+            return [dict(row) for row in rows]
+
+    def complete_llm_batch(
+        self,
+        batch_id: str,
+        results: Iterable[tuple[str, str | None, str | None]],
+        scripts: Mapping[int, str],
+        requeue: Iterable[int] = (),
+        max_attempts: int = 3,
+    ) -> None:
+        """Store a finished batch's results and its articles' scripts.
+
+        results holds (custom_id, text, error_message) per item; scripts
+        maps article ids to their assembled script. Articles still leased
+        to the batch move to 'scripted', except those in requeue (no usable
+        output), which return to 'pending', or become 'failed' once they
+        have used max_attempts leases.
+        """
+        with self._write_transaction() as conn:
+            conn.executemany(
+                """UPDATE llm_batch_items SET result = ?, error_message = ?
+                   WHERE batch_id = ? AND custom_id = ?""",
+                (
+                    (text, error, batch_id, custom_id)
+                    for custom_id, text, error in results
+                ),
+            )
+            conn.executemany(
+                """UPDATE articles
+                   SET script = ?, status = 'scripted',
+                       lease_owner = NULL, lease_expires_at = NULL
+                   WHERE id = ? AND lease_owner = ?""",
+                (
+                    (script, article_id, f"batch:{batch_id}")
+                    for article_id, script in scripts.items()
+                ),
+            )
+            conn.executemany(
+                """UPDATE articles
+                   SET status = CASE WHEN attempts >= ? THEN 'failed'
+                                     ELSE 'pending' END,
+                       error_message = 'no output from LLM batch ' || ?,
+                       lease_owner = NULL, lease_expires_at = NULL
+                   WHERE id = ? AND lease_owner = ?""",
+                (
+                    (max_attempts, batch_id, article_id, f"batch:{batch_id}")
+                    for article_id in requeue
+                ),
+            )
+            conn.execute(
+                """UPDATE llm_batches
+                   SET status = 'completed', completed_at = CURRENT_TIMESTAMP
+                   WHERE id = ?""",
+                (batch_id,),
+            )
+
+    def save_script(self, article_id: int, script: str) -> None:
+        """Store an article's podcast script and mark it 'scripted'."""
+        with self._connect() as conn:
+            conn.execute(
+                """UPDATE articles
+                   SET script = ?, status = 'scripted',
+                       lease_owner = NULL, lease_expires_at = NULL
+                   WHERE id = ?""",
+                (script, article_id),
+            )
+
+    def fail_llm_batch(self, batch_id: str, error_message: str) -> None:
+        """Mark a batch failed and return its leased articles to 'pending'."""
+        with self._write_transaction() as conn:
+            conn.execute(
+                """UPDATE articles
+                   SET status = 'pending', lease_owner = NULL,
+                       lease_expires_at = NULL
+                   WHERE status = 'processing' AND lease_owner = ?""",
+                (f"batch:{batch_id}",),
+            )
+            conn.execute(
+                """UPDATE llm_batches
+                   SET status = 'failed', error_message = ?,
+                       completed_at = CURRENT_TIMESTAMP
+                   WHERE id = ?""",
+                (error_message, batch_id),
+            )
+
+    def get_feed_state(self, feed_url: str) -> dict | None:
+        """Get the stored HTTP validators and content hash for a feed."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM feed_state WHERE feed_url = ?", (feed_url,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return dict(row)
+
+    def save_feed_state(
+        self,
+        feed_url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_hash: str | None = None,
+    ) -> None:
+        """Store the HTTP validators and content hash for a feed."""
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT INTO feed_state
+                       (feed_url, etag, last_modified, content_hash, checked_at)
+                   VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT(feed_url) DO UPDATE SET
+                       etag = excluded.etag,
+                       last_modified = excluded.last_modified,
+                       content_hash = excluded.content_hash,
+                       checked_at = excluded.checked_at""",
+                (feed_url, etag, last_modified, content_hash),
+            )
@@ -0,0 +1,86 @@
+"""Tests for state database schema migrations."""
+
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "state.db")
+    yield conn
+    conn.close()
+
+
+class TestMigrate:
+    def test_fresh_database_reaches_latest_version(self, conn):
+        from obsidian_podcast.db.migrations import (
+            SCHEMA_VERSION,
+            get_schema_version,
+            migrate,
+        )
+
+        assert migrate(conn) == SCHEMA_VERSION
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        tables = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        assert {"articles", "feed_state"} <= tables
+
+    def test_current_database_is_not_touched(self, conn, monkeypatch):
+        from obsidian_podcast.db import migrations
+
+        migrations.migrate(conn)
+        monkeypatch.setattr(
+            migrations, "MIGRATIONS", (("SELECT RAISE(ABORT, 'ran')",),)
+        )
+        assert migrations.migrate(conn) == migrations.SCHEMA_VERSION
+
+    def test_adopts_unversioned_database(self, conn):
+        from obsidian_podcast.db.migrations import (
+            CREATE_ARTICLES_TABLE,
+            SCHEMA_VERSION,
+            get_schema_version,
+            migrate,
+        )
+
+        conn.execute(CREATE_ARTICLES_TABLE)
+        conn.execute("INSERT INTO articles (url, feed_url) VALUES ('u', 'f')")
+        conn.commit()
+
+        migrate(conn)
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        assert conn.execute("SELECT count(*) FROM articles").fetchone()[0] == 1
+
+    def test_applies_only_pending_migrations(self, conn, monkeypatch):
+        from obsidian_podcast.db import migrations
+
+        migrations.migrate(conn)
+        new = migrations.MIGRATIONS + (("CREATE TABLE extra (id INTEGER)",),)
+        monkeypatch.setattr(migrations, "MIGRATIONS", new)
+        monkeypatch.setattr(migrations, "SCHEMA_VERSION", len(new))
+
+        assert migrations.migrate(conn) == len(new)
+        assert conn.execute("SELECT count(*) FROM extra").fetchone()[0] == 0
+
+    def test_failed_migration_rolls_back(self, conn, monkeypatch):
+        from obsidian_podcast.db import migrations
+
+        migrations.migrate(conn)
+        version = migrations.SCHEMA_VERSION
+        new = migrations.MIGRATIONS + (
+            ("CREATE TABLE extra (id INTEGER)", "not valid sql"),
+        )
+        monkeypatch.setattr(migrations, "MIGRATIONS", new)
+        monkeypatch.setattr(migrations, "SCHEMA_VERSION", len(new))
+
+        with pytest.raises(sqlite3.OperationalError):
+            migrations.migrate(conn)
+        assert migrations.get_schema_version(conn) == version
+        assert (
+            conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'extra'"
+            ).fetchone()
+            is None
+        )
@@ -4,16 +4,6 @@
 import pytest
 
 
-@pytest.fixture
-def state_db(tmp_path):
-    from obsidian_podcast.db.state import StateDB
-
-    db_path = tmp_path / "state.db"
-    db = StateDB(db_path)
-    db.initialize()
-    return db
-
-
 class TestStateDB:
     def test_initialize_creates_table(self, state_db):
         """initialize() should create the articles table."""
@@ -26,6 +16,19 @@ class TestStateDB:
         assert cursor.fetchone() is not None
         conn.close()
 
+    def test_initialize_records_schema_version(self, state_db):
+        from obsidian_podcast.db.migrations import SCHEMA_VERSION
+
+        conn = state_db._connect()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    def test_initialize_skips_check_when_current(self, state_db, monkeypatch):
+        def fail(conn):
+            raise AssertionError("migrate should not run")
+
+        monkeypatch.setattr("obsidian_podcast.db.state.migrate", fail)
+        state_db.initialize()
+
     def test_add_article(self, state_db):
         """Should insert an article and return its id."""
         article_id = state_db.add_article(
@@ -128,3 +131,399 @@ class TestStateDB:
         )
         articles = state_db.list_articles()
         assert len(articles) == 2
+
+
+class TestConnections:
+    def test_reuses_connection_within_thread(self, state_db):
+        assert state_db._connect() is state_db._connect()
+
+    def test_separate_connection_per_thread(self, state_db):
+        import threading
+
+        main_conn = state_db._connect()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(state_db._connect()))
+        thread.start()
+        thread.join()
+        assert other[0] is not main_conn
+
+    def test_wal_and_pragmas_enabled(self, state_db):
+        conn = state_db._connect()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_concurrent_writers_from_threads(self, state_db):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def add(i):
+            return state_db.add_article(
+                url=f"https://example.com/{i}",
+                feed_url="https://example.com/feed.xml",
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = list(pool.map(add, range(200)))
+
+        assert len(set(ids)) == 200
+        assert len(state_db.list_articles()) == 200
+
+    def test_close_and_reopen(self, tmp_path):
+        from obsidian_podcast.db.state import StateDB
+
+        with StateDB(tmp_path / "state.db") as db:
+            db.initialize()
+            db.add_article(url="https://example.com/1", feed_url="f")
+        # Closed instances reconnect lazily on next use.
+        assert db.get_article_by_url("https://example.com/1") is not None
+        db.close()
+
+
+class TestIterArticles:
+    def test_pages_through_ties_in_order(self, state_db):
+        urls = [f"https://example.com/{i}" for i in range(7)]
+        for url in urls:
+            state_db.add_article(url=url, feed_url="https://example.com/feed.xml")
+
+        # All rows share a created_at second, so the id tiebreak matters.
+        result = [row["url"] for row in state_db.iter_articles(page_size=2)]
+        assert result == urls
+
+    def test_filters_by_status_across_pages(self, state_db):
+        ids = [
+            state_db.add_article(url=f"https://example.com/{i}", feed_url="f")
+            for i in range(6)
+        ]
+        for article_id in ids[::2]:
+            state_db.update_status(article_id, "failed")
+
+        failed = list(state_db.iter_articles(status="failed", page_size=2))
+        assert [row["id"] for row in failed] == ids[::2]
+
+    def test_status_listing_uses_index(self, state_db):
+        conn = state_db._connect()
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM articles WHERE status = ? "
+            "AND (created_at, id) > (?, ?) ORDER BY created_at, id LIMIT 10",
+            ("failed", "2024-01-01", 0),
+        ).fetchall()
+        detail = " ".join(row["detail"] for row in plan)
+        assert "idx_articles_status_created" in detail
+        assert "TEMP B-TREE" not in detail
+
+    def test_initialize_creates_indexes(self, state_db):
+        conn = state_db._connect()
+        names = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            )
+        }
+        assert {
+            "idx_articles_created",
+            "idx_articles_status_created",
+            "idx_articles_feed_published",
+        } <= names
+
+
+class TestGetKnownUrls:
+    def test_returns_existing_subset(self, state_db):
+        state_db.add_article(
+            url="https://example.com/1", feed_url="https://example.com/feed.xml"
+        )
+        known = state_db.get_known_urls(
+            ["https://example.com/1", "https://example.com/2"]
+        )
+        assert known == {"https://example.com/1"}
+
+    def test_empty_input(self, state_db):
+        assert state_db.get_known_urls([]) == set()
+
+    def test_batches_larger_than_param_limit(self, state_db):
+        from obsidian_podcast.db.state import MAX_QUERY_PARAMS
+
+        urls = [f"https://example.com/{i}" for i in range(MAX_QUERY_PARAMS * 2 + 7)]
+        for url in urls[::3]:
+            state_db.add_article(url=url, feed_url="https://example.com/feed.xml")
+
+        known = state_db.get_known_urls(urls)
+        assert known == set(urls[::3])
+
+
+class TestBulkOperations:
+    def test_add_articles_bulk_returns_ids_in_order(self, state_db):
+        from obsidian_podcast.models import Article
+
+        articles = [
+            Article(url=f"https://example.com/{i}", feed_url="f", title=f"T{i}")
+            for i in range(3)
+        ]
+        ids = state_db.add_articles_bulk(articles)
+
+        assert len(ids) == 3
+        for article, article_id in zip(articles, ids, strict=True):
+            row = state_db.get_article_by_url(article.url)
+            assert row["id"] == article_id
+            assert row["title"] == article.title
+
+    def test_add_articles_bulk_ignores_existing(self, state_db):
+        from obsidian_podcast.models import Article
+
+        existing_id = state_db.add_article(
+            url="https://example.com/1", feed_url="f", title="Original"
+        )
+        ids = state_db.add_articles_bulk(
+            [
+                Article(url="https://example.com/1", feed_url="f", title="New"),
+                Article(url="https://example.com/2", feed_url="f"),
+                Article(url="https://example.com/2", feed_url="f"),
+            ]
+        )
+
+        assert ids[0] == existing_id
+        assert ids[1] == ids[2]
+        assert state_db.get_article_by_url("https://example.com/1")["title"] == (
+            "Original"
+        )
+        assert len(state_db.list_articles()) == 2
+
+    def test_add_articles_bulk_empty(self, state_db):
+        assert state_db.add_articles_bulk([]) == []
+
+    def test_update_status_bulk(self, state_db):
+        from obsidian_podcast.models import Article
+
+        ids = state_db.add_articles_bulk(
+            [Article(url=f"https://example.com/{i}", feed_url="f") for i in range(3)]
+        )
+        state_db.update_status_bulk(
+            [
+                (ids[0], "completed", "https://cdn.example.com/0.mp3", None),
+                (ids[1], "failed", None, "TTS failed"),
+            ]
+        )
+
+        first = state_db.get_article_by_url("https://example.com/0")
+        second = state_db.get_article_by_url("https://example.com/1")
+        third = state_db.get_article_by_url("https://example.com/2")
+        assert first["status"] == "completed"
+        assert first["audio_url"] == "https://cdn.example.com/0.mp3"
+        assert first["processed_at"] is not None
+        assert second["status"] == "failed"
+        assert second["error_message"] == "TTS failed"
+        assert third["status"] == "pending"
+
+
+class TestJobQueue:
+    @staticmethod
+    def _add(state_db, n):
+        return [
+            state_db.add_article(url=f"https://example.com/{i}", feed_url="f")
+            for i in range(n)
+        ]
+
+    def test_claim_marks_processing_with_lease(self, state_db):
+        ids = self._add(state_db, 3)
+
+        claimed = state_db.claim_articles("w1", limit=2, lease_seconds=60, now=1000)
+
+        assert [row["id"] for row in claimed] == ids[:2]
+        for row in claimed:
+            assert row["status"] == "processing"
+            assert row["lease_owner"] == "w1"
+            assert row["lease_expires_at"] == 1060
+            assert row["attempts"] == 1
+        assert len(state_db.list_articles(status="pending")) == 1
+
+    def test_claim_returns_empty_when_queue_drained(self, state_db):
+        self._add(state_db, 1)
+        state_db.claim_articles("w1", limit=5, now=1000)
+        assert state_db.claim_articles("w2", limit=5, now=1001) == []
+
+    def test_expired_lease_is_reclaimed(self, state_db):
+        (article_id,) = self._add(state_db, 1)
+        state_db.claim_articles("crashed", lease_seconds=60, now=1000)
+
+        assert state_db.claim_articles("w2", now=1030) == []
+        reclaimed = state_db.claim_articles("w2", now=1061)
+        assert [row["id"] for row in reclaimed] == [article_id]
+        assert reclaimed[0]["lease_owner"] == "w2"
+        assert reclaimed[0]["attempts"] == 2
+
+    def test_heartbeat_extends_only_owned_leases(self, state_db):
+        ids = self._add(state_db, 2)
+        state_db.claim_articles("w1", limit=1, lease_seconds=60, now=1000)
+        state_db.claim_articles("w2", limit=1, lease_seconds=60, now=1000)
+
+        extended = state_db.heartbeat("w1", ids, lease_seconds=60, now=1050)
+
+        assert extended == 1
+        assert state_db.requeue_expired(now=1070) == 1
+        assert state_db.get_article_by_url("https://example.com/0")["status"] == (
+            "processing"
+        )
+        assert state_db.get_article_by_url("https://example.com/1")["status"] == (
+            "pending"
+        )
+
+    def test_requeue_fails_after_max_attempts(self, state_db):
+        self._add(state_db, 1)
+        for attempt in range(2):
+            state_db.claim_articles(
+                "w", lease_seconds=10, max_attempts=2, now=1000 + attempt * 100
+            )
+
+        assert state_db.requeue_expired(max_attempts=2, now=2000) == 1
+        article = state_db.get_article_by_url("https://example.com/0")
+        assert article["status"] == "failed"
+        assert "2 attempts" in article["error_message"]
+
+    def test_update_status_releases_lease(self, state_db):
+        (article_id,) = self._add(state_db, 1)
+        state_db.claim_articles("w1", now=1000)
+
+        state_db.update_status(article_id, "completed")
+
+        article = state_db.get_article_by_url("https://example.com/0")
+        assert article["lease_owner"] is None
+        assert state_db.requeue_expired(now=10**9) == 0
+
+    def test_concurrent_workers_never_share_articles(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from obsidian_podcast.db.state import StateDB
+
+        db_path = tmp_path / "queue.db"
+        with StateDB(db_path) as db:
+            db.initialize()
+            self._add(db, 100)
+
+        def worker(n):
+            # Separate StateDB instances behave like separate processes.
+            with StateDB(db_path) as db:
+                claimed = []
+                while batch := db.claim_articles(f"w{n}", limit=3):
+                    claimed.extend(row["id"] for row in batch)
+                return claimed
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(worker, range(4)))
+
+        all_ids = [article_id for ids in results for article_id in ids]
+        assert len(all_ids) == 100
+        assert len(set(all_ids)) == 100
+
+
+class TestLLMBatches:
+    @staticmethod
+    def _record(state_db, batch_id="b1"):
+        ids = [
+            state_db.add_article(url=f"https://example.com/{i}", feed_url="f")
+            for i in range(2)
+        ]
+        items = [
+            ("a0-0", ids[0], 0, "src 0-0"),
+            ("a0-1", ids[0], 1, "src 0-1"),
+            ("a1-0", ids[1], 0, "src 1-0"),
+        ]
+        assert state_db.lease_articles("submit", ids, 60, now=1000) == ids
+        state_db.record_llm_batch(
+            batch_id, "claude", items, 3600, claimed_by="submit", now=1000
+        )
+        return ids
+
+    def test_record_leases_articles_to_batch(self, state_db):
+        ids = self._record(state_db)
+
+        rows = state_db.list_articles(status="processing")
+        assert [row["id"] for row in rows] == ids
+        for row in rows:
+            assert row["lease_owner"] == "batch:b1"
+            assert row["lease_expires_at"] == 4600
+        assert [b["id"] for b in state_db.list_llm_batches("claude")] == ["b1"]
+        assert state_db.list_llm_batches("openai") == []
+        items = state_db.get_llm_batch_items("b1")
+        assert [item["custom_id"] for item in items] == ["a0-0", "a0-1", "a1-0"]
+        assert state_db.claim_articles("w1", now=1001) == []
+
+    def test_complete_stores_results_and_scripts(self, state_db):
+        ids = self._record(state_db)
+
+        state_db.complete_llm_batch(
+            "b1",
+            [("a0-0", "out", None), ("a0-1", None, "boom"), ("a1-0", "x", None)],
+            {ids[0]: "out\n\nsrc 0-1", ids[1]: "x"},
+        )
+
+        rows = state_db.list_articles(status="scripted")
+        assert [row["script"] for row in rows] == ["out\n\nsrc 0-1", "x"]
+        assert all(row["lease_owner"] is None for row in rows)
+        items = state_db.get_llm_batch_items("b1")
+        assert items[1]["error_message"] == "boom"
+        assert state_db.list_llm_batches() == []
+        assert state_db.list_llm_batches(status="completed")[0]["id"] == "b1"
+
+    def test_complete_requeues_articles_without_output(self, state_db):
+        ids = self._record(state_db)
+
+        state_db.complete_llm_batch(
+            "b1",
+            [("a0-0", "out", None), ("a0-1", "out", None), ("a1-0", None, "boom")],
+            {ids[0]: "out\n\nout"},
+            requeue=[ids[1]],
+        )
+
+        assert [row["id"] for row in state_db.list_articles("scripted")] == [ids[0]]
+        (row,) = state_db.list_articles(status="pending")
+        assert row["id"] == ids[1]
+        assert row["lease_owner"] is None
+
+    def test_lease_skips_articles_held_elsewhere(self, state_db):
+        ids = self._record(state_db)
+        third = state_db.add_article(url="https://example.com/3", feed_url="f")
+
+        leased = state_db.lease_articles("other", [*ids, third], 60, now=1001)
+
+        assert leased == [third]
+        rows = state_db.list_articles(status="processing")
+        assert {row["lease_owner"] for row in rows if row["id"] in ids} == {"batch:b1"}
+
+    def test_lease_takes_over_expired_leases(self, state_db):
+        ids = self._record(state_db)
+
+        assert state_db.lease_articles("other", ids, 60, now=5000) == ids
+
+    def test_release_returns_unused_lease(self, state_db):
+        article_id = state_db.add_article(url="https://example.com/x", feed_url="f")
+        state_db.lease_articles("submit", [article_id], 60)
+
+        assert state_db.release_articles("submit") == 1
+
+        (row,) = state_db.list_articles(status="pending")
+        assert row["attempts"] == 0
+        assert row["lease_owner"] is None
+
+    def test_fail_returns_articles_to_pending(self, state_db):
+        self._record(state_db)
+
+        state_db.fail_llm_batch("b1", "expired")
+
+        assert len(state_db.list_articles(status="pending")) == 2
+        (batch,) = state_db.list_llm_batches(status="failed")
+        assert batch["error_message"] == "expired"
+
+
+class TestFeedState:
+    def test_get_feed_state_not_found(self, state_db):
+        assert state_db.get_feed_state("https://example.com/feed.xml") is None
+
+    def test_save_and_update_feed_state(self, state_db):
+        feed_url = "https://example.com/feed.xml"
+        state_db.save_feed_state(
+            feed_url, etag='"a"', last_modified="Mon", content_hash="h1"
+        )
+        state_db.save_feed_state(feed_url, etag='"b"', content_hash="h2")
+
+        state = state_db.get_feed_state(feed_url)
+        assert state["etag"] == '"b"'
+        assert state["last_modified"] is None
+        assert state["content_hash"] == "h2"
@@ -1,23 +1,56 @@
 """RSS/Atom feed fetching and parsing."""
 
+import asyncio
+import hashlib
 import logging
+import random
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
 
 import feedparser
 import httpx
 
+from obsidian_podcast.config import FetchConfig
 from obsidian_podcast.db.state import StateDB
 from obsidian_podcast.models import Article
 
 logger = logging.getLogger(__name__)
 
+# Persists a feed's parsed articles before its validators are saved
+ArticleStore = Callable[[list[Article]], object]
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Longest Retry-After honored; the wait holds the host and global slots.
+MAX_RETRY_AFTER = 60.0
+
+
+@dataclass
+class FetchStats:
+    """Counters describing the outcome of feed fetches."""
+
+    fetched: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+    @property
+    def skipped(self) -> int:
+        """Feeds whose parse was skipped (HTTP 304 or identical body)."""
+        return self.not_modified + self.unchanged
+
 
 def parse_feed(xml_content: str, feed_url: str) -> list[Article]:
     """Parse RSS/Atom XML content and return Article objects.
 
-    Stores RSS description/content in Article.content for fallback use.
+    Stores RSS description/content in Article.content for fallback use,
+    and the feed's declared language in Article.language.
     Detects podcast entries by the presence of enclosure tags.
     """
     feed = feedparser.parse(xml_content)
+    # Feed-level language (RSS <language>, Atom xml:lang), a detection hint
+    language = feed.feed.get("language") or None
     articles: list[Article] = []
 
     for entry in feed.entries:
@@ -59,6 +92,7 @@ def parse_feed(xml_content: str, feed_url: str) -> list[Article]:
             author=author,
             content=content,
             audio_url=audio_url,
+            language=language,
             is_podcast=is_podcast,
         )
         articles.append(article)
@@ -70,21 +104,210 @@ def filter_new_articles(
     articles: list[Article], db: StateDB
 ) -> list[Article]:
     """Filter out articles that are already in the database."""
-    return [a for a in articles if db.get_article_by_url(a.url) is None]
+    known = db.get_known_urls(a.url for a in articles)
+    return [a for a in articles if a.url not in known]
+
+
+def _conditional_headers(state: dict | None) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from stored state."""
+    headers: dict[str, str] = {}
+    if state is None:
+        return headers
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def _backoff_delay(attempt: int, backoff_base: float, retry_after: str | None) -> float:
+    """Full-jitter exponential backoff, never shorter than Retry-After.
+
+    Retry-After is capped at MAX_RETRY_AFTER.
+    """
+    delay = random.uniform(0, backoff_base * (2**attempt))
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), MAX_RETRY_AFTER))
+    return delay
+
+
+def _save_validators(
+    db: StateDB, feed_url: str, response: httpx.Response, content_hash: str
+) -> None:
+    db.save_feed_state(
+        feed_url,
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+        content_hash=content_hash,
+    )
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient,
+    feed_url: str,
+    headers: dict[str, str],
+    retries: int,
+    backoff_base: float,
+) -> httpx.Response:
+    """GET a feed, retrying transient failures with jittered backoff."""
+    attempt = 0
+    while True:
+        retry_after = None
+        try:
+            if headers:
+                response = await client.get(feed_url, headers=headers)
+            else:
+                response = await client.get(feed_url)
+            if response.status_code == 304:
+                return response
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            if (
+                attempt >= retries
+                or e.response.status_code not in RETRYABLE_STATUS_CODES
+            ):
+                raise
+            retry_after = e.response.headers.get("retry-after")
+        except httpx.UnsupportedProtocol:
+            raise
+        except httpx.TransportError:
+            if attempt >= retries:
+                raise
+        delay = _backoff_delay(attempt, backoff_base, retry_after)
+        attempt += 1
+        logger.debug(
+            "Retrying feed %s in %.2fs (attempt %d)", feed_url, delay, attempt
+        )
+        await asyncio.sleep(delay)
 
 
 async def fetch_feed(
     client: httpx.AsyncClient,
     feed_url: str,
+    db: StateDB | None = None,
+    stats: FetchStats | None = None,
+    retries: int = 0,
+    backoff_base: float = 0.5,
+    store: ArticleStore | None = None,
 ) -> list[Article]:
     """Fetch and parse an RSS/Atom feed via HTTP.
 
+    When db is given, the feed's ETag, Last-Modified and body hash are kept
+    in StateDB and sent back as conditional request headers. A 304 response
+    or an unchanged body skips parsing and returns an empty list.
+
+    The validators of a changed body are saved only after store has been
+    called with the parsed articles (e.g. db.add_articles_bulk), so a crash
+    before the articles are stored cannot make the next fetch skip them.
+    Without store they are not saved, and the next fetch parses the feed
+    again. An exception from store propagates and saves nothing.
+
+    Transport errors (connection, read, protocol, timeout), 429 and 5xx
+    responses are retried up to `retries` times with jittered exponential
+    backoff.
+
     Returns parsed articles on success, empty list on error.
     """
+    state = db.get_feed_state(feed_url) if db is not None else None
+    headers = _conditional_headers(state)
     try:
-        response = await client.get(feed_url)
-        response.raise_for_status()
-        return parse_feed(response.text, feed_url)
-    except (httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException) as e:
+        response = await _get_with_retry(
+            client, feed_url, headers, retries, backoff_base
+        )
+    except (httpx.HTTPError, ValueError) as e:
         logger.warning("Failed to fetch feed %s: %s", feed_url, e)
+        if stats is not None:
+            stats.failed += 1
         return []
+
+    if response.status_code == 304:
+        logger.debug("Feed not modified: %s", feed_url)
+        if stats is not None:
+            stats.not_modified += 1
+        return []
+
+    content_hash = None
+    if db is not None:
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if state is not None and state.get("content_hash") == content_hash:
+            # Same body as last time; its articles were stored before its hash
+            _save_validators(db, feed_url, response, content_hash)
+            logger.debug("Feed body unchanged: %s", feed_url)
+            if stats is not None:
+                stats.unchanged += 1
+            return []
+
+    articles = parse_feed(response.text, feed_url)
+    if store is not None:
+        store(articles)
+        if db is not None and content_hash is not None:
+            _save_validators(db, feed_url, response, content_hash)
+    if stats is not None:
+        stats.fetched += 1
+    return articles
+
+
+def create_http_client(config: FetchConfig) -> httpx.AsyncClient:
+    """Create the shared client used by fetch_all_feeds."""
+    return httpx.AsyncClient(
+        timeout=config.timeout,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=config.max_concurrency,
+            max_keepalive_connections=config.max_concurrency,
+        ),
+    )
+
+
+async def fetch_all_feeds(
+    client: httpx.AsyncClient,
+    feed_urls: Iterable[str],
+    db: StateDB | None = None,
+    stats: FetchStats | None = None,
+    max_concurrency: int = 16,
+    per_host_limit: int = 4,
+    retries: int = 2,
+    backoff_base: float = 0.5,
+    store: ArticleStore | None = None,
+) -> AsyncIterator[tuple[str, list[Article]]]:
+    """Fetch many feeds concurrently on one shared client.
+
+    At most `max_concurrency` requests are in flight overall and at most
+    `per_host_limit` per host. Yields (feed_url, articles) pairs in completion
+    order, so callers can start scraping before the slowest feed returns.
+    A feed that fails in any way yields (feed_url, []) and counts as failed;
+    it never stops the other fetches. db and store are passed to fetch_feed;
+    each feed's articles are stored before it is yielded.
+    """
+    global_limit = asyncio.Semaphore(max_concurrency)
+    host_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(per_host_limit)
+    )
+
+    async def fetch_one(feed_url: str) -> tuple[str, list[Article]]:
+        try:
+            async with host_limits[httpx.URL(feed_url).host], global_limit:
+                articles = await fetch_feed(
+                    client,
+                    feed_url,
+                    db=db,
+                    stats=stats,
+                    retries=retries,
+                    backoff_base=backoff_base,
+                    store=store,
+                )
+        except Exception:
+            logger.warning("Failed to fetch feed %s", feed_url, exc_info=True)
+            if stats is not None:
+                stats.failed += 1
+            return feed_url, []
+        return feed_url, articles
+
+    tasks = [asyncio.create_task(fetch_one(url)) for url in dict.fromkeys(feed_urls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
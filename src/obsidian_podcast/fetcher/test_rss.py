@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+FEED_URL = "https://example.com/feed.xml"
+
 # Sample RSS feed XML for testing
 SAMPLE_RSS = """<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
@@ -104,6 +106,14 @@ class TestParseFeed:
         entries = parse_feed(xml, "https://example.com/feed.xml")
         assert entries == []
 
+    def test_feed_language_stored(self):
+        from obsidian_podcast.fetcher.rss import parse_feed
+
+        xml = SAMPLE_RSS.replace("<channel>", "<channel><language>ja</language>")
+        entries = parse_feed(xml, "https://example.com/feed.xml")
+        assert [e.language for e in entries] == ["ja", "ja"]
+        assert parse_feed(SAMPLE_RSS, FEED_URL)[0].language is None
+
     def test_rss_description_stored(self):
         """RSS description/content is stored for fallback use."""
         from obsidian_podcast.fetcher.rss import parse_feed
@@ -202,3 +212,359 @@ class TestFetchFeed:
             "https://example.com/feed.xml",
         )
         assert articles == []
+
+
+class TestConditionalFetch:
+    """Test ETag / Last-Modified / content-hash skipping."""
+
+    @staticmethod
+    def _client(handler):
+        import httpx
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_sends_validators_and_skips_on_304(self, tmp_path):
+        import httpx
+
+        from obsidian_podcast.db.state import StateDB
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_feed
+
+        db = StateDB(tmp_path / "test.db")
+        db.initialize()
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                text=SAMPLE_RSS,
+                headers={
+                    "ETag": '"v1"',
+                    "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                },
+            )
+
+        stats = FetchStats()
+        store = db.add_articles_bulk
+        async with self._client(handler) as client:
+            first = await fetch_feed(client, FEED_URL, db, stats, store=store)
+            second = await fetch_feed(client, FEED_URL, db, stats, store=store)
+
+        assert len(first) == 2
+        assert second == []
+        assert "if-none-match" not in seen_headers[0]
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert (
+            seen_headers[1]["if-modified-since"]
+            == "Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+        assert stats.fetched == 1
+        assert stats.not_modified == 1
+        assert stats.skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_body_skips_parse(self, tmp_path):
+        import httpx
+
+        from obsidian_podcast.db.state import StateDB
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_feed
+
+        db = StateDB(tmp_path / "test.db")
+        db.initialize()
+
+        def handler(request):
+            return httpx.Response(200, text=SAMPLE_RSS)
+
+        stats = FetchStats()
+        store = db.add_articles_bulk
+        async with self._client(handler) as client:
+            await fetch_feed(client, FEED_URL, db, stats, store=store)
+            articles = await fetch_feed(client, FEED_URL, db, stats, store=store)
+
+        assert articles == []
+        assert stats.unchanged == 1
+        assert db.get_feed_state(FEED_URL)["content_hash"] is not None
+
+    @pytest.mark.asyncio
+    async def test_changed_body_is_parsed(self, tmp_path):
+        import httpx
+
+        from obsidian_podcast.db.state import StateDB
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_feed
+
+        db = StateDB(tmp_path / "test.db")
+        db.initialize()
+        bodies = iter([SAMPLE_ATOM, SAMPLE_RSS])
+
+        def handler(request):
+            return httpx.Response(200, text=next(bodies))
+
+        stats = FetchStats()
+        async with self._client(handler) as client:
+            await fetch_feed(client, FEED_URL, db=db, stats=stats)
+            articles = await fetch_feed(client, FEED_URL, db=db, stats=stats)
+
+        assert len(articles) == 2
+        assert stats.fetched == 2
+        assert stats.skipped == 0
+
+    @pytest.mark.asyncio
+    async def test_validators_saved_only_after_articles_are_stored(self, tmp_path):
+        import httpx
+
+        from obsidian_podcast.db.state import StateDB
+        from obsidian_podcast.fetcher.rss import fetch_feed
+
+        db = StateDB(tmp_path / "test.db")
+        db.initialize()
+
+        def handler(request):
+            return httpx.Response(200, text=SAMPLE_RSS, headers={"ETag": '"v1"'})
+
+        def crash(articles):
+            raise RuntimeError("crashed before insert")
+
+        async with self._client(handler) as client:
+            with pytest.raises(RuntimeError):
+                await fetch_feed(client, FEED_URL, db=db, store=crash)
+            assert db.get_feed_state(FEED_URL) is None
+            assert len(await fetch_feed(client, FEED_URL, db=db)) == 2
+            assert db.get_feed_state(FEED_URL) is None
+
+            articles = await fetch_feed(
+                client, FEED_URL, db=db, store=db.add_articles_bulk
+            )
+
+        assert len(articles) == 2
+        assert db.get_known_urls(a.url for a in articles) == {
+            a.url for a in articles
+        }
+        assert db.get_feed_state(FEED_URL)["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_failure_counted(self):
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_feed
+
+        def handler(request):
+            return httpx.Response(500)
+
+        stats = FetchStats()
+        async with self._client(handler) as client:
+            articles = await fetch_feed(client, FEED_URL, stats=stats)
+
+        assert articles == []
+        assert stats.failed == 1
+
+
+class TestFetchAllFeeds:
+    """Test the concurrent multi-feed fetch engine."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_feeds(self):
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_all_feeds
+
+        def handler(request):
+            return httpx.Response(200, text=SAMPLE_RSS)
+
+        urls = [f"https://host{i}.example.com/feed.xml" for i in range(5)]
+        stats = FetchStats()
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            results = [r async for r in fetch_all_feeds(client, urls, stats=stats)]
+
+        assert sorted(url for url, _ in results) == sorted(urls)
+        assert all(len(articles) == 2 for _, articles in results)
+        assert stats.fetched == 5
+
+    @pytest.mark.asyncio
+    async def test_respects_global_and_per_host_limits(self):
+        import asyncio
+        from collections import Counter
+
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import fetch_all_feeds
+
+        in_flight: Counter[str] = Counter()
+        peak_total = 0
+        peak_host: Counter[str] = Counter()
+
+        async def handler(request):
+            nonlocal peak_total
+            host = request.url.host
+            in_flight[host] += 1
+            peak_total = max(peak_total, sum(in_flight.values()))
+            peak_host[host] = max(peak_host[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, text=SAMPLE_RSS)
+
+        urls = [f"https://zenn.dev/{i}/feed" for i in range(10)] + [
+            f"https://other{i}.example.com/feed" for i in range(10)
+        ]
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            async for _ in fetch_all_feeds(
+                client, urls, max_concurrency=5, per_host_limit=2
+            ):
+                pass
+
+        assert peak_total <= 5
+        assert peak_host["zenn.dev"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_streams_results_in_completion_order(self):
+        import asyncio
+
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import fetch_all_feeds
+
+        async def handler(request):
+            if request.url.host == "slow.example.com":
+                await asyncio.sleep(0.05)
+            return httpx.Response(200, text=SAMPLE_RSS)
+
+        urls = ["https://slow.example.com/feed", "https://fast.example.com/feed"]
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            order = [url async for url, _ in fetch_all_feeds(client, urls)]
+
+        assert order == list(reversed(urls))
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_all_feeds
+
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, text=SAMPLE_RSS)
+
+        stats = FetchStats()
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            results = [
+                r
+                async for r in fetch_all_feeds(
+                    client, [FEED_URL], stats=stats, retries=2, backoff_base=0
+                )
+            ]
+
+        assert calls == 3
+        assert len(results[0][1]) == 2
+        assert stats.failed == 0
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_all_feeds
+
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(404)
+
+        stats = FetchStats()
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            results = [
+                r
+                async for r in fetch_all_feeds(
+                    client, [FEED_URL], stats=stats, retries=3, backoff_base=0
+                )
+            ]
+
+        assert calls == 1
+        assert results == [(FEED_URL, [])]
+        assert stats.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_one_bad_feed_does_not_stop_the_others(self):
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import FetchStats, fetch_all_feeds
+
+        def handler(request):
+            if request.url.host == "broken.example.com":
+                raise httpx.ReadError("connection reset", request=request)
+            return httpx.Response(200, text=SAMPLE_RSS)
+
+        urls = [
+            "https://broken.example.com/feed",
+            "not a url",
+            "https://ok.example.com/feed",
+        ]
+        stats = FetchStats()
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            results = dict(
+                [
+                    r
+                    async for r in fetch_all_feeds(
+                        client, urls, stats=stats, retries=1, backoff_base=0
+                    )
+                ]
+            )
+
+        assert results["https://broken.example.com/feed"] == []
+        assert results["not a url"] == []
+        assert len(results["https://ok.example.com/feed"]) == 2
+        assert stats.failed == 2
+        assert stats.fetched == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_read_errors(self):
+        import httpx
+
+        from obsidian_podcast.fetcher.rss import fetch_all_feeds
+
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise httpx.RemoteProtocolError("bad frame", request=request)
+            return httpx.Response(200, text=SAMPLE_RSS)
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            results = [
+                r
+                async for r in fetch_all_feeds(
+                    client, [FEED_URL], retries=1, backoff_base=0
+                )
+            ]
+
+        assert calls == 2
+        assert len(results[0][1]) == 2
+
+    def test_retry_after_is_capped(self):
+        from obsidian_podcast.fetcher.rss import MAX_RETRY_AFTER, _backoff_delay
+
+        assert _backoff_delay(0, 0, "86400") == MAX_RETRY_AFTER
+        assert _backoff_delay(0, 0, "2") == 2
@@ -4,14 +4,39 @@ import obsidian_podcast.llm.claude  # noqa: F401
 import obsidian_podcast.llm.openai_provider  # noqa: F401
 from obsidian_podcast.llm.base import (
     LLMProvider,
+    LLMUsage,
     create_llm_engine,
     generate_podcast_script,
     split_text_for_llm,
+    stream_podcast_script,
 )
+from obsidian_podcast.llm.batch import (
+    collect_batch,
+    create_batch_backend,
+    poll_batches,
+    run_batch,
+    submit_batch,
+)
+from obsidian_podcast.llm.cache import CachedLLMProvider, LLMResponseCache
+from obsidian_podcast.llm.client import AdaptiveLimiter, ResilientLLMProvider
+from obsidian_podcast.llm.streaming import SentenceAccumulator, stream_tts_segments
 
 __all__ = [
+    "AdaptiveLimiter",
+    "CachedLLMProvider",
     "LLMProvider",
+    "LLMResponseCache",
+    "LLMUsage",
+    "ResilientLLMProvider",
+    "SentenceAccumulator",
+    "collect_batch",
+    "create_batch_backend",
     "create_llm_engine",
     "generate_podcast_script",
+    "poll_batches",
+    "run_batch",
     "split_text_for_llm",
+    "stream_podcast_script",
+    "stream_tts_segments",
+    "submit_batch",
 ]
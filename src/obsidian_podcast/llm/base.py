@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from obsidian_podcast.llm.tokens import (
+    TokenCounter,
+    approx_token_count,
+    get_token_counter,
+)
 
 if TYPE_CHECKING:
     from obsidian_podcast.config import LLMConfig
+    from obsidian_podcast.llm.cache import LLMResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,14 +53,60 @@ SYSTEM_PROMPT = (
 _registry: dict[str, type[LLMProvider]] = {}
 
 
+@dataclass
+class LLMUsage:
+    """Token usage accumulated by a provider across calls."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    requests: int = 0
+
+    def add(self, usage: Any) -> None:
+        """Add an API response's usage object (missing fields count as 0)."""
+        self.requests += 1
+        for name in (
+            "input_tokens",
+            "output_tokens",
+            "cache_creation_input_tokens",
+            "cache_read_input_tokens",
+        ):
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                setattr(self, name, getattr(self, name) + value)
+
+    def counters(self) -> dict[str, int]:
+        """Usage as run-metrics counters, e.g. for MetricsCollector."""
+        return {f"llm_{name}_total": value for name, value in asdict(self).items()}
+
+
 class LLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+    """Abstract base class for LLM providers.
+
+    Providers that report token usage expose it as `usage`; it is None for
+    providers that do not track it. `model` names the model the provider
+    calls, and picks the tokenizer for token-budgeted chunks.
+    """
+
+    usage: LLMUsage | None = None
+    model: str = ""
 
     @abstractmethod
     async def generate(self, prompt: str, system_prompt: str = "") -> str:
         """Generate text from a prompt."""
         ...
 
+    async def generate_stream(
+        self, prompt: str, system_prompt: str = ""
+    ) -> AsyncIterator[str]:
+        """Yield generated text incrementally as it arrives.
+
+        The default implementation yields the full generate() result at once;
+        providers with a streaming API override it.
+        """
+        yield await self.generate(prompt, system_prompt=system_prompt)
+
 
 def register_llm_engine(name: str):
     """Decorator to register an LLM provider class."""
@@ -62,91 +118,256 @@ def register_llm_engine(name: str):
     return decorator
 
 
-def create_llm_engine(config: LLMConfig) -> LLMProvider:
-    """Create an LLM provider instance from config."""
+def create_llm_engine(
+    config: LLMConfig,
+    cache: LLMResponseCache | None = None,
+    resilient: bool = False,
+) -> LLMProvider:
+    """Create an LLM provider instance from config.
+
+    With resilient=True the provider is wrapped in ResilientLLMProvider,
+    which retries transient errors and adapts concurrency to rate limits.
+    When a response cache is given, the provider is wrapped so that repeated
+    (engine, model, system prompt, chunk) requests are served from it;
+    cache hits never wait for a concurrency slot.
+    """
     if config.engine not in _registry:
         available = list(_registry.keys())
         msg = f"Unknown LLM engine: {config.engine}. Available: {available}"
         raise ValueError(msg)
-    return _registry[config.engine](config)
+    provider = _registry[config.engine](config)
+    if resilient:
+        from obsidian_podcast.llm.client import ResilientLLMProvider
+
+        provider = ResilientLLMProvider.from_config(provider, config)
+    if cache is not None:
+        from obsidian_podcast.llm.cache import CachedLLMProvider
+
+        provider = CachedLLMProvider(provider, cache, config.engine, config.model)
+    return provider
+
+
+def _split_sentences(para: str) -> list[str]:
+    """Split a paragraph after "。", at ". " (dropping the space) and at newlines.
+
+    Two str.replace calls plus one split are C-level linear passes and
+    measure several times faster than an equivalent regex split.
+    """
+    return para.replace("。", "。\n").replace(". ", ".\n").split("\n")
 
 
-def split_text_for_llm(text: str, max_chars: int = 4000) -> list[str]:
+def split_text_for_llm(
+    text: str,
+    max_chars: int = 4000,
+    *,
+    max_tokens: int | None = None,
+    count_tokens: TokenCounter | None = None,
+) -> list[str]:
     """Split text into chunks for LLM processing.
 
     Strategy: split by paragraphs first, then by sentences if needed.
+
+    Chunks are packed up to max_chars characters, or up to max_tokens tokens
+    when a token budget is given. Tokens are measured with count_tokens
+    (default: approx_token_count).
+
+    Runs in a single pass over the pieces: each piece is measured once, a
+    chunk is kept as a list of pieces plus a running size, and joined only
+    when it is emitted, so time and memory stay linear in the input size.
     """
     if not text or not text.strip():
         return []
 
-    if len(text) <= max_chars:
+    if max_tokens is None:
+        measure: TokenCounter = len
+        budget = max_chars
+    else:
+        measure = count_tokens or approx_token_count
+        budget = max_tokens
+
+    if measure(text) <= budget:
         return [text]
 
-    paragraphs = text.split("\n\n")
+    para_sep = measure("\n\n")
+    sentence_sep = measure(" ")
     chunks: list[str] = []
-    current_chunk = ""
+    pieces: list[str] = []
+    size = 0
 
-    for para in paragraphs:
+    for para in text.split("\n\n"):
         if not para.strip():
             continue
 
-        if len(current_chunk) + len(para) + 2 <= max_chars:
-            if current_chunk:
-                current_chunk += "\n\n" + para
-            else:
-                current_chunk = para
-        else:
-            if current_chunk:
-                chunks.append(current_chunk)
+        para_size = measure(para)
+        if size + para_size + para_sep <= budget:
+            if pieces:
+                pieces.append("\n\n")
+                size += para_sep
+            pieces.append(para)
+            size += para_size
+            continue
 
-            if len(para) <= max_chars:
-                current_chunk = para
+        if pieces:
+            chunks.append("".join(pieces))
+        if para_size <= budget:
+            pieces = [para]
+            size = para_size
+            continue
+
+        # Split long paragraph by sentences
+        pieces = []
+        size = 0
+        for sentence in _split_sentences(para):
+            if not sentence.strip():
+                continue
+            sentence_size = measure(sentence)
+            if size + sentence_size + sentence_sep <= budget:
+                if pieces:
+                    pieces.append(" ")
+                    size += sentence_sep
+                pieces.append(sentence)
+                size += sentence_size
             else:
-                # Split long paragraph by sentences
-                sentences = (
-                    para.replace("。", "。\n").replace(". ", ".\n").split("\n")
-                )
-                current_chunk = ""
-                for sentence in sentences:
-                    if not sentence.strip():
-                        continue
-                    if len(current_chunk) + len(sentence) + 1 <= max_chars:
-                        if current_chunk:
-                            current_chunk += " " + sentence
-                        else:
-                            current_chunk = sentence
-                    else:
-                        if current_chunk:
-                            chunks.append(current_chunk)
-                        current_chunk = sentence
-
-    if current_chunk:
-        chunks.append(current_chunk)
+                if pieces:
+                    chunks.append("".join(pieces))
+                pieces = [sentence]
+                size = sentence_size
+
+    if pieces:
+        chunks.append("".join(pieces))
 
     return chunks
 
 
+def _token_counter(
+    provider: LLMProvider,
+    max_chunk_tokens: int | None,
+    count_tokens: TokenCounter | None = None,
+) -> TokenCounter | None:
+    """The counter to size chunks with: count_tokens, else provider.model's.
+
+    None when chunks are sized by characters (no max_chunk_tokens).
+    """
+    if max_chunk_tokens is None or count_tokens is not None:
+        return count_tokens
+    return get_token_counter(provider.model)
+
+
 async def generate_podcast_script(
     text: str,
     provider: LLMProvider,
     max_chunk_chars: int = 4000,
+    max_concurrency: int = 4,
+    limiter: asyncio.Semaphore | None = None,
+    max_chunk_tokens: int | None = None,
+    count_tokens: TokenCounter | None = None,
 ) -> str:
-    """Convert article text to podcast script using LLM."""
-    chunks = split_text_for_llm(text, max_chars=max_chunk_chars)
+    """Convert article text to podcast script using LLM.
+
+    Chunks are generated concurrently, at most max_concurrency at a time,
+    and joined in their original order. Pass a shared limiter instead to cap
+    concurrency across several calls to the same provider. A chunk whose
+    generation fails falls back to its original text. When max_chunk_tokens
+    is set, chunks are sized by tokens instead of max_chunk_chars, counted
+    with count_tokens or else the tokenizer of provider.model.
+    """
+    chunks = split_text_for_llm(
+        text,
+        max_chars=max_chunk_chars,
+        max_tokens=max_chunk_tokens,
+        count_tokens=_token_counter(provider, max_chunk_tokens, count_tokens),
+    )
 
     if not chunks:
         return text
 
-    results: list[str] = []
-    for chunk in chunks:
-        try:
-            result = await provider.generate(chunk, system_prompt=SYSTEM_PROMPT)
-            results.append(result)
-        except Exception:
-            logger.warning(
-                "LLM generation failed for chunk, using original text",
-                exc_info=True,
-            )
-            results.append(chunk)
+    limiter = limiter or asyncio.Semaphore(max_concurrency)
+
+    async def generate_chunk(chunk: str) -> str:
+        async with limiter:
+            try:
+                return await provider.generate(chunk, system_prompt=SYSTEM_PROMPT)
+            except Exception:
+                logger.warning(
+                    "LLM generation failed for chunk, using original text",
+                    exc_info=True,
+                )
+                return chunk
 
+    results = await asyncio.gather(*(generate_chunk(chunk) for chunk in chunks))
     return "\n\n".join(results)
+
+
+# Marks the end of one chunk's stream in stream_podcast_script.
+_CHUNK_DONE = object()
+
+
+async def stream_podcast_script(
+    text: str,
+    provider: LLMProvider,
+    max_chunk_chars: int = 4000,
+    max_concurrency: int = 4,
+    limiter: asyncio.Semaphore | None = None,
+    max_chunk_tokens: int | None = None,
+    count_tokens: TokenCounter | None = None,
+) -> AsyncIterator[str]:
+    """Stream the podcast script for text as the LLM produces it.
+
+    Yields the same text generate_podcast_script would return, in order, but
+    incrementally: pieces of the first chunk are yielded as soon as they
+    arrive while later chunks are already being generated in the background
+    (at most max_concurrency at a time). A chunk that fails before producing
+    any output falls back to its original text; one that fails midway keeps
+    what it already produced.
+    """
+    chunks = split_text_for_llm(
+        text,
+        max_chars=max_chunk_chars,
+        max_tokens=max_chunk_tokens,
+        count_tokens=_token_counter(provider, max_chunk_tokens, count_tokens),
+    )
+    if not chunks:
+        if text:
+            yield text
+        return
+
+    limiter = limiter or asyncio.Semaphore(max_concurrency)
+    queues: list[asyncio.Queue] = [asyncio.Queue() for _ in chunks]
+
+    async def produce(chunk: str, queue: asyncio.Queue) -> None:
+        produced = False
+        async with limiter:
+            try:
+                async for piece in provider.generate_stream(
+                    chunk, system_prompt=SYSTEM_PROMPT
+                ):
+                    produced = True
+                    queue.put_nowait(piece)
+            except Exception:
+                if produced:
+                    logger.warning(
+                        "LLM stream failed mid-chunk, keeping partial output",
+                        exc_info=True,
+                    )
+                else:
+                    logger.warning(
+                        "LLM generation failed for chunk, using original text",
+                        exc_info=True,
+                    )
+                    queue.put_nowait(chunk)
+            finally:
+                queue.put_nowait(_CHUNK_DONE)
+
+    tasks = [
+        asyncio.create_task(produce(chunk, queue))
+        for chunk, queue in zip(chunks, queues, strict=True)
+    ]
+    try:
+        for i, queue in enumerate(queues):
+            if i:
+                yield "\n\n"
+            while (piece := await queue.get()) is not _CHUNK_DONE:
+                yield piece
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,420 @@
+"""Offline batch execution of podcast script generation.
+
+Instead of one synchronous request per chunk, every chunk of every queued
+article is submitted as a single provider batch job: the Anthropic Message
+Batches API for Claude, the OpenAI Batch API for api.openai.com, and an
+in-process queue for other OpenAI-compatible servers such as Ollama. Batch
+ids and per-chunk results are stored in the state database, so a batch
+submitted by one run can be collected by a later one.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from obsidian_podcast.llm.base import SYSTEM_PROMPT, LLMProvider, split_text_for_llm
+from obsidian_podcast.llm.cache import CachedLLMProvider
+from obsidian_podcast.llm.claude import ClaudeLLMProvider
+from obsidian_podcast.llm.client import ResilientLLMProvider
+from obsidian_podcast.llm.openai_provider import OpenAILLMProvider
+from obsidian_podcast.llm.tokens import TokenCounter, get_token_counter
+
+if TYPE_CHECKING:
+    from obsidian_podcast.db.state import StateDB
+
+logger = logging.getLogger(__name__)
+
+BATCH_RUNNING = "running"
+BATCH_ENDED = "ended"
+BATCH_FAILED = "failed"
+
+# Provider batches complete within 24 hours; leave an hour of slack before
+# the articles' leases expire and they return to the queue.
+BATCH_LEASE_SECONDS = 25 * 3600.0
+
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+@dataclass
+class BatchRequest:
+    """One chunk to generate, identified by custom_id within its batch."""
+
+    custom_id: str
+    prompt: str
+    system_prompt: str = SYSTEM_PROMPT
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch request: text on success, otherwise error."""
+
+    custom_id: str
+    text: str | None = None
+    error: str | None = None
+
+
+class BatchBackend(ABC):
+    """Submits batches of requests to a provider and fetches the results."""
+
+    engine: str
+    provider: LLMProvider
+
+    @abstractmethod
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        """Submit requests as one batch and return its id."""
+
+    @abstractmethod
+    async def status(self, batch_id: str) -> str:
+        """Return BATCH_RUNNING, BATCH_ENDED or BATCH_FAILED."""
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        """Return the results of an ended batch, in any order."""
+
+
+class ClaudeBatchBackend(BatchBackend):
+    """Anthropic Message Batches API."""
+
+    engine = "claude"
+
+    def __init__(self, provider: ClaudeLLMProvider) -> None:
+        self.provider = provider
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        batch = await self.provider.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": request.custom_id,
+                    "params": {
+                        "model": self.provider.model,
+                        "max_tokens": 4096,
+                        "system": self.provider._system(request.system_prompt),
+                        "messages": [{"role": "user", "content": request.prompt}],
+                    },
+                }
+                for request in requests
+            ]
+        )
+        return batch.id
+
+    async def status(self, batch_id: str) -> str:
+        batch = await self.provider.client.messages.batches.retrieve(batch_id)
+        return BATCH_ENDED if batch.processing_status == "ended" else BATCH_RUNNING
+
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        decoder = await self.provider.client.messages.batches.results(batch_id)
+        results = []
+        async for entry in decoder:
+            result = entry.result
+            if result.type == "succeeded":
+                self.provider.usage.add(result.message.usage)
+                text = result.message.content[0].text if result.message.content else ""
+                results.append(BatchResult(entry.custom_id, text=text))
+            else:
+                error = getattr(result, "error", None)
+                results.append(
+                    BatchResult(entry.custom_id, error=str(error or result.type))
+                )
+        return results
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API: a JSONL input file of chat completion requests."""
+
+    engine = "openai"
+
+    def __init__(self, provider: OpenAILLMProvider) -> None:
+        self.provider = provider
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        lines = (
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": OPENAI_BATCH_ENDPOINT,
+                    "body": {
+                        "model": self.provider.model,
+                        "messages": self.provider._messages(
+                            request.prompt, request.system_prompt
+                        ),
+                    },
+                },
+                ensure_ascii=False,
+            )
+            for request in requests
+        )
+        payload = ("\n".join(lines) + "\n").encode()
+        client = self.provider.client
+        input_file = await client.files.create(
+            file=("batch.jsonl", payload), purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=OPENAI_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def status(self, batch_id: str) -> str:
+        batch = await self.provider.client.batches.retrieve(batch_id)
+        if batch.status == "failed":
+            return BATCH_FAILED
+        # Expired and cancelled batches still deliver the requests that
+        # finished; the rest are reported as missing and fall back.
+        if batch.status in ("completed", "expired", "cancelled"):
+            return BATCH_ENDED
+        return BATCH_RUNNING
+
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        client = self.provider.client
+        batch = await client.batches.retrieve(batch_id)
+        results = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    results.append(self._parse_line(json.loads(line)))
+        return results
+
+    @staticmethod
+    def _parse_line(record: dict) -> BatchResult:
+        custom_id = record["custom_id"]
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or response.get("body")
+            return BatchResult(custom_id, error=str(error))
+        choices = response["body"].get("choices") or []
+        if not choices:
+            return BatchResult(custom_id, text="")
+        return BatchResult(custom_id, text=choices[0]["message"]["content"] or "")
+
+
+class LocalBatchBackend(BatchBackend):
+    """In-process batch queue for providers without a batch API.
+
+    Requests run in the background through provider.generate, at most
+    max_concurrency at a time. Batches live only as long as this object;
+    a batch recorded by an earlier process reports BATCH_FAILED, which
+    returns its articles to the queue.
+    """
+
+    engine = "local"
+
+    def __init__(self, provider: LLMProvider, max_concurrency: int = 4) -> None:
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self._jobs: dict[str, asyncio.Task[list[BatchResult]]] = {}
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        batch_id = f"local-{uuid.uuid4().hex}"
+        self._jobs[batch_id] = asyncio.create_task(self._run(requests))
+        return batch_id
+
+    async def _run(self, requests: list[BatchRequest]) -> list[BatchResult]:
+        limiter = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_one(request: BatchRequest) -> BatchResult:
+            async with limiter:
+                try:
+                    text = await self.provider.generate(
+                        request.prompt, system_prompt=request.system_prompt
+                    )
+                except Exception as e:
+                    return BatchResult(request.custom_id, error=str(e))
+                return BatchResult(request.custom_id, text=text)
+
+        return await asyncio.gather(*(run_one(request) for request in requests))
+
+    async def status(self, batch_id: str) -> str:
+        job = self._jobs.get(batch_id)
+        if job is None:
+            return BATCH_FAILED
+        return BATCH_ENDED if job.done() else BATCH_RUNNING
+
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        return await self._jobs.pop(batch_id)
+
+
+def create_batch_backend(
+    provider: LLMProvider, max_concurrency: int = 4
+) -> BatchBackend:
+    """Pick the batch backend for a provider created by create_llm_engine.
+
+    Claude uses the Message Batches API and OpenAI's own endpoint the Batch
+    API. Any other provider, including OpenAI-compatible servers such as
+    Ollama, runs through LocalBatchBackend, keeping whatever cache or retry
+    wrappers the provider has.
+    """
+    inner = provider
+    while isinstance(inner, (CachedLLMProvider, ResilientLLMProvider)):
+        inner = inner.inner
+    if isinstance(inner, ClaudeLLMProvider):
+        return ClaudeBatchBackend(inner)
+    if (
+        isinstance(inner, OpenAILLMProvider)
+        and inner.client.base_url.host == "api.openai.com"
+    ):
+        return OpenAIBatchBackend(inner)
+    return LocalBatchBackend(provider, max_concurrency=max_concurrency)
+
+
+async def submit_batch(
+    db: "StateDB",
+    backend: BatchBackend,
+    articles: Mapping[int, str],
+    max_chunk_chars: int = 4000,
+    max_chunk_tokens: int | None = None,
+    count_tokens: TokenCounter | None = None,
+    lease_seconds: float = BATCH_LEASE_SECONDS,
+) -> str | None:
+    """Submit every chunk of every article as one batch and return its id.
+
+    articles maps article ids to their text. Only articles that are
+    'pending' are submitted: they are leased first, so articles a worker or
+    an earlier batch holds are skipped rather than paid for twice. Chunks
+    are split exactly as generate_podcast_script splits them, counting
+    tokens with the provider model's tokenizer by default. The batch and
+    its chunks are recorded in db and the leases handed to it. Articles
+    without any chunk are scripted as-is; returns None when nothing needed
+    submitting. If submitting fails, the leases are released.
+    """
+    if max_chunk_tokens is not None and count_tokens is None:
+        count_tokens = get_token_counter(backend.provider.model)
+    owner = f"batch-submit:{uuid.uuid4().hex}"
+    leased = set(db.lease_articles(owner, articles, lease_seconds))
+    skipped = len(articles) - len(leased)
+    if skipped:
+        logger.info("Skipping %d articles that are not pending", skipped)
+
+    requests: list[BatchRequest] = []
+    items: list[tuple[str, int, int, str]] = []
+    try:
+        for article_id, text in articles.items():
+            if article_id not in leased:
+                continue
+            chunks = split_text_for_llm(
+                text,
+                max_chars=max_chunk_chars,
+                max_tokens=max_chunk_tokens,
+                count_tokens=count_tokens,
+            )
+            if not chunks:
+                db.save_script(article_id, text)
+                continue
+            for index, chunk in enumerate(chunks):
+                custom_id = f"article-{article_id}-{index}"
+                requests.append(BatchRequest(custom_id, chunk))
+                items.append((custom_id, article_id, index, chunk))
+
+        if not requests:
+            return None
+        batch_id = await backend.submit(requests)
+        db.record_llm_batch(
+            batch_id, backend.engine, items, lease_seconds, claimed_by=owner
+        )
+    except BaseException:
+        db.release_articles(owner)
+        raise
+    logger.info(
+        "Submitted LLM batch %s: %d chunks from %d articles",
+        batch_id,
+        len(requests),
+        len({article_id for _, article_id, _, _ in items}),
+    )
+    return batch_id
+
+
+async def collect_batch(db: "StateDB", backend: BatchBackend, batch_id: str) -> bool:
+    """Write a finished batch's scripts to db; return False if still running.
+
+    Chunk outputs are joined in order into each article's script, and the
+    articles move to 'scripted'. A chunk that failed or is missing from the
+    results falls back to its original text, like generate_podcast_script,
+    but an article none of whose chunks succeeded returns to 'pending'
+    rather than being scripted as its raw source. A batch that failed as a
+    whole returns its articles to 'pending'.
+    """
+    state = await backend.status(batch_id)
+    if state == BATCH_RUNNING:
+        return False
+    if state == BATCH_FAILED:
+        logger.warning("LLM batch %s failed, requeueing its articles", batch_id)
+        db.fail_llm_batch(batch_id, f"{backend.engine} batch failed")
+        return True
+
+    results = {result.custom_id: result for result in await backend.results(batch_id)}
+    rows: list[tuple[str, str | None, str | None]] = []
+    parts: dict[int, list[str]] = {}
+    succeeded: set[int] = set()
+    for item in db.get_llm_batch_items(batch_id):
+        result = results.get(item["custom_id"])
+        if result is not None and result.error is None and result.text is not None:
+            rows.append((item["custom_id"], result.text, None))
+            succeeded.add(item["article_id"])
+            parts.setdefault(item["article_id"], []).append(result.text)
+            continue
+        error = result.error if result is not None else "missing from batch results"
+        logger.warning(
+            "LLM batch chunk %s failed (%s), using original text",
+            item["custom_id"],
+            error,
+        )
+        rows.append((item["custom_id"], None, error))
+        parts.setdefault(item["article_id"], []).append(item["source"])
+
+    scripts = {
+        article_id: "\n\n".join(chunks)
+        for article_id, chunks in parts.items()
+        if article_id in succeeded
+    }
+    requeue = [article_id for article_id in parts if article_id not in succeeded]
+    if requeue:
+        logger.warning(
+            "LLM batch %s produced no output for %d articles, requeueing them",
+            batch_id,
+            len(requeue),
+        )
+    db.complete_llm_batch(batch_id, rows, scripts, requeue=requeue)
+    return True
+
+
+async def poll_batches(db: "StateDB", backend: BatchBackend) -> int:
+    """Collect every finished batch of backend's engine; return how many."""
+    finished = 0
+    for batch in db.list_llm_batches(engine=backend.engine):
+        if await collect_batch(db, backend, batch["id"]):
+            finished += 1
+    return finished
+
+
+async def run_batch(
+    db: "StateDB",
+    backend: BatchBackend,
+    articles: Mapping[int, str],
+    poll_interval: float = 60.0,
+    max_chunk_chars: int = 4000,
+    max_chunk_tokens: int | None = None,
+    count_tokens: TokenCounter | None = None,
+) -> str | None:
+    """Submit articles as one batch and wait until its results are stored."""
+    batch_id = await submit_batch(
+        db,
+        backend,
+        articles,
+        max_chunk_chars=max_chunk_chars,
+        max_chunk_tokens=max_chunk_tokens,
+        count_tokens=count_tokens,
+    )
+    if batch_id is None:
+        return None
+    while not await collect_batch(db, backend, batch_id):
+        await asyncio.sleep(poll_interval)
+    return batch_id
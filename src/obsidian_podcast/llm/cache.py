@@ -0,0 +1,178 @@
+"""Content-addressed, size-bounded cache of LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from obsidian_podcast.llm.base import LLMProvider, LLMUsage
+
+if TYPE_CHECKING:
+    from obsidian_podcast.config import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+CREATE_CACHE_TABLE = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+CREATE_CACHE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used)
+"""
+
+# Evict down to this fraction of max_bytes so eviction runs rarely.
+EVICT_TARGET = 0.9
+
+
+def cache_key(engine: str, model: str, system_prompt: str, prompt: str) -> str:
+    """Hash everything that determines an LLM response into a cache key."""
+    h = hashlib.sha256()
+    for part in (engine, model, system_prompt, prompt):
+        encoded = part.encode()
+        h.update(len(encoded).to_bytes(8, "big"))
+        h.update(encoded)
+    return h.hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with size-based LRU eviction.
+
+    Values are zlib-compressed; max_bytes bounds the total compressed size.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(CREATE_CACHE_TABLE)
+            self._conn.execute(CREATE_CACHE_INDEX)
+        self.total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        self.hits += 1
+        return zlib.decompress(row[0]).decode()
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response, evicting least recently used entries if needed."""
+        blob = zlib.compress(value.encode())
+        with self._lock, self._conn:
+            old = self._conn.execute(
+                "SELECT size FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                """INSERT OR REPLACE INTO llm_cache (key, value, size, last_used)
+                   VALUES (?, ?, ?, ?)""",
+                (key, blob, len(blob), time.time()),
+            )
+            self.total_bytes += len(blob) - (old[0] if old else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        target = self.max_bytes * EVICT_TARGET
+        while self.total_bytes > target:
+            rows = self._conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY last_used LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                return
+            for key, size in rows:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.total_bytes -= size
+                if self.total_bytes <= target:
+                    break
+        logger.debug("LLM cache evicted down to %d bytes", self.total_bytes)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class CachedLLMProvider(LLMProvider):
+    """Wraps any LLMProvider and serves repeated requests from the cache."""
+
+    def __init__(
+        self, inner: LLMProvider, cache: LLMResponseCache, engine: str, model: str
+    ) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.engine = engine
+        self.model = model
+
+    @property
+    def usage(self) -> LLMUsage | None:  # type: ignore[override]
+        return self.inner.usage
+
+    async def generate(self, prompt: str, system_prompt: str = "") -> str:
+        """Return the cached response, or generate and cache it."""
+        key = cache_key(self.engine, self.model, system_prompt, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = await self.inner.generate(prompt, system_prompt=system_prompt)
+        self.cache.put(key, result)
+        return result
+
+    async def generate_stream(
+        self, prompt: str, system_prompt: str = ""
+    ) -> AsyncIterator[str]:
+        """Yield the cached response, or stream from the inner provider.
+
+        A streamed response is cached only once it has completed.
+        """
+        key = cache_key(self.engine, self.model, system_prompt, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        pieces: list[str] = []
+        async for piece in self.inner.generate_stream(
+            prompt, system_prompt=system_prompt
+        ):
+            pieces.append(piece)
+            yield piece
+        self.cache.put(key, "".join(pieces))
+
+
+def open_llm_cache(config: LLMConfig, default_dir: Path) -> LLMResponseCache | None:
+    """Open the response cache configured in config, or None if disabled."""
+    if not config.cache_enabled:
+        return None
+    if config.cache_path:
+        path = Path(config.cache_path)
+    else:
+        path = default_dir / "llm_cache.db"
+    return LLMResponseCache(path, max_bytes=config.cache_max_mb * 1024 * 1024)
@@ -1,15 +1,26 @@
 """Claude (Anthropic) LLM provider."""
 
 import os
+from collections.abc import AsyncIterator
 
 import anthropic
 
-from obsidian_podcast.llm.base import LLMProvider, register_llm_engine
+from obsidian_podcast.llm.base import LLMProvider, LLMUsage, register_llm_engine
+from obsidian_podcast.llm.client import sdk_client_options
 
 
 @register_llm_engine("claude")
 class ClaudeLLMProvider(LLMProvider):
-    """LLM provider using Anthropic Claude API."""
+    """LLM provider using Anthropic Claude API.
+
+    With prompt caching enabled the system prompt is sent as a cacheable
+    block, so every chunk after the first can read it from Anthropic's
+    prompt cache instead of paying for it again. Anthropic only caches a
+    prefix of at least 1024 tokens (2048 on Haiku models); shorter prompts,
+    including the built-in SYSTEM_PROMPT (about 500 tokens), are accepted
+    but never cached, and usage then shows no cache reads. Token usage,
+    including cache reads and writes, is accumulated in `usage`.
+    """
 
     def __init__(self, config) -> None:
         api_key = (
@@ -17,17 +28,48 @@ class ClaudeLLMProvider(LLMProvider):
             if config.api_key_env
             else None
         )
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, **sdk_client_options(anthropic, config)
+        )
         self.model = config.model
+        self.prompt_cache = bool(config.prompt_cache)
+        self.usage = LLMUsage()
+
+    def _system(self, system_prompt: str) -> str | list[dict]:
+        if not self.prompt_cache or not system_prompt:
+            return system_prompt
+        return [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
 
     async def generate(self, prompt: str, system_prompt: str = "") -> str:
         """Generate text using Anthropic Claude API."""
         response = await self.client.messages.create(
             model=self.model,
             max_tokens=4096,
-            system=system_prompt,
+            system=self._system(system_prompt),
             messages=[{"role": "user", "content": prompt}],
         )
+        self.usage.add(response.usage)
         if not response.content:
             return ""
         return response.content[0].text
+
+    async def generate_stream(
+        self, prompt: str, system_prompt: str = ""
+    ) -> AsyncIterator[str]:
+        """Stream text deltas from the Anthropic Messages API."""
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=4096,
+            system=self._system(system_prompt),
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+            final = await stream.get_final_message()
+        self.usage.add(final.usage)
@@ -0,0 +1,290 @@
+"""Connection-pooled, retrying wrapper shared by all LLM providers.
+
+Providers build their SDK client with sdk_client_options(), which applies
+the configured timeout and HTTP connection pool limits. Wrapping a provider
+in ResilientLLMProvider adds retries with jittered exponential backoff that
+honor Retry-After, and an AIMD concurrency limit: each rate-limited call
+halves the number of calls allowed in flight, each successful call raises
+it again by about one per window of calls, up to the configured maximum.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator
+from email.utils import parsedate_to_datetime
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+import anthropic
+import openai
+
+from obsidian_podcast.llm.base import LLMProvider, LLMUsage
+
+if TYPE_CHECKING:
+    from obsidian_podcast.config import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_STATUS_CODES = {429, 529}
+RETRYABLE_STATUS_CODES = {408, 409, 500, 502, 503, 504} | RATE_LIMIT_STATUS_CODES
+
+CONNECTION_ERRORS = (
+    anthropic.APIConnectionError,
+    openai.APIConnectionError,
+    asyncio.TimeoutError,
+)
+
+
+def sdk_client_options(sdk: ModuleType, config: "LLMConfig") -> dict[str, Any]:
+    """Keyword arguments that apply config's timeout and pool limits.
+
+    sdk is the anthropic or openai module. The pool limits are built with
+    the Limits class of the HTTP library the SDK itself uses.
+    """
+    limits = type(sdk.DEFAULT_CONNECTION_LIMITS)(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+    )
+    return {
+        "timeout": config.timeout,
+        "http_client": sdk.DefaultAsyncHttpxClient(limits=limits),
+    }
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """Whether exc is a provider rate-limit or overload response."""
+    return _status_code(exc) in RATE_LIMIT_STATUS_CODES
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether exc is transient: a connection error, timeout or retryable status."""
+    if isinstance(exc, CONNECTION_ERRORS):
+        return True
+    return _status_code(exc) in RETRYABLE_STATUS_CODES
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Seconds the server asked to wait, from retry-after-ms or Retry-After."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    backoff_base: float,
+    max_delay: float,
+    server_delay: float | None = None,
+) -> float:
+    """Full-jitter exponential backoff, never shorter than the server's delay."""
+    delay = random.uniform(0, min(max_delay, backoff_base * (2**attempt)))
+    if server_delay is not None:
+        delay = max(delay, server_delay)
+    return delay
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for calls to one provider.
+
+    acquire() waits until fewer than `limit` calls are in flight and returns
+    a token to hand back to release(). A success adds increase / limit to
+    the limit; a rate-limited call multiplies it by decrease. Only the first
+    rate-limited call among those started before the last decrease counts,
+    so one burst of 429s halves the limit once rather than collapsing it.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit if max_limit is not None else initial
+        self.increase = increase
+        self.decrease = decrease
+        self._limit = float(max(min_limit, min(initial, self.max_limit)))
+        self._in_flight = 0
+        self._epoch = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> int:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            return self._epoch
+
+    async def release(
+        self, token: int, *, succeeded: bool = False, rate_limited: bool = False
+    ) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            if rate_limited:
+                if token == self._epoch:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._epoch += 1
+                    logger.info("LLM rate limited, concurrency -> %d", self.limit)
+            elif succeeded:
+                self._limit = min(
+                    self.max_limit, self._limit + self.increase / self._limit
+                )
+            self._condition.notify_all()
+
+
+class ResilientLLMProvider(LLMProvider):
+    """Wrap a provider with retries and adaptive concurrency.
+
+    Transient failures (connection errors, timeouts, 408/409/429/5xx/529)
+    are retried up to max_retries times. Rate limits also shrink the
+    limiter. The inner SDK client's own retries are turned off so that
+    attempts are not compounded. Streams are retried only while no text
+    has been yielded yet.
+    """
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        limiter: AdaptiveLimiter | None = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        max_delay: float = 60.0,
+    ) -> None:
+        self.inner = inner
+        self.limiter = limiter or AdaptiveLimiter()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_delay = max_delay
+        client = getattr(inner, "client", None)
+        if client is not None and hasattr(client, "with_options"):
+            inner.client = client.with_options(max_retries=0)
+
+    @classmethod
+    def from_config(
+        cls, inner: LLMProvider, config: "LLMConfig"
+    ) -> "ResilientLLMProvider":
+        limiter = AdaptiveLimiter(
+            initial=config.max_concurrency,
+            min_limit=config.min_concurrency,
+            max_limit=config.max_concurrency,
+        )
+        return cls(
+            inner,
+            limiter,
+            max_retries=config.max_retries,
+            backoff_base=config.retry_backoff_base,
+            max_delay=config.retry_max_delay,
+        )
+
+    @property
+    def usage(self) -> LLMUsage | None:  # type: ignore[override]
+        return self.inner.usage
+
+    @property
+    def model(self) -> str:  # type: ignore[override]
+        return self.inner.model
+
+    async def _should_retry(self, exc: Exception, attempt: int) -> bool:
+        """Sleep before the next attempt, or return False to give up."""
+        if attempt >= self.max_retries or not is_retryable(exc):
+            return False
+        delay = backoff_delay(
+            attempt, self.backoff_base, self.max_delay, retry_after(exc)
+        )
+        logger.warning(
+            "LLM call failed (%s), retry %d/%d in %.1fs",
+            exc,
+            attempt + 1,
+            self.max_retries,
+            delay,
+        )
+        await asyncio.sleep(delay)
+        return True
+
+    async def generate(self, prompt: str, system_prompt: str = "") -> str:
+        """Generate with retries under the adaptive concurrency limit."""
+        attempt = 0
+        while True:
+            token = await self.limiter.acquire()
+            succeeded = rate_limited = False
+            try:
+                text = await self.inner.generate(prompt, system_prompt=system_prompt)
+                succeeded = True
+                return text
+            except Exception as e:
+                rate_limited = is_rate_limited(e)
+                error = e
+            finally:
+                await self.limiter.release(
+                    token, succeeded=succeeded, rate_limited=rate_limited
+                )
+            if not await self._should_retry(error, attempt):
+                raise error
+            attempt += 1
+
+    async def generate_stream(
+        self, prompt: str, system_prompt: str = ""
+    ) -> AsyncIterator[str]:
+        """Stream with retries until the first piece of text arrives.
+
+        The concurrency slot is held until the stream ends or is closed.
+        """
+        attempt = 0
+        while True:
+            token = await self.limiter.acquire()
+            produced = succeeded = rate_limited = False
+            try:
+                async for piece in self.inner.generate_stream(
+                    prompt, system_prompt=system_prompt
+                ):
+                    produced = True
+                    yield piece
+                succeeded = True
+                return
+            except Exception as e:
+                rate_limited = is_rate_limited(e)
+                if produced:
+                    raise
+                error = e
+            finally:
+                await self.limiter.release(
+                    token, succeeded=succeeded, rate_limited=rate_limited
+                )
+            if not await self._should_retry(error, attempt):
+                raise error
+            attempt += 1
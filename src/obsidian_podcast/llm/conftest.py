@@ -0,0 +1,48 @@
+"""Fixtures shared by the LLM provider tests."""
+
+import pytest
+
+
+@pytest.fixture
+def stub_server():
+    """A local HTTP server standing in for a provider's REST API.
+
+    Tests register handlers in server.routes, keyed by (method, path). A
+    handler receives the raw request body and returns (status, body), where
+    a dict or list body is sent as JSON. server.requests records the
+    (method, path) of every request, and server.base_url is the API root.
+    """
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def _handle(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            path = self.path.split("?")[0]
+            server.requests.append((self.command, path))
+            status, payload = server.routes[(self.command, path)](body)
+            if isinstance(payload, (dict, list)):
+                payload = json.dumps(payload)
+            data = payload.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = _handle
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.routes = {}
+    server.requests = []
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
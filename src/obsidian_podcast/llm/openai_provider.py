@@ -1,10 +1,12 @@
 """OpenAI-compatible LLM provider (also works with Ollama)."""
 
 import os
+from collections.abc import AsyncIterator
 
 import openai
 
 from obsidian_podcast.llm.base import LLMProvider, register_llm_engine
+from obsidian_podcast.llm.client import sdk_client_options
 
 
 @register_llm_engine("openai")
@@ -20,15 +22,21 @@ class OpenAILLMProvider(LLMProvider):
         kwargs: dict = {"api_key": api_key}
         if config.base_url:
             kwargs["base_url"] = config.base_url
+        kwargs.update(sdk_client_options(openai, config))
         self.client = openai.AsyncOpenAI(**kwargs)
         self.model = config.model
 
-    async def generate(self, prompt: str, system_prompt: str = "") -> str:
-        """Generate text using OpenAI-compatible API."""
+    @staticmethod
+    def _messages(prompt: str, system_prompt: str) -> list[dict]:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
+        return messages
+
+    async def generate(self, prompt: str, system_prompt: str = "") -> str:
+        """Generate text using OpenAI-compatible API."""
+        messages = self._messages(prompt, system_prompt)
 
         response = await self.client.chat.completions.create(
             model=self.model,
@@ -37,3 +45,16 @@ class OpenAILLMProvider(LLMProvider):
         if not response.choices:
             return ""
         return response.choices[0].message.content or ""
+
+    async def generate_stream(
+        self, prompt: str, system_prompt: str = ""
+    ) -> AsyncIterator[str]:
+        """Stream content deltas from the chat completions API."""
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=self._messages(prompt, system_prompt),
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
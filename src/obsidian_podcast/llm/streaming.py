@@ -0,0 +1,70 @@
+"""Sentence-level streaming from LLM output into TTS-ready segments."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+
+from obsidian_podcast.llm.tts_prep import sanitize_for_tts
+
+# A sentence ends at Japanese/ASCII terminal punctuation or a line break.
+_SENTENCE_END = re.compile(r"[。！？!?]+|\n")
+
+_CODE_FENCE = "```"
+
+
+class SentenceAccumulator:
+    """Buffers streamed text and releases it in whole sentences.
+
+    Text is released up to the last complete sentence once at least
+    min_chars are available, so TTS segments are not uselessly short. Text
+    inside an unclosed code fence is held back until the fence closes,
+    because sanitize_for_tts removes fenced blocks as a whole.
+    """
+
+    def __init__(self, min_chars: int = 40) -> None:
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Add streamed text; return the segments that are now complete."""
+        self._buffer += text
+        searchable = self._buffer
+        if searchable.count(_CODE_FENCE) % 2:
+            searchable = searchable[: searchable.rindex(_CODE_FENCE)]
+
+        end = 0
+        for match in _SENTENCE_END.finditer(searchable):
+            end = match.end()
+        if end == 0 or end < self.min_chars:
+            return []
+
+        segment, self._buffer = self._buffer[:end], self._buffer[end:]
+        return [segment]
+
+    def flush(self) -> str | None:
+        """Return whatever is left once the stream has ended."""
+        rest, self._buffer = self._buffer, ""
+        return rest if rest.strip() else None
+
+
+async def stream_tts_segments(
+    stream: AsyncIterable[str], min_chars: int = 40
+) -> AsyncIterator[str]:
+    """Turn streamed LLM text into sanitized, TTS-ready segments.
+
+    Each complete group of sentences is passed through sanitize_for_tts as
+    soon as it is available, so the first segment can be synthesized while
+    the LLM is still generating the rest.
+    """
+    accumulator = SentenceAccumulator(min_chars=min_chars)
+    async for piece in stream:
+        for segment in accumulator.feed(piece):
+            sanitized = sanitize_for_tts(segment)
+            if sanitized:
+                yield sanitized
+    rest = accumulator.flush()
+    if rest:
+        sanitized = sanitize_for_tts(rest)
+        if sanitized:
+            yield sanitized
@@ -89,6 +89,150 @@ class TestSplitTextForLLM:
         assert len(result) >= 2
 
 
+def _reference_split(text: str, max_chars: int = 4000) -> list[str]:
+    """The original string-concatenating splitter, kept as a boundary oracle."""
+    if not text or not text.strip():
+        return []
+    if len(text) <= max_chars:
+        return [text]
+    paragraphs = text.split("\n\n")
+    chunks: list[str] = []
+    current_chunk = ""
+    for para in paragraphs:
+        if not para.strip():
+            continue
+        if len(current_chunk) + len(para) + 2 <= max_chars:
+            if current_chunk:
+                current_chunk += "\n\n" + para
+            else:
+                current_chunk = para
+        else:
+            if current_chunk:
+                chunks.append(current_chunk)
+            if len(para) <= max_chars:
+                current_chunk = para
+            else:
+                sentences = (
+                    para.replace("。", "。\n").replace(". ", ".\n").split("\n")
+                )
+                current_chunk = ""
+                for sentence in sentences:
+                    if not sentence.strip():
+                        continue
+                    if len(current_chunk) + len(sentence) + 1 <= max_chars:
+                        if current_chunk:
+                            current_chunk += " " + sentence
+                        else:
+                            current_chunk = sentence
+                    else:
+                        if current_chunk:
+                            chunks.append(current_chunk)
+                        current_chunk = sentence
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+class TestSplitTextForLLMBoundaries:
+    def test_matches_reference_on_random_text(self):
+        import random
+
+        from obsidian_podcast.llm.base import split_text_for_llm
+
+        rng = random.Random(1234)
+        alphabet = ["あ", "い", "a", "b", " ", ".", ". ", "。", "\n", "\n\n", "  "]
+        for _ in range(500):
+            text = "".join(
+                rng.choice(alphabet) * rng.randint(1, 12)
+                for _ in range(rng.randint(0, 80))
+            )
+            for max_chars in (5, 20, 60, 200):
+                assert split_text_for_llm(text, max_chars=max_chars) == (
+                    _reference_split(text, max_chars=max_chars)
+                ), (text, max_chars)
+
+    def test_matches_reference_on_article_like_text(self):
+        from obsidian_podcast.llm.base import split_text_for_llm
+
+        paragraphs = []
+        for i in range(200):
+            sentence = f"これは段落{i}の文です。" if i % 2 else f"Sentence {i}. "
+            paragraphs.append(sentence * (i % 37 + 1))
+        text = "\n\n".join(paragraphs)
+
+        for max_chars in (100, 400, 4000):
+            assert split_text_for_llm(text, max_chars=max_chars) == (
+                _reference_split(text, max_chars=max_chars)
+            )
+
+
+class TestSplitTextForLLMTokens:
+    def test_japanese_chunks_fit_token_budget(self):
+        from obsidian_podcast.llm.base import split_text_for_llm
+        from obsidian_podcast.llm.tokens import approx_token_count
+
+        paragraphs = ["これは日本語の段落です。" * 20 for _ in range(10)]
+        text = "\n\n".join(paragraphs)
+        chunks = split_text_for_llm(text, max_tokens=500)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert approx_token_count(chunk) <= 500
+
+    def test_english_packs_more_per_call_than_char_budget(self):
+        from obsidian_podcast.llm.base import split_text_for_llm
+
+        paragraphs = ["This is an English sentence. " * 20 for _ in range(20)]
+        text = "\n\n".join(paragraphs)
+
+        by_chars = split_text_for_llm(text, max_chars=1000)
+        by_tokens = split_text_for_llm(text, max_tokens=1000)
+
+        assert len(by_tokens) < len(by_chars)
+        assert "".join(by_tokens).replace("\n\n", "") == "".join(
+            by_chars
+        ).replace("\n\n", "")
+
+    def test_custom_counter(self):
+        from obsidian_podcast.llm.base import split_text_for_llm
+
+        def count_words(text):
+            return len(text.split())
+
+        text = "\n\n".join(["one two three"] * 4)
+        chunks = split_text_for_llm(text, max_tokens=6, count_tokens=count_words)
+        assert chunks == ["one two three\n\none two three"] * 2
+
+
+    @pytest.mark.asyncio
+    async def test_token_budget_uses_provider_model_tokenizer(self, monkeypatch):
+        from obsidian_podcast.llm import base
+
+        models = []
+
+        def fake_get_token_counter(model):
+            models.append(model)
+            return lambda text: len(text.split())
+
+        class ModelProvider(base.LLMProvider):
+            model = "gpt-4o"
+
+            async def generate(self, prompt, system_prompt=""):
+                return prompt
+
+        monkeypatch.setattr(base, "get_token_counter", fake_get_token_counter)
+        text = "\n\n".join(["one two three"] * 4)
+
+        await base.generate_podcast_script(text, ModelProvider(), max_chunk_chars=10)
+        assert models == []
+
+        result = await base.generate_podcast_script(
+            text, ModelProvider(), max_chunk_tokens=6
+        )
+        assert models == ["gpt-4o"]
+        assert result == text
+
+
 class TestGeneratePodcastScript:
     @pytest.mark.asyncio
     async def test_converts_text_with_provider(self):
@@ -129,6 +273,77 @@ class TestGeneratePodcastScript:
         assert mock_provider.generate.call_count == 2
 
 
+class TestGeneratePodcastScriptConcurrency:
+    @pytest.mark.asyncio
+    async def test_chunks_run_concurrently_within_limit(self):
+        import asyncio
+
+        from obsidian_podcast.llm.base import generate_podcast_script
+
+        active = 0
+        peak = 0
+
+        async def generate(prompt, system_prompt=""):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return prompt.lower()
+
+        mock_provider = AsyncMock()
+        mock_provider.generate.side_effect = generate
+
+        paragraphs = [chr(ord("A") + i) * 50 for i in range(8)]
+        result = await generate_podcast_script(
+            "\n\n".join(paragraphs),
+            mock_provider,
+            max_chunk_chars=60,
+            max_concurrency=3,
+        )
+
+        assert peak == 3
+        assert result == "\n\n".join(p.lower() for p in paragraphs)
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_when_chunks_finish_out_of_order(self):
+        import asyncio
+
+        from obsidian_podcast.llm.base import generate_podcast_script
+
+        async def generate(prompt, system_prompt=""):
+            # Earlier chunks take longer.
+            await asyncio.sleep(0.01 * (ord("E") - ord(prompt[0])))
+            return prompt[0]
+
+        mock_provider = AsyncMock()
+        mock_provider.generate.side_effect = generate
+
+        text = "\n\n".join(c * 50 for c in "ABCD")
+        result = await generate_podcast_script(
+            text, mock_provider, max_chunk_chars=60
+        )
+        assert result == "A\n\nB\n\nC\n\nD"
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_falls_back_others_succeed(self):
+        from obsidian_podcast.llm.base import generate_podcast_script
+
+        async def generate(prompt, system_prompt=""):
+            if prompt.startswith("B"):
+                raise RuntimeError("API error")
+            return "ok"
+
+        mock_provider = AsyncMock()
+        mock_provider.generate.side_effect = generate
+
+        text = "\n\n".join(c * 50 for c in "ABC")
+        result = await generate_podcast_script(
+            text, mock_provider, max_chunk_chars=60
+        )
+        assert result == "ok\n\n" + "B" * 50 + "\n\nok"
+
+
 class TestGeneratePodcastScriptErrorHandling:
     @pytest.mark.asyncio
     async def test_fallback_to_original_on_provider_error(self):
@@ -143,6 +358,74 @@ class TestGeneratePodcastScriptErrorHandling:
         assert result == "Some article text"
 
 
+class TestStreamPodcastScript:
+    @staticmethod
+    def _provider(generate_stream):
+        from obsidian_podcast.llm.base import LLMProvider
+
+        class StreamingProvider(LLMProvider):
+            async def generate(self, prompt, system_prompt=""):
+                raise NotImplementedError
+
+        provider = StreamingProvider()
+        provider.generate_stream = generate_stream
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_default_generate_stream_yields_full_result(self):
+        from obsidian_podcast.llm.base import LLMProvider
+
+        class OneShot(LLMProvider):
+            async def generate(self, prompt, system_prompt=""):
+                return prompt.upper()
+
+        pieces = [p async for p in OneShot().generate_stream("abc")]
+        assert pieces == ["ABC"]
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks_in_order(self):
+        import asyncio
+
+        from obsidian_podcast.llm.base import stream_podcast_script
+
+        async def generate_stream(prompt, system_prompt=""):
+            # Later chunks finish first; output must still be in order.
+            await asyncio.sleep(0.01 * (ord("D") - ord(prompt[0])))
+            yield prompt[0]
+            yield prompt[0].lower()
+
+        provider = self._provider(generate_stream)
+        text = "\n\n".join(c * 50 for c in "ABC")
+        pieces = [
+            p async for p in stream_podcast_script(text, provider, max_chunk_chars=60)
+        ]
+        assert "".join(pieces) == "Aa\n\nBb\n\nCc"
+        assert pieces[:2] == ["A", "a"]
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_falls_back_to_original(self):
+        from obsidian_podcast.llm.base import stream_podcast_script
+
+        async def generate_stream(prompt, system_prompt=""):
+            if prompt.startswith("B"):
+                raise RuntimeError("API error")
+            yield "ok"
+
+        provider = self._provider(generate_stream)
+        text = "\n\n".join(c * 50 for c in "ABC")
+        pieces = [
+            p async for p in stream_podcast_script(text, provider, max_chunk_chars=60)
+        ]
+        assert "".join(pieces) == "ok\n\n" + "B" * 50 + "\n\nok"
+
+    @pytest.mark.asyncio
+    async def test_empty_text(self):
+        from obsidian_podcast.llm.base import stream_podcast_script
+
+        provider = self._provider(None)
+        assert [p async for p in stream_podcast_script("", provider)] == []
+
+
 class TestSystemPrompt:
     def test_system_prompt_defined(self):
         from obsidian_podcast.llm.base import SYSTEM_PROMPT
@@ -0,0 +1,409 @@
+"""Tests for offline LLM batch execution."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+ARTICLE_A = "最初の段落です。\n\n二番目の段落です。"
+ARTICLE_B = "短い記事。"
+
+
+@pytest.fixture
+def articles(state_db):
+    a = state_db.add_article(url="https://example.com/a", feed_url="f")
+    b = state_db.add_article(url="https://example.com/b", feed_url="f")
+    return {a: ARTICLE_A, b: ARTICLE_B}
+
+
+def _scripted(state_db):
+    return {row["id"]: row["script"] for row in state_db.list_articles("scripted")}
+
+
+class TestClaudeBatch:
+    @pytest.mark.asyncio
+    async def test_submit_poll_and_write_back(self, stub_server, state_db, articles):
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.batch import (
+            ClaudeBatchBackend,
+            collect_batch,
+            create_batch_backend,
+            submit_batch,
+        )
+        from obsidian_podcast.llm.claude import ClaudeLLMProvider
+
+        submitted = []
+        state = {"processing_status": "in_progress"}
+
+        def batch_json():
+            return {
+                "id": "msgbatch_1",
+                "type": "message_batch",
+                "processing_status": state["processing_status"],
+                "request_counts": {
+                    "processing": 0,
+                    "succeeded": 0,
+                    "errored": 0,
+                    "canceled": 0,
+                    "expired": 0,
+                },
+                "created_at": "2026-01-01T00:00:00Z",
+                "expires_at": "2026-01-02T00:00:00Z",
+                "results_url": (
+                    f"{stub_server.base_url}/v1/messages/batches/msgbatch_1/results"
+                ),
+            }
+
+        def create(body):
+            submitted.extend(json.loads(body)["requests"])
+            return 200, batch_json()
+
+        def result_line(request):
+            params = request["params"]
+            prompt = params["messages"][0]["content"]
+            if prompt == ARTICLE_B:
+                result = {
+                    "type": "errored",
+                    "error": {"type": "error", "error": {"type": "api_error"}},
+                }
+            else:
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": "msg",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": params["model"],
+                        "content": [{"type": "text", "text": f"台本:{prompt}"}],
+                        "stop_reason": "end_turn",
+                        "usage": {"input_tokens": 10, "output_tokens": 5},
+                    },
+                }
+            return json.dumps({"custom_id": request["custom_id"], "result": result})
+
+        stub_server.routes = {
+            ("POST", "/v1/messages/batches"): create,
+            ("GET", "/v1/messages/batches/msgbatch_1"): lambda _: (200, batch_json()),
+            ("GET", "/v1/messages/batches/msgbatch_1/results"): lambda _: (
+                200,
+                "\n".join(result_line(request) for request in submitted),
+            ),
+        }
+
+        config = LLMConfig(engine="claude", api_key_env="TEST_KEY")
+        env = {"TEST_KEY": "fake-key", "ANTHROPIC_BASE_URL": stub_server.base_url}
+        with patch.dict("os.environ", env):
+            provider = ClaudeLLMProvider(config)
+        backend = create_batch_backend(provider)
+        assert isinstance(backend, ClaudeBatchBackend)
+
+        batch_id = await submit_batch(state_db, backend, articles, max_chunk_chars=12)
+
+        assert batch_id == "msgbatch_1"
+        assert len(submitted) == 3
+        assert submitted[0]["params"]["system"][0]["cache_control"] == {
+            "type": "ephemeral"
+        }
+        assert await collect_batch(state_db, backend, batch_id) is False
+        assert _scripted(state_db) == {}
+
+        state["processing_status"] = "ended"
+        assert await collect_batch(state_db, backend, batch_id) is True
+
+        a, b = articles
+        assert _scripted(state_db) == {
+            a: "台本:最初の段落です。\n\n台本:二番目の段落です。",
+        }
+        assert [row["id"] for row in state_db.list_articles("pending")] == [b]
+        assert provider.usage.output_tokens == 10
+
+
+class TestOpenAIBatch:
+    @pytest.mark.asyncio
+    async def test_submit_poll_and_write_back(self, stub_server, state_db, articles):
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.batch import (
+            OpenAIBatchBackend,
+            collect_batch,
+            submit_batch,
+        )
+        from obsidian_podcast.llm.openai_provider import OpenAILLMProvider
+
+        lines = []
+        state = {"status": "in_progress"}
+
+        def batch_json():
+            done = state["status"] == "completed"
+            return {
+                "id": "batch_1",
+                "object": "batch",
+                "endpoint": "/v1/chat/completions",
+                "input_file_id": "file-in",
+                "completion_window": "24h",
+                "status": state["status"],
+                "created_at": 0,
+                "output_file_id": "file-out" if done else None,
+                "error_file_id": "file-err" if done else None,
+            }
+
+        def upload(body):
+            lines.extend(
+                json.loads(line)
+                for line in body.decode().splitlines()
+                if line.startswith('{"custom_id"')
+            )
+            return 200, {
+                "id": "file-in",
+                "object": "file",
+                "bytes": len(body),
+                "created_at": 0,
+                "filename": "batch.jsonl",
+                "purpose": "batch",
+                "status": "processed",
+            }
+
+        def output_line(line):
+            prompt = line["body"]["messages"][-1]["content"]
+            message = {"role": "assistant", "content": f"台本:{prompt}"}
+            return json.dumps(
+                {
+                    "custom_id": line["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"index": 0, "message": message}]},
+                    },
+                    "error": None,
+                }
+            )
+
+        def error_line(line):
+            return json.dumps(
+                {
+                    "custom_id": line["custom_id"],
+                    "response": {"status_code": 500, "body": {"error": "boom"}},
+                    "error": None,
+                }
+            )
+
+        stub_server.routes = {
+            ("POST", "/v1/files"): upload,
+            ("POST", "/v1/batches"): lambda _: (200, batch_json()),
+            ("GET", "/v1/batches/batch_1"): lambda _: (200, batch_json()),
+            ("GET", "/v1/files/file-out/content"): lambda _: (
+                200,
+                "\n".join(output_line(line) for line in lines[:2]),
+            ),
+            ("GET", "/v1/files/file-err/content"): lambda _: (
+                200,
+                error_line(lines[2]),
+            ),
+        }
+
+        config = LLMConfig(
+            engine="openai", model="gpt-4o-mini", base_url=f"{stub_server.base_url}/v1"
+        )
+        backend = OpenAIBatchBackend(OpenAILLMProvider(config))
+
+        batch_id = await submit_batch(state_db, backend, articles, max_chunk_chars=12)
+
+        assert batch_id == "batch_1"
+        assert [line["url"] for line in lines] == ["/v1/chat/completions"] * 3
+        assert lines[0]["body"]["model"] == "gpt-4o-mini"
+        assert await collect_batch(state_db, backend, batch_id) is False
+
+        state["status"] = "completed"
+        assert await collect_batch(state_db, backend, batch_id) is True
+
+        a, b = articles
+        assert _scripted(state_db) == {
+            a: "台本:最初の段落です。\n\n台本:二番目の段落です。",
+        }
+        assert [row["id"] for row in state_db.list_articles("pending")] == [b]
+        assert state_db.get_llm_batch_items(batch_id)[2]["error_message"]
+
+    def test_ollama_base_url_uses_local_backend(self):
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.batch import (
+            LocalBatchBackend,
+            OpenAIBatchBackend,
+            create_batch_backend,
+        )
+        from obsidian_podcast.llm.openai_provider import OpenAILLMProvider
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "fake-key"}):
+            openai_provider = OpenAILLMProvider(
+                LLMConfig(engine="openai", api_key_env="OPENAI_API_KEY")
+            )
+        ollama = OpenAILLMProvider(
+            LLMConfig(engine="openai", base_url="http://localhost:11434/v1")
+        )
+
+        assert isinstance(create_batch_backend(openai_provider), OpenAIBatchBackend)
+        assert isinstance(create_batch_backend(ollama), LocalBatchBackend)
+
+
+class TestLocalBatch:
+    @pytest.mark.asyncio
+    async def test_run_batch_scripts_articles(self, state_db, articles):
+        from obsidian_podcast.llm.base import LLMProvider
+        from obsidian_podcast.llm.batch import LocalBatchBackend, run_batch
+
+        class FakeProvider(LLMProvider):
+            async def generate(self, prompt, system_prompt=""):
+                if prompt == ARTICLE_B:
+                    raise RuntimeError("down")
+                return f"台本:{prompt}"
+
+        backend = LocalBatchBackend(FakeProvider(), max_concurrency=2)
+
+        batch_id = await run_batch(
+            state_db, backend, articles, poll_interval=0, max_chunk_chars=12
+        )
+
+        a, b = articles
+        assert _scripted(state_db) == {
+            a: "台本:最初の段落です。\n\n台本:二番目の段落です。",
+        }
+        assert [row["id"] for row in state_db.list_articles("pending")] == [b]
+        assert state_db.list_llm_batches(status="completed")[0]["id"] == batch_id
+
+    @pytest.mark.asyncio
+    async def test_batch_from_earlier_process_is_requeued(self, state_db, articles):
+        from obsidian_podcast.llm.base import LLMProvider
+        from obsidian_podcast.llm.batch import (
+            LocalBatchBackend,
+            poll_batches,
+            submit_batch,
+        )
+
+        class SlowProvider(LLMProvider):
+            async def generate(self, prompt, system_prompt=""):
+                return prompt
+
+        await submit_batch(state_db, LocalBatchBackend(SlowProvider()), articles)
+
+        assert await poll_batches(state_db, LocalBatchBackend(SlowProvider())) == 1
+        assert len(state_db.list_articles(status="pending")) == 2
+        assert state_db.list_llm_batches(status="failed")
+
+    @pytest.mark.asyncio
+    async def test_empty_article_is_scripted_without_submitting(
+        self, state_db, articles
+    ):
+        from obsidian_podcast.llm.base import LLMProvider
+        from obsidian_podcast.llm.batch import LocalBatchBackend, submit_batch
+
+        class UnusedProvider(LLMProvider):
+            async def generate(self, prompt, system_prompt=""):
+                raise AssertionError("should not be called")
+
+        a, _ = articles
+        backend = LocalBatchBackend(UnusedProvider())
+
+        assert await submit_batch(state_db, backend, {a: ""}) is None
+        assert _scripted(state_db) == {a: ""}
+
+    @pytest.mark.asyncio
+    async def test_article_with_only_failed_chunks_is_requeued(
+        self, state_db, articles
+    ):
+        from obsidian_podcast.llm.base import LLMProvider
+        from obsidian_podcast.llm.batch import LocalBatchBackend, run_batch
+
+        class DownProvider(LLMProvider):
+            async def generate(self, prompt, system_prompt=""):
+                raise RuntimeError("down")
+
+        await run_batch(
+            state_db, LocalBatchBackend(DownProvider()), articles, poll_interval=0
+        )
+
+        assert _scripted(state_db) == {}
+        rows = state_db.list_articles(status="pending")
+        assert len(rows) == 2
+        assert all(row["lease_owner"] is None for row in rows)
+        assert all("no output" in row["error_message"] for row in rows)
+
+
+class TestSubmitChunking:
+    @pytest.mark.asyncio
+    async def test_token_budget_uses_provider_model_tokenizer(
+        self, monkeypatch, state_db, articles
+    ):
+        from obsidian_podcast.llm import base, batch
+        from obsidian_podcast.llm.batch import LocalBatchBackend, submit_batch
+
+        models = []
+
+        def fake_get_token_counter(model):
+            models.append(model)
+            return len
+
+        class ModelProvider(base.LLMProvider):
+            model = "gpt-4o-mini"
+
+            async def generate(self, prompt, system_prompt=""):
+                return prompt
+
+        monkeypatch.setattr(batch, "get_token_counter", fake_get_token_counter)
+        backend = LocalBatchBackend(ModelProvider())
+
+        batch_id = await submit_batch(state_db, backend, articles, max_chunk_tokens=12)
+
+        assert models == ["gpt-4o-mini"]
+        assert len(state_db.get_llm_batch_items(batch_id)) == 3
+
+
+class TestSubmitLeasing:
+    class EchoBackend:
+        """Records submitted batches; never runs them."""
+
+        engine = "echo"
+
+        def __init__(self, fail=False):
+            self.fail = fail
+            self.batches = []
+
+        async def submit(self, requests):
+            if self.fail:
+                raise RuntimeError("submit failed")
+            self.batches.append(requests)
+            return f"echo-{len(self.batches)}"
+
+    @pytest.mark.asyncio
+    async def test_submitting_twice_creates_one_batch(self, state_db, articles):
+        from obsidian_podcast.llm.batch import submit_batch
+
+        backend = self.EchoBackend()
+
+        assert await submit_batch(state_db, backend, articles) == "echo-1"
+        assert await submit_batch(state_db, backend, articles) is None
+        assert len(backend.batches) == 1
+        assert [b["id"] for b in state_db.list_llm_batches("echo")] == ["echo-1"]
+
+    @pytest.mark.asyncio
+    async def test_article_claimed_by_worker_is_skipped(self, state_db, articles):
+        from obsidian_podcast.llm.batch import submit_batch
+
+        a, b = articles
+        (claimed,) = state_db.claim_articles("w1", limit=1)
+        assert claimed["id"] == a
+        backend = self.EchoBackend()
+
+        await submit_batch(state_db, backend, articles)
+
+        (requests,) = backend.batches
+        assert {request.custom_id for request in requests} == {f"article-{b}-0"}
+        assert state_db.heartbeat("w1", [a]) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_submit_releases_articles(self, state_db, articles):
+        from obsidian_podcast.llm.batch import submit_batch
+
+        with pytest.raises(RuntimeError):
+            await submit_batch(state_db, self.EchoBackend(fail=True), articles)
+
+        rows = state_db.list_articles(status="pending")
+        assert len(rows) == 2
+        assert all(row["attempts"] == 0 for row in rows)
+        assert all(row["lease_owner"] is None for row in rows)
@@ -0,0 +1,181 @@
+"""Tests for the content-addressed LLM response cache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from obsidian_podcast.llm.cache import LLMResponseCache
+
+    cache = LLMResponseCache(tmp_path / "llm_cache.db")
+    yield cache
+    cache.close()
+
+
+class TestCacheKey:
+    def test_depends_on_every_part(self):
+        from obsidian_podcast.llm.cache import cache_key
+
+        base = cache_key("claude", "m", "sys", "chunk")
+        assert base == cache_key("claude", "m", "sys", "chunk")
+        assert base != cache_key("openai", "m", "sys", "chunk")
+        assert base != cache_key("claude", "m2", "sys", "chunk")
+        assert base != cache_key("claude", "m", "sys2", "chunk")
+        assert base != cache_key("claude", "m", "sys", "chunk2")
+
+    def test_parts_are_not_ambiguous(self):
+        from obsidian_podcast.llm.cache import cache_key
+
+        assert cache_key("a", "bc", "", "") != cache_key("ab", "c", "", "")
+
+
+class TestLLMResponseCache:
+    def test_get_missing_returns_none(self, cache):
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_put_and_get_roundtrip(self, cache):
+        cache.put("k", "台本テキスト")
+        assert cache.get("k") == "台本テキスト"
+        assert cache.hits == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        from obsidian_podcast.llm.cache import LLMResponseCache
+
+        path = tmp_path / "llm_cache.db"
+        first = LLMResponseCache(path)
+        first.put("k", "value")
+        first.close()
+
+        second = LLMResponseCache(path)
+        assert second.get("k") == "value"
+        assert second.total_bytes > 0
+        second.close()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        import os
+
+        from obsidian_podcast.llm.cache import LLMResponseCache
+
+        # Random payloads compress to roughly the same size each.
+        payloads = {k: os.urandom(300).hex() for k in "abc"}
+        cache = LLMResponseCache(tmp_path / "c.db")
+        cache.put("a", payloads["a"])
+        cache.max_bytes = int(cache.total_bytes * 2.5)
+        cache.put("b", payloads["b"])
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", payloads["c"])
+
+        assert cache.total_bytes <= cache.max_bytes
+        assert cache.get("b") is None
+        assert cache.get("a") == payloads["a"]
+        assert cache.get("c") == payloads["c"]
+        cache.close()
+
+
+class TestCachedLLMProvider:
+    @pytest.mark.asyncio
+    async def test_second_run_does_not_call_llm(self, cache):
+        from obsidian_podcast.llm.base import generate_podcast_script
+        from obsidian_podcast.llm.cache import CachedLLMProvider
+
+        inner = AsyncMock()
+        inner.generate.side_effect = lambda prompt, system_prompt="": prompt.lower()
+        provider = CachedLLMProvider(inner, cache, "openai", "qwen2.5")
+
+        text = "\n\n".join(c * 50 for c in "ABC")
+        first = await generate_podcast_script(text, provider, max_chunk_chars=60)
+        second = await generate_podcast_script(text, provider, max_chunk_chars=60)
+
+        assert first == second
+        assert inner.generate.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_different_model_misses(self, cache):
+        from obsidian_podcast.llm.cache import CachedLLMProvider
+
+        inner = AsyncMock()
+        inner.generate.return_value = "out"
+        await CachedLLMProvider(inner, cache, "openai", "a").generate("p", "s")
+        await CachedLLMProvider(inner, cache, "openai", "b").generate("p", "s")
+        assert inner.generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, cache):
+        from obsidian_podcast.llm.cache import CachedLLMProvider
+
+        inner = AsyncMock()
+        inner.generate.side_effect = [RuntimeError("API error"), "ok"]
+        provider = CachedLLMProvider(inner, cache, "openai", "m")
+
+        with pytest.raises(RuntimeError):
+            await provider.generate("p")
+        assert await provider.generate("p") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_caches_completed_stream(self, cache):
+        from obsidian_podcast.llm.base import LLMProvider
+        from obsidian_podcast.llm.cache import CachedLLMProvider
+
+        class Streaming(LLMProvider):
+            calls = 0
+
+            async def generate(self, prompt, system_prompt=""):
+                raise NotImplementedError
+
+            async def generate_stream(self, prompt, system_prompt=""):
+                Streaming.calls += 1
+                yield "part1"
+                yield "part2"
+
+        provider = CachedLLMProvider(Streaming(), cache, "openai", "m")
+        first = [p async for p in provider.generate_stream("p")]
+        second = [p async for p in provider.generate_stream("p")]
+
+        assert first == ["part1", "part2"]
+        assert second == ["part1part2"]
+        assert Streaming.calls == 1
+
+
+class TestCreateLLMEngineWithCache:
+    def test_wraps_registered_provider(self, cache, monkeypatch):
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.base import LLMProvider, create_llm_engine
+        from obsidian_podcast.llm.cache import CachedLLMProvider
+
+        class StubProvider(LLMProvider):
+            def __init__(self, config) -> None:
+                pass
+
+            async def generate(self, prompt: str, system_prompt: str = "") -> str:
+                return prompt
+
+        monkeypatch.setattr(
+            "obsidian_podcast.llm.base._registry", {"stub": StubProvider}
+        )
+        config = LLMConfig(engine="stub", model="m")
+
+        provider = create_llm_engine(config, cache=cache)
+        assert isinstance(provider, CachedLLMProvider)
+        assert isinstance(provider.inner, StubProvider)
+        assert isinstance(create_llm_engine(config), StubProvider)
+
+
+class TestOpenLLMCache:
+    def test_disabled(self, tmp_path):
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.cache import open_llm_cache
+
+        config = LLMConfig(cache_enabled=False)
+        assert open_llm_cache(config, tmp_path) is None
+
+    def test_default_path(self, tmp_path):
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.cache import open_llm_cache
+
+        cache = open_llm_cache(LLMConfig(cache_max_mb=1), tmp_path / "data")
+        assert cache.path == tmp_path / "data" / "llm_cache.db"
+        assert cache.max_bytes == 1024 * 1024
+        cache.close()
@@ -39,10 +39,40 @@ class TestClaudeLLMProvider:
             mock_client.messages.create.assert_called_once_with(
                 model="claude-sonnet-4-20250514",
                 max_tokens=4096,
-                system="sys",
+                system=[
+                    {
+                        "type": "text",
+                        "text": "sys",
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
                 messages=[{"role": "user", "content": "test prompt"}],
             )
 
+    @pytest.mark.asyncio
+    async def test_prompt_cache_disabled_sends_plain_system(self):
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="ok")]
+
+        mock_client = AsyncMock()
+        mock_client.messages.create.return_value = mock_response
+
+        with patch("obsidian_podcast.llm.claude.anthropic") as mock_anthropic:
+            mock_anthropic.AsyncAnthropic.return_value = mock_client
+
+            from obsidian_podcast.llm.claude import ClaudeLLMProvider
+
+            config = MagicMock()
+            config.api_key_env = ""
+            config.model = "claude-sonnet-4-20250514"
+            config.prompt_cache = False
+
+            provider = ClaudeLLMProvider(config)
+            await provider.generate("test", system_prompt="sys")
+
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["system"] == "sys"
+
     @pytest.mark.asyncio
     async def test_generate_returns_empty_on_no_content(self):
         mock_response = MagicMock()
@@ -64,3 +94,117 @@ class TestClaudeLLMProvider:
             result = await provider.generate("test")
 
             assert result == ""
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_yields_text_deltas(self):
+        class FakeStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            @property
+            async def text_stream(self):
+                for text in ["こんにちは", "。"]:
+                    yield text
+
+            async def get_final_message(self):
+                return MagicMock(
+                    usage=MagicMock(
+                        input_tokens=5,
+                        output_tokens=2,
+                        cache_creation_input_tokens=0,
+                        cache_read_input_tokens=900,
+                    )
+                )
+
+        mock_client = MagicMock()
+        mock_client.messages.stream.return_value = FakeStream()
+
+        with patch("obsidian_podcast.llm.claude.anthropic") as mock_anthropic:
+            mock_anthropic.AsyncAnthropic.return_value = mock_client
+
+            from obsidian_podcast.llm.claude import ClaudeLLMProvider
+
+            config = MagicMock()
+            config.api_key_env = ""
+            config.model = "claude-sonnet-4-20250514"
+
+            provider = ClaudeLLMProvider(config)
+            pieces = [p async for p in provider.generate_stream("test", "sys")]
+
+        assert pieces == ["こんにちは", "。"]
+        kwargs = mock_client.messages.stream.call_args.kwargs
+        assert kwargs["system"][0]["text"] == "sys"
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["messages"] == [{"role": "user", "content": "test"}]
+        assert provider.usage.cache_read_input_tokens == 900
+        assert provider.usage.output_tokens == 2
+
+
+def _message_json(text: str, cache_creation: int, cache_read: int) -> dict:
+    return {
+        "id": "msg_test",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-sonnet-4-20250514",
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": 50,
+            "output_tokens": 20,
+            "cache_creation_input_tokens": cache_creation,
+            "cache_read_input_tokens": cache_read,
+        },
+    }
+
+
+class TestPromptCachingAgainstMockAPI:
+    @pytest.mark.asyncio
+    async def test_cache_control_sent_and_usage_accumulated(self, stub_server):
+        import json
+
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.claude import ClaudeLLMProvider
+        from obsidian_podcast.metrics import MetricsCollector
+
+        bodies = []
+        responses = [_message_json("一", 1200, 0), _message_json("二", 0, 1200)]
+
+        def create(body):
+            bodies.append(json.loads(body))
+            return 200, responses.pop(0)
+
+        stub_server.routes = {("POST", "/v1/messages"): create}
+        config = LLMConfig(engine="claude", api_key_env="TEST_KEY")
+        env = {"TEST_KEY": "fake-key", "ANTHROPIC_BASE_URL": stub_server.base_url}
+        with patch.dict("os.environ", env):
+            provider = ClaudeLLMProvider(config)
+
+        first = await provider.generate("chunk 1", system_prompt="SYSTEM")
+        second = await provider.generate("chunk 2", system_prompt="SYSTEM")
+
+        assert (first, second) == ("一", "二")
+        assert stub_server.requests == [("POST", "/v1/messages")] * 2
+        for body in bodies:
+            assert body["system"] == [
+                {
+                    "type": "text",
+                    "text": "SYSTEM",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+
+        usage = provider.usage
+        assert usage.requests == 2
+        assert usage.input_tokens == 100
+        assert usage.output_tokens == 40
+        assert usage.cache_creation_input_tokens == 1200
+        assert usage.cache_read_input_tokens == 1200
+
+        metrics = MetricsCollector()
+        metrics.add_counters(usage.counters())
+        assert metrics.counters["llm_cache_read_input_tokens_total"] == 1200
+        assert metrics.counters["llm_requests_total"] == 2
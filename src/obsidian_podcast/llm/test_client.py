@@ -0,0 +1,251 @@
+"""Tests for the retrying, adaptive-concurrency LLM client wrapper."""
+
+import asyncio
+
+import httpx
+import pytest
+
+
+def _rate_limit_error(headers=None):
+    import openai
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers=headers or {}, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def _bad_request_error():
+    import openai
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(400, request=request)
+    return openai.BadRequestError("bad request", response=response, body=None)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of waiting."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("obsidian_podcast.llm.client.asyncio.sleep", fake_sleep)
+    return delays
+
+
+def _flaky_provider(errors):
+    """A provider that raises the queued errors, then echoes the prompt."""
+    from obsidian_podcast.llm.base import LLMProvider
+
+    class FlakyProvider(LLMProvider):
+        def __init__(self) -> None:
+            self.errors = list(errors)
+            self.calls = 0
+
+        async def generate(self, prompt: str, system_prompt: str = "") -> str:
+            self.calls += 1
+            if self.errors:
+                raise self.errors.pop(0)
+            return prompt
+
+    return FlakyProvider()
+
+
+class TestRetryHelpers:
+    def test_classifies_errors(self):
+        from obsidian_podcast.llm.client import is_rate_limited, is_retryable
+
+        assert is_rate_limited(_rate_limit_error())
+        assert is_retryable(_rate_limit_error())
+        assert not is_retryable(_bad_request_error())
+        assert not is_retryable(ValueError("x"))
+
+    def test_retry_after_formats(self):
+        from obsidian_podcast.llm.client import retry_after
+
+        assert retry_after(_rate_limit_error({"retry-after": "7"})) == 7.0
+        assert retry_after(_rate_limit_error({"retry-after-ms": "1500"})) == 1.5
+        date = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert retry_after(_rate_limit_error({"retry-after": date})) == 0.0
+        assert retry_after(_rate_limit_error()) is None
+
+    def test_backoff_never_shorter_than_server_delay(self):
+        from obsidian_podcast.llm.client import backoff_delay
+
+        for attempt in range(5):
+            assert 0 <= backoff_delay(attempt, 1.0, 4.0) <= 4.0
+            assert backoff_delay(attempt, 1.0, 4.0, server_delay=30.0) == 30.0
+
+
+class TestAdaptiveLimiter:
+    @pytest.mark.asyncio
+    async def test_burst_of_rate_limits_halves_once(self):
+        from obsidian_podcast.llm.client import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial=8)
+        tokens = [await limiter.acquire() for _ in range(4)]
+        for token in tokens:
+            await limiter.release(token, rate_limited=True)
+
+        assert limiter.limit == 4
+        token = await limiter.acquire()
+        await limiter.release(token, rate_limited=True)
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_successes_ramp_up_to_max(self):
+        from obsidian_podcast.llm.client import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial=1, max_limit=3)
+        for _ in range(20):
+            await limiter.release(await limiter.acquire(), succeeded=True)
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_never_below_min_limit(self):
+        from obsidian_podcast.llm.client import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial=2, min_limit=1)
+        for _ in range(5):
+            await limiter.release(await limiter.acquire(), rate_limited=True)
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_caps_calls_in_flight(self):
+        from obsidian_podcast.llm.client import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            token = await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            await limiter.release(token, succeeded=True)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+
+class TestResilientLLMProvider:
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_honoring_retry_after(self, sleeps):
+        from obsidian_podcast.llm.client import AdaptiveLimiter, ResilientLLMProvider
+
+        inner = _flaky_provider([_rate_limit_error({"retry-after": "12"})])
+        limiter = AdaptiveLimiter(initial=4)
+        provider = ResilientLLMProvider(inner, limiter, max_retries=2)
+
+        assert await provider.generate("hi") == "hi"
+        assert inner.calls == 2
+        assert sleeps == [12.0]
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, sleeps):
+        from obsidian_podcast.llm.client import ResilientLLMProvider
+
+        inner = _flaky_provider([_rate_limit_error() for _ in range(5)])
+        provider = ResilientLLMProvider(inner, max_retries=2)
+
+        with pytest.raises(Exception, match="rate limited"):
+            await provider.generate("hi")
+        assert inner.calls == 3
+        assert len(sleeps) == 2
+        assert provider.limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raises_immediately(self, sleeps):
+        from obsidian_podcast.llm.client import ResilientLLMProvider
+
+        inner = _flaky_provider([_bad_request_error()])
+        provider = ResilientLLMProvider(inner, max_retries=3)
+
+        with pytest.raises(Exception, match="bad request"):
+            await provider.generate("hi")
+        assert inner.calls == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_only_before_first_piece(self, sleeps):
+        from obsidian_podcast.llm.base import LLMProvider
+        from obsidian_podcast.llm.client import ResilientLLMProvider
+
+        class StreamProvider(LLMProvider):
+            def __init__(self, fail_after):
+                self.fail_after = list(fail_after)
+
+            async def generate(self, prompt, system_prompt=""):
+                return prompt
+
+            async def generate_stream(self, prompt, system_prompt=""):
+                fail_after = self.fail_after.pop(0)
+                for i, piece in enumerate(["a", "b"]):
+                    if i == fail_after:
+                        raise _rate_limit_error()
+                    yield piece
+
+        provider = ResilientLLMProvider(StreamProvider([0, None]), max_retries=1)
+        assert [p async for p in provider.generate_stream("x")] == ["a", "b"]
+        assert len(sleeps) == 1
+
+        provider = ResilientLLMProvider(StreamProvider([1, None]), max_retries=1)
+        pieces = []
+        with pytest.raises(Exception, match="rate limited"):
+            async for piece in provider.generate_stream("x"):
+                pieces.append(piece)
+        assert pieces == ["a"]
+        assert provider.limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_podcast_script_survives_transient_errors(self, sleeps):
+        from obsidian_podcast.llm.base import generate_podcast_script
+        from obsidian_podcast.llm.client import ResilientLLMProvider
+
+        inner = _flaky_provider([_rate_limit_error(), _rate_limit_error()])
+        provider = ResilientLLMProvider(inner, max_retries=3)
+
+        text = "段落一。\n\n段落二。"
+        result = await generate_podcast_script(text, provider, max_chunk_chars=6)
+        assert result == text
+        assert inner.calls == 4
+
+
+class TestConfigWiring:
+    def test_create_llm_engine_resilient(self, monkeypatch):
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.base import create_llm_engine
+        from obsidian_podcast.llm.client import ResilientLLMProvider
+
+        inner = _flaky_provider([])
+        inner.model = "stub-model"
+        monkeypatch.setattr(
+            "obsidian_podcast.llm.base._registry", {"stub": lambda config: inner}
+        )
+        config = LLMConfig(engine="stub", max_concurrency=6, max_retries=5)
+
+        provider = create_llm_engine(config, resilient=True)
+
+        assert isinstance(provider, ResilientLLMProvider)
+        assert provider.inner is inner
+        assert provider.model == "stub-model"
+        assert provider.max_retries == 5
+        assert provider.limiter.limit == 6
+
+    def test_sdk_client_options_apply_pool_limits(self):
+        import openai
+
+        from obsidian_podcast.config import LLMConfig
+        from obsidian_podcast.llm.client import sdk_client_options
+
+        config = LLMConfig(timeout=30.0, max_connections=5)
+        options = sdk_client_options(openai, config)
+
+        assert options["timeout"] == 30.0
+        assert isinstance(options["http_client"], openai.DefaultAsyncHttpxClient)
+        pool = options["http_client"]._transport._pool
+        assert pool._max_connections == 5
@@ -63,6 +63,8 @@ class TestOpenAILLMProvider:
             mock_openai.AsyncOpenAI.assert_called_once_with(
                 api_key="ollama",
                 base_url="http://localhost:11434/v1",
+                timeout=config.timeout,
+                http_client=mock_openai.DefaultAsyncHttpxClient.return_value,
             )
 
     @pytest.mark.asyncio
@@ -129,3 +131,35 @@ class TestOpenAILLMProvider:
             result = await provider.generate("test")
 
             assert result == ""
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_yields_deltas(self):
+        def chunk(content):
+            c = MagicMock()
+            c.choices = [MagicMock()]
+            c.choices[0].delta.content = content
+            return c
+
+        async def fake_stream():
+            for content in ["台本", None, "です。"]:
+                yield chunk(content)
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create.return_value = fake_stream()
+
+        with patch("obsidian_podcast.llm.openai_provider.openai") as mock_openai:
+            mock_openai.AsyncOpenAI.return_value = mock_client
+
+            from obsidian_podcast.llm.openai_provider import OpenAILLMProvider
+
+            config = MagicMock()
+            config.api_key_env = ""
+            config.base_url = None
+            config.model = "qwen2.5"
+
+            provider = OpenAILLMProvider(config)
+            pieces = [p async for p in provider.generate_stream("test")]
+
+        assert pieces == ["台本", "です。"]
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
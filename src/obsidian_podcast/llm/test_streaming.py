@@ -0,0 +1,59 @@
+"""Tests for streaming LLM output into TTS segments."""
+
+import pytest
+
+
+async def _agen(pieces):
+    for piece in pieces:
+        yield piece
+
+
+class TestSentenceAccumulator:
+    def test_releases_complete_sentences_only(self):
+        from obsidian_podcast.llm.streaming import SentenceAccumulator
+
+        acc = SentenceAccumulator(min_chars=1)
+        assert acc.feed("こんにちは。今日") == ["こんにちは。"]
+        assert acc.feed("は晴れ") == []
+        assert acc.feed("です。") == ["今日は晴れです。"]
+        assert acc.flush() is None
+
+    def test_waits_for_min_chars(self):
+        from obsidian_podcast.llm.streaming import SentenceAccumulator
+
+        acc = SentenceAccumulator(min_chars=10)
+        assert acc.feed("短い。") == []
+        assert acc.feed("もう少し長い文です。") == ["短い。もう少し長い文です。"]
+
+    def test_newline_and_exclamation_are_boundaries(self):
+        from obsidian_podcast.llm.streaming import SentenceAccumulator
+
+        acc = SentenceAccumulator(min_chars=1)
+        assert acc.feed("## 見出し\n本文") == ["## 見出し\n"]
+        assert acc.feed("です！次") == ["本文です！"]
+        assert acc.flush() == "次"
+
+    def test_holds_unclosed_code_fence(self):
+        from obsidian_podcast.llm.streaming import SentenceAccumulator
+
+        acc = SentenceAccumulator(min_chars=1)
+        assert acc.feed("前置き。```js\nconst a = 1;\n") == ["前置き。"]
+        assert acc.feed("more\n") == []
+        assert acc.feed("```\n後書き。") == ["```js\nconst a = 1;\nmore\n```\n後書き。"]
+
+
+class TestStreamTTSSegments:
+    @pytest.mark.asyncio
+    async def test_yields_sanitized_segments(self):
+        from obsidian_podcast.llm.streaming import stream_tts_segments
+
+        pieces = ["すごい！", "Reactの", "話です。", "```\ncode\n```", "最後"]
+        segments = [
+            s async for s in stream_tts_segments(_agen(pieces), min_chars=1)
+        ]
+
+        assert segments[0] == "すごい"
+        assert "React" not in segments[1]
+        assert "話です。" in segments[1]
+        assert all("`" not in s and "code" not in s for s in segments)
+        assert segments[-1] == "最後"
@@ -0,0 +1,50 @@
+"""Tests for token counting used in LLM chunk sizing."""
+
+
+class TestApproxTokenCount:
+    def test_empty(self):
+        from obsidian_podcast.llm.tokens import approx_token_count
+
+        assert approx_token_count("") == 0
+
+    def test_english_about_four_chars_per_token(self):
+        from obsidian_podcast.llm.tokens import approx_token_count
+
+        assert approx_token_count("abcd" * 100) == 100
+        assert approx_token_count("abcde") == 2
+
+    def test_japanese_one_token_per_char(self):
+        from obsidian_podcast.llm.tokens import approx_token_count
+
+        assert approx_token_count("これは日本語です。") == 9
+
+    def test_mixed(self):
+        from obsidian_podcast.llm.tokens import approx_token_count
+
+        assert approx_token_count("Reactは便利") == 2 + 3
+
+
+class TestGetTokenCounter:
+    def test_unknown_model_falls_back_to_approx(self):
+        from obsidian_podcast.llm.tokens import approx_token_count, get_token_counter
+
+        assert get_token_counter("qwen2.5") is approx_token_count
+
+    def test_without_tiktoken(self, monkeypatch):
+        import builtins
+
+        from obsidian_podcast.llm.tokens import approx_token_count, get_token_counter
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "tiktoken":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        get_token_counter.cache_clear()
+        try:
+            assert get_token_counter("gpt-4o") is approx_token_count
+        finally:
+            get_token_counter.cache_clear()
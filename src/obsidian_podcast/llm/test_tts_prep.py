@@ -162,3 +162,165 @@ class TestSanitizeForTTS:
         text = "これは日本語だけのテキストです。"
         result = sanitize_for_tts(text)
         assert "これは日本語だけのテキストです" in result
+
+
+def _reference_sanitize(text: str) -> str:
+    """The original multi-pass sanitizer, kept as an output oracle."""
+    import re
+    import unicodedata
+
+    from obsidian_podcast.llm.tts_prep import english_to_katakana
+
+    if not text:
+        return ""
+    text = re.sub(r"```[\s\S]*?```", "", text)
+    text = text.replace("`", "")
+    text = re.sub(r"^#{1,6}\s*", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\*+", "", text)
+    text = text.replace("！", "").replace("!", "")
+    text = text.replace("？", "").replace("?", "")
+    text = "".join(c for c in text if unicodedata.category(c) not in ("So", "Sk"))
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    text = text.strip()
+    text = english_to_katakana(text)
+    text = re.sub(r"(?<![0-9])\.(?![0-9])", "", text)
+    text = re.sub(r"。(?!\n)", "。\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+class TestSanitizeForTTSEquivalence:
+    ALPHABET = [
+        "`", "```", "#", "## ", "*", "**", "!", "！", "?", "？", "😀", "✨", "^",
+        "\n", "\n\n", " ", "\t", "　", ".", "..", "。", "3", "14", "ab",
+        "Hello", "Next", "です", "見出し", "-",
+    ]  # fmt: skip
+
+    def test_matches_reference_on_random_text(self):
+        import random
+
+        from obsidian_podcast.llm.tts_prep import sanitize_for_tts
+
+        rng = random.Random(4321)
+        for _ in range(3000):
+            text = "".join(
+                rng.choice(self.ALPHABET) for _ in range(rng.randint(0, 40))
+            )
+            assert sanitize_for_tts(text) == _reference_sanitize(text), repr(text)
+
+    def test_matches_reference_on_markdown_script(self):
+        from obsidian_podcast.llm.tts_prep import sanitize_for_tts
+
+        text = (
+            "# 今日のニュース 🎉\n\n"
+            "**Next.js** 15 がリリースされました！バージョン3.14。\n\n\n\n"
+            "```ts\nconst x = 1;\n```\n"
+            "`npm` で入れます。。.\nどう思いますか？ ^_^ Thank you...\n"
+        ) * 50
+        assert sanitize_for_tts(text) == _reference_sanitize(text)
+
+    def test_remove_tts_unsafe_chars_unchanged(self):
+        from obsidian_podcast.llm.tts_prep import remove_tts_unsafe_chars
+
+        text = "## 見出し\n\n\n**太字** `code` 😴 すごい！  本当？\t\tです\n"
+        assert remove_tts_unsafe_chars(text) == "見出し\n\n太字 code すごい 本当 です"
+
+
+def _reference_phonetic(word: str) -> str:
+    """The original pattern-by-pattern fallback, kept as an output oracle."""
+    from obsidian_podcast.llm.tts_prep import _PHONETIC_MAP
+
+    lower = word.lower()
+    result = []
+    i = 0
+    while i < len(lower):
+        for pattern, kana in _PHONETIC_MAP:
+            if lower[i:].startswith(pattern):
+                result.append(kana)
+                i += len(pattern)
+                break
+        else:
+            result.append(lower[i])
+            i += 1
+    return "".join(result)
+
+
+class TestPhoneticFallback:
+    def test_matches_reference_on_random_words(self):
+        import random
+
+        from obsidian_podcast.llm.tts_prep import _phonetic_fallback
+
+        rng = random.Random(1234)
+        letters = "abcdefghijklmnopqrstuvwxyzTIONGHCK"
+        for _ in range(3000):
+            word = "".join(
+                rng.choice(letters) for _ in range(rng.randint(1, 15))
+            )
+            assert _phonetic_fallback(word) == _reference_phonetic(word), word
+
+    def test_known_words(self):
+        from obsidian_podcast.llm.tts_prep import _phonetic_fallback
+
+        for word in ("station", "vision", "night", "Thought", "quick", "q"):
+            assert _phonetic_fallback(word) == _reference_phonetic(word)
+
+    def test_results_are_memoized(self):
+        from obsidian_podcast.llm.tts_prep import _phonetic_fallback
+
+        _phonetic_fallback.cache_clear()
+        _phonetic_fallback("Zorblax")
+        _phonetic_fallback("Zorblax")
+        info = _phonetic_fallback.cache_info()
+        assert info.hits == 1
+        assert info.maxsize is not None
+
+
+class TestKanaTable:
+    def test_alkana_consulted_once_per_word(self, monkeypatch):
+        from obsidian_podcast.llm import tts_prep
+
+        calls = []
+
+        def fake_get_kana(word):
+            calls.append(word)
+            return "ゾルブラックス" if word == "zorblax" else None
+
+        monkeypatch.setattr(tts_prep.alkana, "get_kana", fake_get_kana)
+        monkeypatch.setattr(tts_prep, "_KANA_TABLE", tts_prep._KanaTable({}))
+        result = tts_prep.english_to_katakana("Zorblax と Zorblax と Zorblax")
+        assert result == "ゾルブラックス と ゾルブラックス と ゾルブラックス"
+        assert calls == ["Zorblax", "zorblax"]
+
+    def test_tech_terms_skip_alkana(self, monkeypatch):
+        from obsidian_podcast.llm import tts_prep
+
+        monkeypatch.setattr(
+            tts_prep, "_KANA_TABLE", tts_prep._KanaTable(tts_prep._TECH_TERMS)
+        )
+        calls = []
+        monkeypatch.setattr(tts_prep.alkana, "get_kana", calls.append)
+        assert tts_prep.english_to_katakana("API と Next") == "エーピーアイ と ネクスト"
+        assert calls == []
+
+    def test_register_terms_takes_precedence(self, monkeypatch):
+        from obsidian_podcast.llm import tts_prep
+
+        monkeypatch.setattr(
+            tts_prep, "_KANA_TABLE", tts_prep._KanaTable(tts_prep._TECH_TERMS)
+        )
+        assert tts_prep.english_to_katakana("Hono") != "ホノ"
+        tts_prep.register_terms({"Hono": "ホノ"})
+        assert tts_prep.english_to_katakana("Hono と Next") == "ホノ と ネクスト"
+
+    def test_table_is_bounded_and_keeps_terms(self, monkeypatch):
+        from obsidian_podcast.llm import tts_prep
+
+        monkeypatch.setattr(tts_prep, "_MAX_KANA_TABLE_SIZE", 3)
+        monkeypatch.setattr(tts_prep.alkana, "get_kana", lambda word: None)
+        table = tts_prep._KanaTable({"Next": "ネクスト"})
+        monkeypatch.setattr(tts_prep, "_KANA_TABLE", table)
+        tts_prep.english_to_katakana("a b c d e f g")
+        assert len(table) <= 4
+        assert table["Next"] == "ネクスト"
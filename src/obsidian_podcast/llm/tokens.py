@@ -0,0 +1,46 @@
+"""Token counting for LLM chunk sizing.
+
+Chunk budgets are expressed in tokens because the characters-per-token ratio
+differs widely by script: English averages about four characters per token,
+while Japanese kana and kanji cost roughly one token each.
+"""
+
+import functools
+import logging
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+TokenCounter = Callable[[str], int]
+
+ASCII_CHARS_PER_TOKEN = 4
+
+
+def approx_token_count(text: str) -> int:
+    """Estimate tokens without a tokenizer.
+
+    Counts ASCII characters at ASCII_CHARS_PER_TOKEN per token and every
+    other character (kana, kanji, full-width punctuation) as one token.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    other_chars = len(text) - ascii_chars
+    return -(-ascii_chars // ASCII_CHARS_PER_TOKEN) + other_chars
+
+
+@functools.cache
+def get_token_counter(model: str) -> TokenCounter:
+    """Return a token counter for model.
+
+    Uses tiktoken when it is installed and knows the model, otherwise falls
+    back to approx_token_count.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return approx_token_count
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        return approx_token_count
+    logger.debug("Using tiktoken encoding %s for %s", encoding.name, model)
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
@@ -10,13 +10,16 @@ This module provides a sanitization layer between LLM output and TTS input.
 
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
+from collections.abc import Mapping
 
 import alkana
 
 # Tech terms that alkana doesn't know and phonetic fallback mangles.
-# Users can extend this via config in the future.
+# Users can add their own via the tts.terms / tts.terms_path config keys
+# (see register_terms).
 _TECH_TERMS: dict[str, str] = {
     "Turbopack": "ターボパック",
     "turbopack": "ターボパック",
@@ -106,41 +109,52 @@ _TECH_TERMS: dict[str, str] = {
 }
 
 
-def remove_tts_unsafe_chars(text: str) -> str:
-    """Remove characters that cause TTS mispronunciation."""
-    # Remove code fences and their content
-    text = re.sub(r"```[\s\S]*?```", "", text)
+# Code fences with their content, or a lone backtick (inline code marker).
+# Scanning left to right, this removes exactly the fences the fence-only
+# pattern would, and every remaining backtick.
+_CODE_RE = re.compile(r"```[\s\S]*?```|`")
+_HEADING_RE = re.compile(r"^#{1,6}\s*", re.MULTILINE)
+_BLANKS_RE = re.compile(r"[ \t]+")
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
 
-    # Remove inline code backticks
-    text = text.replace("`", "")
+# Bold/italic markers and exclamation/question marks (both widths).
+_DELETED_CHARS = frozenset("*!！?？")
+# Unicode categories of emoji and other pictographic symbols.
+_SYMBOL_CATEGORIES = frozenset(("So", "Sk"))
 
-    # Remove markdown heading markers
-    text = re.sub(r"^#{1,6}\s*", "", text, flags=re.MULTILINE)
 
-    # Remove bold/italic markers
-    text = re.sub(r"\*+", "", text)
+def _deleted_chars_in(text: str) -> list[str]:
+    """Return the distinct characters of text that sanitization deletes.
 
-    # Remove exclamation marks (full-width and half-width)
-    text = text.replace("！", "").replace("!", "")
+    Only the distinct characters are classified, so the cost per character
+    of text is a set insertion rather than a unicodedata lookup.
+    """
+    return [
+        c
+        for c in set(text)
+        if c in _DELETED_CHARS or unicodedata.category(c) in _SYMBOL_CATEGORIES
+    ]
 
-    # Remove question marks (full-width and half-width)
-    text = text.replace("？", "").replace("?", "")
 
-    # Remove emoji (Unicode emoji ranges)
-    text = _remove_emoji(text)
+def _delete_unsafe_chars(text: str) -> str:
+    """Delete markdown emphasis, ! and ? marks, and emoji/symbols."""
+    for c in _deleted_chars_in(text):
+        text = text.replace(c, "")
+    return text
 
-    # Clean up extra whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
 
-    return text.strip()
+def _strip_markup(text: str) -> str:
+    """Code, headings and unsafe characters removed; blanks collapsed."""
+    text = _CODE_RE.sub("", text)
+    text = _HEADING_RE.sub("", text)
+    text = _delete_unsafe_chars(text)
+    return _BLANKS_RE.sub(" ", text)
 
 
-def _remove_emoji(text: str) -> str:
-    """Remove emoji characters from text."""
-    return "".join(
-        c for c in text if unicodedata.category(c) not in ("So", "Sk")
-    )
+def remove_tts_unsafe_chars(text: str) -> str:
+    """Remove characters that cause TTS mispronunciation."""
+    text = _strip_markup(text)
+    return _EXCESS_NEWLINES_RE.sub("\n\n", text).strip()
 
 
 # Basic English letter/digraph to katakana phonetic mapping for unknown words.
@@ -200,48 +214,131 @@ _PHONETIC_MAP = [
 ]
 
 
+# Trie over _PHONETIC_MAP: each node maps a character to its child node.
+# The _KANA key, where present, holds (priority, kana, length) for the
+# pattern ending at that node; priority is the pattern's index in the map.
+_KANA = ""
+
+
+def _build_phonetic_trie() -> dict:
+    root: dict = {}
+    for priority, (pattern, kana) in enumerate(_PHONETIC_MAP):
+        node = root
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node.setdefault(_KANA, (priority, kana, len(pattern)))
+    return root
+
+
+_PHONETIC_TRIE = _build_phonetic_trie()
+
+# Distinct words seen in a run are few; this bounds memory on odd inputs.
+_PHONETIC_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_PHONETIC_CACHE_SIZE)
 def _phonetic_fallback(word: str) -> str:
-    """Convert unknown English word to katakana using phonetic rules."""
+    """Convert unknown English word to katakana using phonetic rules.
+
+    At each position, the pattern listed first in _PHONETIC_MAP among those
+    matching there wins. The trie finds every matching pattern in a single
+    walk from that position instead of trying each pattern in turn.
+    """
     lower = word.lower()
     result = []
     i = 0
-    while i < len(lower):
-        matched = False
-        for pattern, kana in _PHONETIC_MAP:
-            if lower[i:].startswith(pattern):
-                result.append(kana)
-                i += len(pattern)
-                matched = True
+    n = len(lower)
+    while i < n:
+        best = None
+        node = _PHONETIC_TRIE
+        j = i
+        while j < n:
+            node = node.get(lower[j])
+            if node is None:
                 break
-        if not matched:
+            j += 1
+            match = node.get(_KANA)
+            if match is not None and (best is None or match[0] < best[0]):
+                best = match
+        if best is None:
             result.append(lower[i])
             i += 1
+        else:
+            result.append(best[1])
+            i += best[2]
     return "".join(result)
 
 
+# Sequences of ASCII letters (English words)
+_WORD_RE = re.compile(r"[a-zA-Z]+")
+
+# Memoized words beyond this count are dropped (registered terms are kept),
+# so odd inputs such as long runs of identifiers can't grow it without bound.
+_MAX_KANA_TABLE_SIZE = 100_000
+
+
+def _lookup_kana(word: str) -> str:
+    """Look up a word in alkana (as is, then lowercased), else phonetics."""
+    return (
+        alkana.get_kana(word)
+        or alkana.get_kana(word.lower())
+        or _phonetic_fallback(word)
+    )
+
+
+class _KanaTable(dict[str, str]):
+    """Word to kana table shared across articles.
+
+    Preloaded with the registered terms; any other word is looked up once
+    on first use and remembered, so each later occurrence is one dict hit.
+    """
+
+    def __init__(self, terms: Mapping[str, str]) -> None:
+        super().__init__(terms)
+        self._terms = dict(terms)
+
+    def add_terms(self, terms: Mapping[str, str]) -> None:
+        self._terms.update(terms)
+        self.update(terms)
+
+    def __missing__(self, word: str) -> str:
+        if len(self) >= len(self._terms) + _MAX_KANA_TABLE_SIZE:
+            self.clear()
+            self.update(self._terms)
+        kana = self[word] = _lookup_kana(word)
+        return kana
+
+
+_KANA_TABLE = _KanaTable(_TECH_TERMS)
+
+
+def register_terms(terms: Mapping[str, str]) -> None:
+    """Add word to kana readings that take precedence over alkana.
+
+    Matching is case-sensitive, like _TECH_TERMS: register each spelling
+    that should be read that way.
+    """
+    _KANA_TABLE.add_terms(terms)
+
+
 def english_to_katakana(text: str) -> str:
     """Convert English words in text to katakana.
 
-    Uses alkana dictionary for known words, phonetic fallback for unknown.
+    Uses registered terms (_TECH_TERMS and config) first, then the alkana
+    dictionary for known words, then phonetic fallback for unknown ones.
     """
-    def replace_match(m: re.Match) -> str:
-        word = m.group(0)
-        # Try tech terms dictionary first
-        if word in _TECH_TERMS:
-            return _TECH_TERMS[word]
-        # Try alkana dictionary
-        kana = alkana.get_kana(word)
-        if kana:
-            return kana
-        # Try lowercase
-        kana = alkana.get_kana(word.lower())
-        if kana:
-            return kana
-        # Phonetic fallback
-        return _phonetic_fallback(word)
-
-    # Match sequences of ASCII letters (English words)
-    return re.sub(r"[a-zA-Z]+", replace_match, text)
+    return _WORD_RE.sub(lambda m: _KANA_TABLE[m[0]], text)
+
+
+_SENTENCE_END_RE = re.compile(r"。(?!\n)")
+
+# A dot outside a number, or a 。 that is not followed by a newline once
+# such dots are removed (only dots can sit between it and the newline).
+_DOT_OR_PAUSE_RE = re.compile(r"(?<![0-9])\.(?![0-9])|。(?!\.*\n)")
+
+
+def _dot_or_pause(m: re.Match) -> str:
+    return "" if m.group() == "." else "。\n"
 
 
 def add_tts_pauses(text: str) -> str:
@@ -250,28 +347,27 @@ def add_tts_pauses(text: str) -> str:
     edge-tts treats newlines as breath pauses. By ensuring each sentence
     ends with a newline, we get natural breaks between sentences.
     """
-    # Add newline after 。if not already followed by one
-    text = re.sub(r"。(?!\n)", "。\n", text)
-    # Clean up excessive newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text
+    text = _SENTENCE_END_RE.sub("。\n", text)
+    return _EXCESS_NEWLINES_RE.sub("\n\n", text)
 
 
 def sanitize_for_tts(text: str) -> str:
     """Full sanitization pipeline: unsafe chars removal + English to katakana.
 
     This is the main entry point. Call this on LLM output before passing to TTS.
+
+    Equivalent to remove_tts_unsafe_chars, english_to_katakana, removing
+    dots that aren't part of numbers (e.g., 3.14) and add_tts_pauses in
+    turn, but with precompiled, fused passes: markup removal takes two
+    regex passes plus one str.replace per distinct unsafe character, and
+    dot removal and pause insertion share one pass. The intermediate
+    newline collapse and strip are skipped since the final ones subsume
+    them.
     """
     if not text:
         return ""
 
-    text = remove_tts_unsafe_chars(text)
+    text = _strip_markup(text)
     text = english_to_katakana(text)
-
-    # Remove any remaining dots that aren't part of numbers (e.g., 3.14)
-    text = re.sub(r"(?<![0-9])\.(?![0-9])", "", text)
-
-    # Add pauses for natural speech rhythm
-    text = add_tts_pauses(text)
-
-    return text.strip()
+    text = _DOT_OR_PAUSE_RE.sub(_dot_or_pause, text)
+    return _EXCESS_NEWLINES_RE.sub("\n\n", text).strip()
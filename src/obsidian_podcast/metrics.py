@@ -0,0 +1,188 @@
+"""Per-step timing and throughput instrumentation for the pipeline."""
+
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+METRICS_FORMATS = ("jsonl", "prometheus")
+
+
+@dataclass
+class StepEvent:
+    """One item passing through one pipeline step."""
+
+    step: str
+    item: int
+    label: str | None
+    wall_time: float
+    queue_wait: float
+    bytes_in: int
+    bytes_out: int
+    error: str | None = None
+
+
+class PipelineHooks:
+    """Observer interface for Pipeline runs.
+
+    All methods are no-ops; subclass and override what you need. A Pipeline
+    without hooks skips timing and size measurement entirely.
+    """
+
+    def on_run_start(self) -> None:
+        """Called before the first item enters the pipeline."""
+
+    def on_step(self, event: StepEvent) -> None:
+        """Called after each step finishes (or fails) for one item."""
+
+    def on_run_end(self) -> None:
+        """Called after the last item leaves the pipeline."""
+
+
+def payload_size(value: Any) -> int:
+    """Best-effort size in bytes of a step input or output."""
+    if isinstance(value, bytes | bytearray):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    content = getattr(value, "content", None) or getattr(value, "text", None)
+    if isinstance(content, str):
+        return len(content.encode())
+    return 0
+
+
+def item_label(value: Any) -> str | None:
+    """Human-readable identifier for an item (its URL when it has one)."""
+    url = getattr(value, "url", None)
+    return url if isinstance(url, str) else None
+
+
+@dataclass
+class StepStats:
+    """Aggregated metrics for one step."""
+
+    items: int = 0
+    failures: int = 0
+    wall_time: float = 0.0
+    max_wall_time: float = 0.0
+    queue_wait: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+@dataclass
+class MetricsCollector(PipelineHooks):
+    """PipelineHooks implementation that aggregates step metrics.
+
+    Extra run-level counters (e.g. LLM token usage) can be attached with
+    add_counter and are included in every output format.
+    """
+
+    events: list[StepEvent] = field(default_factory=list)
+    steps: dict[str, StepStats] = field(default_factory=dict)
+    counters: dict[str, float] = field(default_factory=dict)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def on_run_start(self) -> None:
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+
+    def on_step(self, event: StepEvent) -> None:
+        self.events.append(event)
+        stats = self.steps.setdefault(event.step, StepStats())
+        stats.items += 1
+        stats.failures += event.error is not None
+        stats.wall_time += event.wall_time
+        stats.max_wall_time = max(stats.max_wall_time, event.wall_time)
+        stats.queue_wait += event.queue_wait
+        stats.bytes_in += event.bytes_in
+        stats.bytes_out += event.bytes_out
+
+    def on_run_end(self) -> None:
+        self.finished_at = time.perf_counter()
+
+    def add_counter(self, name: str, value: float) -> None:
+        """Add value to a named run-level counter."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_counters(self, counters: dict[str, float]) -> None:
+        """Add several named counters, e.g. LLMUsage.counters()."""
+        for name, value in counters.items():
+            self.add_counter(name, value)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def format_table(self) -> str:
+        """Render a plain-text summary table of all steps."""
+        if not self.steps and not self.counters:
+            return "No pipeline metrics recorded."
+        header = (
+            f"{'step':<24}{'items':>7}{'failed':>8}{'total s':>10}"
+            f"{'avg s':>9}{'max s':>9}{'wait s':>9}{'in KB':>10}{'out KB':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        for name, s in self.steps.items():
+            avg = s.wall_time / s.items if s.items else 0.0
+            lines.append(
+                f"{name:<24}{s.items:>7}{s.failures:>8}{s.wall_time:>10.2f}"
+                f"{avg:>9.2f}{s.max_wall_time:>9.2f}{s.queue_wait:>9.2f}"
+                f"{s.bytes_in / 1024:>10.1f}{s.bytes_out / 1024:>10.1f}"
+            )
+        if self.elapsed:
+            lines.append(f"elapsed: {self.elapsed:.2f}s")
+        for name, value in self.counters.items():
+            lines.append(f"{name}: {value:g}")
+        return "\n".join(lines)
+
+    def write_jsonl(self, path: Path) -> None:
+        """Write one JSON object per step event, then per-step and run totals."""
+        with open(path, "w") as f:
+            for event in self.events:
+                f.write(json.dumps({"type": "event", **asdict(event)}) + "\n")
+            for name, stats in self.steps.items():
+                f.write(json.dumps({"type": "step", "step": name, **asdict(stats)}))
+                f.write("\n")
+            run = {"type": "run", "elapsed": self.elapsed, **self.counters}
+            f.write(json.dumps(run) + "\n")
+
+    def write_prometheus(self, path: Path) -> None:
+        """Write step totals in Prometheus text exposition format."""
+        metrics = (
+            ("step_items_total", "counter", "Items processed by step", "items"),
+            ("step_failures_total", "counter", "Items failed by step", "failures"),
+            ("step_wall_seconds_total", "counter", "Step wall time", "wall_time"),
+            ("step_queue_wait_seconds_total", "counter", "Queue wait", "queue_wait"),
+            ("step_bytes_in_total", "counter", "Bytes into step", "bytes_in"),
+            ("step_bytes_out_total", "counter", "Bytes out of step", "bytes_out"),
+        )
+        lines: list[str] = []
+        for suffix, kind, help_text, attr in metrics:
+            name = f"obsidian_podcast_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for step, stats in self.steps.items():
+                lines.append(f'{name}{{step="{step}"}} {getattr(stats, attr)}')
+        lines.append("# TYPE obsidian_podcast_run_elapsed_seconds gauge")
+        lines.append(f"obsidian_podcast_run_elapsed_seconds {self.elapsed}")
+        for counter, value in self.counters.items():
+            name = f"obsidian_podcast_{counter}"
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+        Path(path).write_text("\n".join(lines) + "\n")
+
+    def write(self, path: Path, format: str = "jsonl") -> None:
+        """Write metrics in the given format ("jsonl" or "prometheus")."""
+        if format == "jsonl":
+            self.write_jsonl(path)
+        elif format == "prometheus":
+            self.write_prometheus(path)
+        else:
+            msg = f"Unknown metrics format: {format}. Available: {METRICS_FORMATS}"
+            raise ValueError(msg)
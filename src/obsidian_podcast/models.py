@@ -10,6 +10,7 @@ class ProcessingStatus(StrEnum):
 
     PENDING = "pending"
     PROCESSING = "processing"
+    SCRIPTED = "scripted"
     COMPLETED = "completed"
     FAILED = "failed"
 
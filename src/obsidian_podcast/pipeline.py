@@ -1,13 +1,35 @@
-"""Async pipeline skeleton for article processing."""
+"""Async pipeline for article processing."""
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 from obsidian_podcast.llm.base import LLMProvider, generate_podcast_script
+from obsidian_podcast.llm.tokens import TokenCounter
+from obsidian_podcast.metrics import (
+    PipelineHooks,
+    StepEvent,
+    item_label,
+    payload_size,
+)
+from obsidian_podcast.preprocessor.pool import PreparedText, PreprocessPool
+
+logger = logging.getLogger(__name__)
 
 
 class PipelineStep[T, U](ABC):
-    """Abstract base class for a pipeline processing step."""
+    """Abstract base class for a pipeline processing step.
+
+    `concurrency` caps how many items Pipeline.run_many feeds through this
+    step at once. Override it per class or per instance: cheap steps such
+    as scraping can run wide, expensive LLM/TTS steps narrow.
+    """
+
+    concurrency: int = 1
 
     @abstractmethod
     async def process(self, input_data: T) -> U:
@@ -15,31 +37,236 @@ class PipelineStep[T, U](ABC):
         ...
 
 
+@dataclass
+class PipelineResult:
+    """Outcome of one item passed through Pipeline.run_many."""
+
+    index: int
+    input: Any
+    output: Any = None
+    error: Exception | None = None
+    failed_step: str | None = None
+    enqueued_at: float = field(default=0.0, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Marks the end of a stage's input queue.
+_DONE = object()
+
+
+async def _process_observed(
+    hooks: PipelineHooks,
+    step: PipelineStep[Any, Any],
+    input_data: Any,
+    index: int,
+    label: str | None,
+    queue_wait: float,
+) -> Any:
+    """Run one step for one item and report it to the hooks."""
+    started = time.perf_counter()
+    error = None
+    output = None
+    try:
+        output = await step.process(input_data)
+        return output
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        hooks.on_step(
+            StepEvent(
+                step=type(step).__name__,
+                item=index,
+                label=label,
+                wall_time=time.perf_counter() - started,
+                queue_wait=queue_wait,
+                bytes_in=payload_size(input_data),
+                bytes_out=payload_size(output),
+                error=error,
+            )
+        )
+
+
 class Pipeline:
-    """Chain of PipelineStep instances executed sequentially."""
+    """Chain of PipelineStep instances.
 
-    def __init__(self, steps: list[PipelineStep[Any, Any]]) -> None:
+    run() passes one input through the steps in sequence. run_many() streams
+    many inputs through all steps at once, see its docstring. When hooks are
+    given, every step invocation is reported to them as a StepEvent.
+    """
+
+    def __init__(
+        self,
+        steps: list[PipelineStep[Any, Any]],
+        queue_size: int = 16,
+        hooks: PipelineHooks | None = None,
+    ) -> None:
         self.steps = steps
+        self.queue_size = queue_size
+        self.hooks = hooks
 
     async def run(self, input_data: Any) -> Any:
         """Run all steps in sequence, passing output of each to the next."""
-        result = input_data
-        for step in self.steps:
-            result = await step.process(result)
-        return result
+        if self.hooks is None:
+            result = input_data
+            for step in self.steps:
+                result = await step.process(result)
+            return result
+
+        self.hooks.on_run_start()
+        try:
+            label = item_label(input_data)
+            result = input_data
+            for step in self.steps:
+                result = await _process_observed(
+                    self.hooks, step, result, 0, label, 0.0
+                )
+            return result
+        finally:
+            self.hooks.on_run_end()
+
+    async def run_many(self, items: Iterable[Any]) -> AsyncIterator[PipelineResult]:
+        """Run many items through the steps concurrently.
+
+        Each step gets `step.concurrency` workers, connected to the next step
+        by a bounded queue of `queue_size` items, so a slow step applies
+        backpressure to the steps before it. An exception in one item is
+        recorded on its PipelineResult, and that item skips the remaining
+        steps without affecting the others. Results are yielded in
+        completion order; use PipelineResult.index to restore input order.
+        If iterating `items` raises, the items already taken are finished
+        and yielded, then the exception is raised.
+        """
+        queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=self.queue_size)
+            for _ in range(len(self.steps) + 1)
+        ]
+
+        def consumers(stage: int) -> int:
+            if stage < len(self.steps):
+                return max(1, self.steps[stage].concurrency)
+            return 1
+
+        hooks = self.hooks
+
+        async def feed() -> None:
+            error = None
+            try:
+                for index, item in enumerate(items):
+                    result = PipelineResult(index, item, output=item)
+                    if hooks is not None:
+                        result.enqueued_at = time.perf_counter()
+                    await queues[0].put(result)
+            except Exception as e:
+                # Let the stages drain; gather() below re-raises it.
+                error = e
+            for _ in range(consumers(0)):
+                await queues[0].put(_DONE)
+            if error is not None:
+                raise error
+
+        async def work(stage: int) -> None:
+            step = self.steps[stage]
+            inbox, outbox = queues[stage], queues[stage + 1]
+            while (result := await inbox.get()) is not _DONE:
+                if result.ok:
+                    try:
+                        if hooks is None:
+                            result.output = await step.process(result.output)
+                        else:
+                            result.output = await _process_observed(
+                                hooks,
+                                step,
+                                result.output,
+                                result.index,
+                                item_label(result.input),
+                                time.perf_counter() - result.enqueued_at,
+                            )
+                    except Exception as e:
+                        logger.warning(
+                            "Pipeline step %s failed for item %d",
+                            type(step).__name__,
+                            result.index,
+                            exc_info=True,
+                        )
+                        result.output = None
+                        result.error = e
+                        result.failed_step = type(step).__name__
+                if hooks is not None:
+                    result.enqueued_at = time.perf_counter()
+                await outbox.put(result)
+
+        async def run_stage(stage: int) -> None:
+            await asyncio.gather(*(work(stage) for _ in range(consumers(stage))))
+            for _ in range(consumers(stage + 1)):
+                await queues[stage + 1].put(_DONE)
+
+        if hooks is not None:
+            hooks.on_run_start()
+        tasks = [asyncio.create_task(feed())] + [
+            asyncio.create_task(run_stage(stage)) for stage in range(len(self.steps))
+        ]
+        try:
+            while (result := await queues[-1].get()) is not _DONE:
+                yield result
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if hooks is not None:
+                hooks.on_run_end()
+
+
+class PreprocessStep(PipelineStep[str, PreparedText]):
+    """Pipeline step that turns article HTML into text and its language.
+
+    The CPU-bound work runs in the pool's worker processes, keeping the
+    event loop free for network I/O. Its concurrency is set to the pool's
+    capacity, so run_many keeps every worker supplied with full batches.
+    """
+
+    def __init__(self, pool: PreprocessPool) -> None:
+        self.pool = pool
+        self.concurrency = pool.capacity
+
+    async def process(self, input_data: str) -> PreparedText:
+        """Extract and preprocess article HTML in a worker process."""
+        return await self.pool.prepare(input_data)
 
 
 class LLMScriptStep(PipelineStep[str, str]):
-    """Pipeline step that converts text to podcast script using LLM."""
+    """Pipeline step that converts text to podcast script using LLM.
+
+    All articles processed by one step share a single limit of
+    max_concurrency in-flight requests to the provider. Chunks are sized by
+    max_chunk_tokens when given, counted with the provider model's
+    tokenizer unless count_tokens is given, otherwise by max_chunk_chars.
+    """
 
     def __init__(
-        self, provider: LLMProvider, max_chunk_chars: int = 4000
+        self,
+        provider: LLMProvider,
+        max_chunk_chars: int = 4000,
+        max_concurrency: int = 4,
+        max_chunk_tokens: int | None = None,
+        count_tokens: TokenCounter | None = None,
     ) -> None:
         self.provider = provider
         self.max_chunk_chars = max_chunk_chars
+        self.max_chunk_tokens = max_chunk_tokens
+        self.count_tokens = count_tokens
+        self.limiter = asyncio.Semaphore(max_concurrency)
 
     async def process(self, input_data: str) -> str:
         """Convert article text to podcast script."""
         return await generate_podcast_script(
-            input_data, self.provider, self.max_chunk_chars
+            input_data,
+            self.provider,
+            self.max_chunk_chars,
+            limiter=self.limiter,
+            max_chunk_tokens=self.max_chunk_tokens,
+            count_tokens=self.count_tokens,
         )
@@ -0,0 +1,213 @@
+"""Process-pool stage for CPU-bound article preparation.
+
+Readability extraction, HTML preprocessing, language detection and TTS
+sanitization are pure Python and hold the GIL, so running them on the
+event loop thread stalls every in-flight fetch and LLM call. PreprocessPool
+runs prepare_article in worker processes instead. Requests that arrive
+close together are sent to a worker as one batch, so that pickling and
+IPC are paid per batch rather than per article.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from obsidian_podcast.llm.tts_prep import register_terms, sanitize_for_tts
+from obsidian_podcast.preprocessor.text import (
+    detect_language,
+    preprocess,
+    preprocess_tree,
+)
+from obsidian_podcast.scraper.extractor import extract_content_tree
+
+if TYPE_CHECKING:
+    from obsidian_podcast.config import PreprocessConfig, TTSConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PreparedText:
+    """Plain text of an article, ready for the LLM or TTS step."""
+
+    text: str
+    language: str | None = None
+
+
+def default_workers() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def prepare_article(
+    html: str,
+    code_block_handling: str = "skip",
+    sanitize: bool = True,
+    language_hint: str | None = None,
+) -> PreparedText:
+    """Extract, preprocess and language-tag one article's HTML.
+
+    Falls back to preprocessing the HTML as a whole when readability finds
+    no main content (e.g. short RSS summaries). The language is detected
+    before sanitization, which rewrites English words in katakana. Pass
+    sanitize=False when an LLM step follows, as it needs the original words.
+    language_hint is passed on to detect_language (e.g. Article.language).
+    """
+    tree = extract_content_tree(html)
+    if tree is not None:
+        text = preprocess_tree(tree, code_block_handling)
+    else:
+        text = preprocess(html, code_block_handling)
+    language = detect_language(text, language_hint)
+    if sanitize:
+        text = sanitize_for_tts(text)
+    return PreparedText(text, language)
+
+
+def _prepare_batch(
+    items: list[tuple[str, str | None]], code_block_handling: str, sanitize: bool
+) -> list[PreparedText | Exception]:
+    """Worker entry point: prepare each article, returning errors in place."""
+    results: list[PreparedText | Exception] = []
+    for html, hint in items:
+        try:
+            results.append(
+                prepare_article(html, code_block_handling, sanitize, hint)
+            )
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class PreprocessPool:
+    """Run prepare_article for many articles in a process pool.
+
+    prepare() queues one article and waits for its result. Queued articles
+    are dispatched to a worker in batches of up to batch_size, or after
+    max_delay seconds when fewer arrive. An exception in one article is
+    raised to its own caller only. The pool starts on first use; terms are
+    registered in every worker (see tts_prep.register_terms). If a worker
+    dies, the batches in flight fail and the next batch starts a new pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        batch_size: int = 8,
+        max_delay: float = 0.01,
+        code_block_handling: str = "skip",
+        sanitize: bool = True,
+        terms: Mapping[str, str] | None = None,
+    ) -> None:
+        self.max_workers = max_workers or default_workers()
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max_delay
+        self.code_block_handling = code_block_handling
+        self.sanitize = sanitize
+        self.terms = dict(terms or {})
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[str, str | None, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "PreprocessConfig",
+        tts: "TTSConfig",
+        sanitize: bool = True,
+    ) -> "PreprocessPool":
+        return cls(
+            max_workers=config.workers or None,
+            batch_size=config.batch_size,
+            code_block_handling=tts.code_block_handling,
+            sanitize=sanitize,
+            terms=tts.load_terms(),
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Articles that can be in flight with every worker kept busy."""
+        return self.max_workers * self.batch_size
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=register_terms,
+                initargs=(self.terms,),
+            )
+        return self._executor
+
+    async def prepare(
+        self, html: str, language_hint: str | None = None
+    ) -> PreparedText:
+        """Prepare one article's HTML in a worker process."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((html, language_hint, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(
+        self, batch: list[tuple[str, str | None, asyncio.Future]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        items = [(html, hint) for html, hint, _ in batch]
+        executor = self._get_executor()
+        try:
+            results = await loop.run_in_executor(
+                executor,
+                _prepare_batch,
+                items,
+                self.code_block_handling,
+                self.sanitize,
+            )
+        except BrokenProcessPool as e:
+            logger.warning("Preprocessing pool broke, starting a new one")
+            if self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            results = [e] * len(batch)
+        except Exception as e:
+            logger.warning("Preprocessing batch of %d failed", len(batch))
+            results = [e] * len(batch)
+        for (_, _, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "PreprocessPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,135 @@
+"""Tests for the process-pool preprocessing stage."""
+
+import asyncio
+
+import pytest
+
+ARTICLE_HTML = """
+<html><head><title>Test</title></head><body>
+<nav>Navigation menu</nav>
+<article>
+<h1>Title</h1>
+<p>This is the main content of the article. It contains several paragraphs
+of meaningful text that should be extracted by readability.</p>
+<p>Second paragraph with more content to make readability happy!
+The algorithm needs enough text to properly identify main content.</p>
+<pre><code>x = 1</code></pre>
+</article>
+<footer>Footer content</footer>
+</body></html>
+"""
+
+
+class TestPrepareArticle:
+    def test_extracts_detects_and_sanitizes(self):
+        from obsidian_podcast.preprocessor.pool import prepare_article
+
+        result = prepare_article(ARTICLE_HTML)
+        assert result.language == "en"
+        assert "x = 1" not in result.text
+        assert "Navigation" not in result.text
+        assert "!" not in result.text
+        assert "main" not in result.text  # English rewritten in katakana
+
+    def test_without_sanitize_matches_lxml_path(self):
+        from obsidian_podcast.preprocessor.pool import prepare_article
+        from obsidian_podcast.preprocessor.text import preprocess_tree
+        from obsidian_podcast.scraper.extractor import extract_content_tree
+
+        result = prepare_article(ARTICLE_HTML, "announce", sanitize=False)
+        assert result.text == preprocess_tree(
+            extract_content_tree(ARTICLE_HTML), "announce"
+        )
+
+    def test_language_hint(self):
+        from obsidian_podcast.preprocessor.pool import prepare_article
+
+        html = "<p>Guten Tag, dies ist ein Artikel.</p>"
+        assert prepare_article(html, language_hint="de-DE").language == "de"
+
+    def test_falls_back_to_whole_html(self):
+        from obsidian_podcast.preprocessor.pool import prepare_article
+
+        result = prepare_article("<p>短い概要です。</p>", sanitize=False)
+        assert result.text == "短い概要です。"
+
+    def test_batch_returns_errors_in_place(self):
+        from obsidian_podcast.preprocessor.pool import PreparedText, _prepare_batch
+
+        items = [("<p>一つ目</p>", None), (None, None), ("<p>三つ目</p>", None)]
+        results = _prepare_batch(items, "skip", False)
+        assert isinstance(results[0], PreparedText)
+        assert isinstance(results[1], Exception)
+        assert results[2].text == "三つ目"
+
+
+class TestPreprocessPool:
+    def test_default_workers(self):
+        from obsidian_podcast.preprocessor.pool import PreprocessPool, default_workers
+
+        assert default_workers() >= 1
+        pool = PreprocessPool(batch_size=4)
+        assert pool.max_workers == default_workers()
+        assert pool.capacity == pool.max_workers * 4
+
+    @pytest.mark.asyncio
+    async def test_prepares_in_batches(self, monkeypatch):
+        from obsidian_podcast.preprocessor import pool as pool_module
+
+        batch_sizes = []
+        run_batch = pool_module.PreprocessPool._run_batch
+
+        async def recording_run_batch(self, batch):
+            batch_sizes.append(len(batch))
+            await run_batch(self, batch)
+
+        monkeypatch.setattr(
+            pool_module.PreprocessPool, "_run_batch", recording_run_batch
+        )
+        htmls = [f"<p>記事{i}です。</p>" for i in range(5)]
+        with pool_module.PreprocessPool(
+            max_workers=1, batch_size=2, sanitize=False
+        ) as pool:
+            results = await asyncio.gather(*(pool.prepare(h) for h in htmls))
+        assert [r.text for r in results] == [f"記事{i}です。" for i in range(5)]
+        assert batch_sizes == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_error_isolated_to_article(self):
+        from obsidian_podcast.preprocessor.pool import PreprocessPool
+
+        with PreprocessPool(max_workers=1, batch_size=3, sanitize=False) as pool:
+            results = await asyncio.gather(
+                pool.prepare("<p>一つ目</p>"),
+                pool.prepare(None),
+                pool.prepare("<p>三つ目</p>"),
+                return_exceptions=True,
+            )
+        assert results[0].text == "一つ目"
+        assert isinstance(results[1], Exception)
+        assert results[2].text == "三つ目"
+
+    @pytest.mark.asyncio
+    async def test_terms_registered_in_workers(self):
+        from obsidian_podcast.preprocessor.pool import PreprocessPool
+
+        with PreprocessPool(max_workers=1, terms={"Zorblax": "ゾルブラックス"}) as pool:
+            result = await pool.prepare("<p>Zorblaxです。</p>")
+        assert result.text == "ゾルブラックスです。"
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_replaced(self):
+        from concurrent.futures.process import BrokenProcessPool
+
+        from obsidian_podcast.preprocessor.pool import PreprocessPool
+
+        with PreprocessPool(max_workers=1, sanitize=False) as pool:
+            assert (await pool.prepare("<p>一つ目</p>")).text == "一つ目"
+            for process in list(pool._executor._processes.values()):
+                process.kill()
+                process.join()
+
+            with pytest.raises(BrokenProcessPool):
+                await pool.prepare("<p>二つ目</p>")
+            result = await pool.prepare("<p>三つ目</p>")
+        assert result.text == "三つ目"
@@ -154,6 +154,95 @@ class TestDetectLanguage:
         assert result is None or isinstance(result, str)
 
 
+class TestTieredDetectLanguage:
+    JAPANESE = "これは日本語のテキストです。ReactとTypeScriptの話をします。" * 5
+
+    @staticmethod
+    def _record_langdetect(monkeypatch) -> list[str]:
+        from obsidian_podcast.preprocessor import text
+
+        calls: list[str] = []
+
+        def fake_detect(sample):
+            calls.append(sample)
+            return "en"
+
+        monkeypatch.setattr(text, "detect", fake_detect)
+        text._detect_sample.cache_clear()
+        return calls
+
+    def test_kana_decided_without_langdetect(self, monkeypatch):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        calls = self._record_langdetect(monkeypatch)
+        assert detect_language(self.JAPANESE) == "ja"
+        assert calls == []
+
+    def test_hangul_decided_without_langdetect(self, monkeypatch):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        calls = self._record_langdetect(monkeypatch)
+        assert detect_language("안녕하세요. 이것은 한국어 문장입니다.") == "ko"
+        assert calls == []
+
+    def test_hint_used_and_normalized(self, monkeypatch):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        calls = self._record_langdetect(monkeypatch)
+        assert detect_language("Guten Tag, wie geht es?", hint="de-DE") == "de"
+        assert detect_language("Bonjour tout le monde", hint="fr_FR") == "fr"
+        assert calls == []
+
+    def test_hint_overridden_by_script(self, monkeypatch):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        self._record_langdetect(monkeypatch)
+        assert detect_language(self.JAPANESE, hint="en-US") == "ja"
+
+    def test_hint_contradicted_by_latin_script(self):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        text = (
+            "This is a long enough English text for language detection. "
+            "The algorithm needs sufficient content to work properly."
+        )
+        assert detect_language(text, hint="ja") == "en"
+
+    def test_hint_contradicted_by_han_script(self):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        text = "这是一篇关于前端开发的中文文章。我们今天讨论新的框架和工具。" * 3
+        assert detect_language(text, hint="en") == "zh-cn"
+
+    def test_agreeing_hint_skips_langdetect(self, monkeypatch):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        calls = self._record_langdetect(monkeypatch)
+        assert detect_language("这是中文文章。", hint="zh-TW") == "zh"
+        assert detect_language("Это русский текст.", hint="ru") == "ru"
+        assert calls == []
+
+    def test_langdetect_sees_bounded_sample(self, monkeypatch):
+        from obsidian_podcast.preprocessor.text import (
+            _LANGDETECT_SAMPLE_CHARS,
+            detect_language,
+        )
+
+        calls = self._record_langdetect(monkeypatch)
+        text = "This is a long English article. " * 10_000
+        assert detect_language(text) == "en"
+        assert len(calls) == 1
+        assert len(calls[0]) <= _LANGDETECT_SAMPLE_CHARS
+
+    def test_results_cached(self, monkeypatch):
+        from obsidian_podcast.preprocessor.text import detect_language
+
+        calls = self._record_langdetect(monkeypatch)
+        text = "Plain English text that needs langdetect."
+        assert detect_language(text) == detect_language(text) == "en"
+        assert len(calls) == 1
+
+
 class TestPreprocessArticle:
     """Integration test for the full preprocessing pipeline."""
 
@@ -187,3 +276,149 @@ class TestPreprocessArticle:
         html = "<p>Text</p><pre><code>print(42)</code></pre>"
         result = preprocess(html, code_block_handling="read")
         assert "print(42)" in result
+
+
+def _random_html(rng, depth: int = 0, limit: int = 6) -> str:
+    """Random HTML mixing text, blank strings and the tags preprocess edits."""
+    parts = []
+    for _ in range(rng.randint(0, limit)):
+        r = rng.random()
+        if depth > 3 or r < 0.3:
+            parts.append(rng.choice([" ", "\n", " \n", "\n\n", "\t", "", "a", "x y"]))
+        elif r < 0.4:
+            parts.append(rng.choice(["<img src=x>", "<br>", "<!-- c -->"]))
+        elif r < 0.48:
+            parts.append(f"<pre>{_random_html(rng, depth + 1, 2)}</pre>")
+        elif r < 0.53:
+            caption = "<figcaption>c</figcaption>"
+            parts.append(f"<figure>{_random_html(rng, depth + 1)}{caption}</figure>")
+        elif r < 0.6:
+            cells = "".join(
+                f"<td>{_random_html(rng, depth + 2, 2)}</td>"
+                for _ in range(rng.randint(0, 2))
+            )
+            parts.append(f"<table><tr>{cells}</tr></table>")
+        else:
+            tag = rng.choice(["p", "div", "b", "span", "li"])
+            parts.append(f"<{tag}>{_random_html(rng, depth + 1)}</{tag}>")
+    return "".join(parts)
+
+
+def _chained_preprocess(html: str, code_block_handling: str) -> str:
+    """The original one-parse-per-step chain, kept as an output oracle."""
+    from bs4 import BeautifulSoup
+
+    from obsidian_podcast.preprocessor.text import (
+        handle_code_blocks,
+        normalize_whitespace,
+        remove_images,
+        table_to_text,
+    )
+
+    result = handle_code_blocks(html, code_block_handling)
+    result = remove_images(result)
+    result = table_to_text(result)
+    soup = BeautifulSoup(result, "html.parser")
+    return normalize_whitespace(soup.get_text(separator="\n"))
+
+
+class TestPreprocessSingleParse:
+    PAGES = [
+        "<p>Before</p>text<img src='a.png'/>more<p>After</p>",
+        "intro<pre><code>x = 1</code></pre>outro",
+        "a<table><tr><th>H</th><th>I</th></tr><tr><td>1</td><td>2</td></tr>"
+        "</table>b",
+        "<div>lead <figure><img src='x'/><figcaption>Cap</figcaption></figure>"
+        " tail<!-- note --> &amp; more</div>",
+        "<table><tr><td><table><tr><td>inner</td></tr></table></td></tr>"
+        "</table><p>x &lt;y&gt;</p>",
+        "<ul><li>one</li><li>two<pre>code</pre>three</li></ul>\n\n\n<p>end</p>",
+    ]
+    # Blank strings left next to each other once a tag is removed
+    WHITESPACE_PAGES = [
+        "<p>a</p> <pre>x</pre> \n<p>b</p>",
+        "<div>a<p> <img src=x> \n</p>b</div>",
+        "<p>a</p>\n<table><tr><td></td></tr></table> <p>b</p>",
+    ]
+
+    def test_matches_chained_steps(self):
+        from obsidian_podcast.preprocessor.text import preprocess
+
+        for html in self.PAGES + self.WHITESPACE_PAGES:
+            for mode in ("skip", "announce", "read"):
+                assert preprocess(html, mode) == _chained_preprocess(html, mode), (
+                    html,
+                    mode,
+                )
+
+    def test_matches_chained_steps_on_random_html(self):
+        import random
+
+        from obsidian_podcast.preprocessor.text import preprocess
+
+        rng = random.Random(2200)
+        for _ in range(300):
+            html = _random_html(rng)
+            for mode in ("skip", "announce", "read"):
+                assert preprocess(html, mode) == _chained_preprocess(html, mode), (
+                    html,
+                    mode,
+                )
+
+
+class TestPreprocessTree:
+    """preprocess_tree on an lxml tree must match preprocess on its HTML."""
+
+    def _both(self, html: str, mode: str) -> tuple[str, str]:
+        import lxml.html
+        from lxml.etree import tounicode
+
+        from obsidian_podcast.preprocessor.text import preprocess, preprocess_tree
+
+        root = lxml.html.document_fromstring(html)
+        expected = preprocess(tounicode(root, method="html"), mode)
+        return preprocess_tree(root, mode), expected
+
+    def test_matches_bs4_path(self):
+        pages = (
+            TestPreprocessSingleParse.PAGES
+            + TestPreprocessSingleParse.WHITESPACE_PAGES
+            + [
+                "<div><p>a<br>b</p><script>var x = 1;</script>after script</div>",
+                "<div><table><tr><td>x <b>y</b> z</td></tr></table>tail</div>",
+                "<div>head<pre>one</pre><pre>two</pre>foot</div>",
+                "<p>a</p>\n<img src=x> \n<p>b</p>",
+                "<p>a<b> \n</b></p>b",
+            ]
+        )
+        for html in pages:
+            for mode in ("skip", "announce", "read"):
+                actual, expected = self._both(f"<html><body>{html}</body></html>", mode)
+                assert actual == expected, (html, mode)
+
+    def test_matches_bs4_path_on_random_html(self):
+        import random
+
+        rng = random.Random(2300)
+        for _ in range(300):
+            html = _random_html(rng)
+            for mode in ("skip", "announce", "read"):
+                actual, expected = self._both(f"<html><body>{html}</body></html>", mode)
+                assert actual == expected, (html, mode)
+
+    def test_extracted_tree(self):
+        from obsidian_podcast.preprocessor.text import preprocess, preprocess_tree
+        from obsidian_podcast.scraper.extractor import (
+            extract_content,
+            extract_content_tree,
+        )
+        from obsidian_podcast.scraper.test_extractor import SAMPLE_HTML
+
+        html = SAMPLE_HTML.replace(
+            "</article>",
+            "<pre><code>x = 1</code></pre><img src='a.png'/>"
+            "<table><tr><td>A</td><td>B</td></tr></table></article>",
+        )
+        tree = extract_content_tree(html)
+        assert tree is not None
+        assert preprocess_tree(tree) == preprocess(extract_content(html))
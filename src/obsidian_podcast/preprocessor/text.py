@@ -1,10 +1,13 @@
 """Text preprocessing for TTS output."""
 
+import functools
 import re
 
 from bs4 import BeautifulSoup
+from bs4.element import NavigableString, PreformattedString
 from langdetect import DetectorFactory, detect
 from langdetect.lang_detect_exception import LangDetectException
+from lxml.html import HtmlElement
 
 # Make langdetect deterministic
 DetectorFactory.seed = 0
@@ -12,14 +15,72 @@ DetectorFactory.seed = 0
 CODE_ANNOUNCE_TEXT = "(コード省略)"
 
 
+# When html.parser parses, BeautifulSoup replaces a string of nothing but
+# these characters with "\n" (if it has one) or " ", except inside
+# whitespace-preserving tags.
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+_PRESERVE_WHITESPACE_TAGS = frozenset(("pre", "textarea"))
+
+
+def _collapse_blank(text: str) -> str:
+    """Collapse a whitespace-only string as BeautifulSoup's parser does."""
+    if not text or text.strip(_ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _settle(soup: BeautifulSoup) -> None:
+    """Leave soup's strings as parsing its serialized HTML again would.
+
+    Removing or replacing tags leaves neighbouring strings split, and a
+    whitespace-only run between them uncollapsed. smooth() joins them, then
+    empty strings are dropped and blank ones collapsed, as a re-parse does.
+    """
+    soup.smooth()
+    for string in list(soup.descendants):
+        if not isinstance(string, NavigableString) or isinstance(
+            string, PreformattedString
+        ):
+            continue
+        if not string:
+            string.extract()
+            continue
+        collapsed = _collapse_blank(string)
+        if collapsed != string and not any(
+            parent.name in _PRESERVE_WHITESPACE_TAGS for parent in string.parents
+        ):
+            string.replace_with(collapsed)
+
+
+def _remove_images(soup: BeautifulSoup) -> bool:
+    tags = soup.find_all(["img", "figure"])
+    for tag in tags:
+        tag.decompose()
+    return bool(tags)
+
+
 def remove_images(html: str) -> str:
     """Remove img and figure tags from HTML."""
     soup = BeautifulSoup(html, "html.parser")
-    for tag in soup.find_all(["img", "figure"]):
-        tag.decompose()
+    _remove_images(soup)
     return str(soup)
 
 
+def _handle_code_blocks(soup: BeautifulSoup, mode: str) -> bool:
+    if mode not in ("skip", "announce"):
+        return False
+
+    tags = soup.find_all("pre")
+    for tag in tags:
+        if mode == "skip":
+            tag.decompose()
+        else:
+            new_tag = soup.new_tag("p")
+            new_tag.string = CODE_ANNOUNCE_TEXT
+            tag.replace_with(new_tag)
+    return bool(tags)
+
+
 def handle_code_blocks(html: str, mode: str = "skip") -> str:
     """Handle code blocks according to the specified mode.
 
@@ -29,26 +90,13 @@ def handle_code_blocks(html: str, mode: str = "skip") -> str:
         read: Keep code as-is
     """
     soup = BeautifulSoup(html, "html.parser")
-
-    if mode == "read":
-        return str(soup)
-
-    for tag in soup.find_all("pre"):
-        if mode == "skip":
-            tag.decompose()
-        elif mode == "announce":
-            new_tag = soup.new_tag("p")
-            new_tag.string = CODE_ANNOUNCE_TEXT
-            tag.replace_with(new_tag)
-
+    _handle_code_blocks(soup, mode)
     return str(soup)
 
 
-def table_to_text(html: str) -> str:
-    """Convert HTML tables to readable text representation."""
-    soup = BeautifulSoup(html, "html.parser")
-
-    for table in soup.find_all("table"):
+def _table_to_text(soup: BeautifulSoup) -> bool:
+    tables = soup.find_all("table")
+    for table in tables:
         rows: list[str] = []
         for tr in table.find_all("tr"):
             cells = [
@@ -58,7 +106,13 @@ def table_to_text(html: str) -> str:
             rows.append(" | ".join(cells))
         text_repr = "\n".join(rows)
         table.replace_with(text_repr)
+    return bool(tables)
+
 
+def table_to_text(html: str) -> str:
+    """Convert HTML tables to readable text representation."""
+    soup = BeautifulSoup(html, "html.parser")
+    _table_to_text(soup)
     return str(soup)
 
 
@@ -74,19 +128,116 @@ def normalize_whitespace(text: str) -> str:
     return text.strip()
 
 
-def detect_language(text: str) -> str | None:
-    """Detect the language of the given text.
+# Language detection only looks at a bounded prefix of the text, so its
+# cost does not grow with article size.
+_SCRIPT_SAMPLE_CHARS = 500
+_LANGDETECT_SAMPLE_CHARS = 2000
 
-    Returns ISO 639-1 language code or None on failure.
+_KANA_RE = re.compile(r"[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]")
+_HANGUL_RE = re.compile(r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af]")
+_HAN_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+_LATIN_RE = re.compile(r"[A-Za-z\u00c0-\u024f]")
+
+# Share of letters in the sample needed to call it Japanese / Korean.
+# Kana appears throughout Japanese prose, even when kanji- or English-heavy.
+_KANA_SHARE = 0.1
+_HANGUL_SHARE = 0.3
+# Share of letters needed to call the sample Han (Chinese, since it has too
+# little kana for Japanese) or Latin-script.
+_HAN_SHARE = 0.3
+_LATIN_SHARE = 0.5
+
+# Languages not normally written in Latin script. A hint naming one of them
+# disagrees with Latin-dominant text.
+_NON_LATIN_LANGUAGES = frozenset(
+    ("ja", "ko", "zh", "ru", "uk", "be", "bg", "mk", "el", "ar", "fa", "ur",
+     "he", "yi", "hi", "mr", "ne", "bn", "pa", "gu", "ta", "te", "kn", "ml",
+     "si", "th", "lo", "km", "my", "ka", "hy", "am")
+)  # fmt: skip
+
+
+def _normalize_language(code: str) -> str | None:
+    """Reduce a language tag such as "ja-JP" or "en_us" to "ja" / "en"."""
+    primary = re.split(r"[-_]", code.strip().lower(), maxsplit=1)[0]
+    return primary or None
+
+
+def _dominant_script(sample: str) -> str | None:
+    """Classify sample as "ja", "ko", "han" or "latin"; None when mixed.
+
+    "ja" and "ko" decide the language on their own. "han" (Chinese
+    characters without the kana of Japanese) and "latin" only narrow it
+    down, to be checked against a hint or settled by langdetect.
     """
-    if not text or not text.strip():
+    letters = sum(c.isalpha() for c in sample)
+    if not letters:
         return None
+    if len(_KANA_RE.findall(sample)) >= letters * _KANA_SHARE:
+        return "ja"
+    if len(_HANGUL_RE.findall(sample)) >= letters * _HANGUL_SHARE:
+        return "ko"
+    if len(_HAN_RE.findall(sample)) >= letters * _HAN_SHARE:
+        return "han"
+    if len(_LATIN_RE.findall(sample)) >= letters * _LATIN_SHARE:
+        return "latin"
+    return None
+
+
+def _script_language(sample: str) -> str | None:
+    """Guess the language from Unicode scripts; None when not decisive."""
+    script = _dominant_script(sample)
+    return script if script in ("ja", "ko") else None
+
+
+def _hint_fits_script(hint: str, script: str | None) -> bool:
+    """Whether text in a "han" or "latin" script can be in the hint language."""
+    if script == "han":
+        return hint == "zh"
+    if script == "latin":
+        return hint not in _NON_LATIN_LANGUAGES
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_sample(sample: str) -> str | None:
+    """Script histogram, then langdetect; cached by sample content."""
+    language = _script_language(sample[:_SCRIPT_SAMPLE_CHARS])
+    if language is not None:
+        return language
     try:
-        return detect(text)
+        return detect(sample)
     except LangDetectException:
         return None
 
 
+def detect_language(text: str, hint: str | None = None) -> str | None:
+    """Detect the language of the given text.
+
+    Tiers, cheapest first:
+    1. A Unicode script histogram of the first few hundred characters:
+       enough kana means Japanese, enough Hangul means Korean.
+    2. hint, e.g. the feed's declared language, when the histogram agrees
+       with it. Feeds often keep a default such as "en", so a hint is not
+       trusted for Chinese text, or a "ja" hint for Latin-script text.
+    3. langdetect on a bounded prefix, for Latin and other scripts and for
+       hints the histogram contradicts.
+
+    Results are cached by the sampled prefix, so repeated text is free.
+    Returns ISO 639-1 language code or None on failure.
+    """
+    if not text or not text.strip():
+        return None
+    sample = text.lstrip()[:_LANGDETECT_SAMPLE_CHARS]
+    hint = _normalize_language(hint) if hint else None
+    if hint is not None:
+        script = _dominant_script(sample[:_SCRIPT_SAMPLE_CHARS])
+        if script in ("ja", "ko"):
+            return script
+        if _hint_fits_script(hint, script):
+            return hint
+    return _detect_sample(sample)
+
+
 def preprocess(html: str, code_block_handling: str = "skip") -> str:
     """Run the full preprocessing pipeline on HTML content.
 
@@ -96,12 +247,135 @@ def preprocess(html: str, code_block_handling: str = "skip") -> str:
     3. Convert tables to text
     4. Extract text from HTML
     5. Normalize whitespace
+
+    The HTML is parsed once and every step edits the same tree. After a
+    step that changed the tree, _settle leaves its strings as the re-parse
+    in the step-by-step chain of the public functions above would, so the
+    output is the same as that chain's.
     """
-    result = handle_code_blocks(html, code_block_handling)
-    result = remove_images(result)
-    result = table_to_text(result)
-    # Extract plain text from remaining HTML
-    soup = BeautifulSoup(result, "html.parser")
+    soup = BeautifulSoup(html, "html.parser")
+    if _handle_code_blocks(soup, code_block_handling):
+        _settle(soup)
+    if _remove_images(soup):
+        _settle(soup)
+    if _table_to_text(soup):
+        _settle(soup)
     text = soup.get_text(separator="\n")
-    text = normalize_whitespace(text)
-    return text
+    return normalize_whitespace(text)
+
+
+# Elements whose text BeautifulSoup's get_text leaves out.
+_NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def _replace_with_text(element: HtmlElement, text: str) -> None:
+    """Replace element by text, joined onto the string before it."""
+    parent = element.getparent()
+    text += element.tail or ""
+    previous = element.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or "") + text
+    else:
+        parent.text = (parent.text or "") + text
+    parent.remove(element)
+
+
+def _collapse_tree_blanks(root: HtmlElement) -> None:
+    """Collapse whitespace-only text and tails as BeautifulSoup's parser does.
+
+    lxml keeps the text between two tags as one string (a text or tail),
+    and drop_tree and _replace_with_text join strings as they remove
+    elements, so collapsing after each step leaves the strings a re-parse
+    of the serialized tree would give.
+    """
+    stack = [(root, False)]
+    while stack:
+        element, preserve = stack.pop()
+        if not isinstance(element.tag, str):
+            continue
+        preserve = preserve or element.tag in _PRESERVE_WHITESPACE_TAGS
+        if preserve:
+            # Nothing below a <pre> or <textarea> is collapsed
+            continue
+        if element.text:
+            element.text = _collapse_blank(element.text)
+        for child in element:
+            if child.tail:
+                child.tail = _collapse_blank(child.tail)
+            stack.append((child, preserve))
+
+
+def _cell_text(cell: HtmlElement) -> str:
+    """Like BeautifulSoup's get_text(strip=True) on a table cell."""
+    return "".join(s.strip() for s in _text_strings(cell) if s.strip())
+
+
+def _text_strings(root: HtmlElement) -> list[str]:
+    """Text and tail strings under root in document order.
+
+    Skips comments and the contents of _NON_TEXT_TAGS, keeping their tails,
+    as BeautifulSoup's get_text does.
+    """
+    strings: list[str] = []
+    stack: list[HtmlElement | str] = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            strings.append(node)
+            continue
+        if not isinstance(node.tag, str) or node.tag in _NON_TEXT_TAGS:
+            continue
+        if node.text:
+            strings.append(node.text)
+        for child in reversed(node):
+            if child.tail:
+                stack.append(child.tail)
+            stack.append(child)
+    return strings
+
+
+def preprocess_tree(root: HtmlElement, code_block_handling: str = "skip") -> str:
+    """Run the preprocessing pipeline on an lxml tree, editing it in place.
+
+    Same steps and output as preprocess, for a tree that is already parsed,
+    such as the one extract_content_tree returns. Nothing is serialized
+    or parsed again, and the tree work runs in lxml rather than in
+    BeautifulSoup's pure-Python html.parser backend. Whitespace-only
+    strings are collapsed as BeautifulSoup collapses them when parsing, at
+    the start and after each step that changed the tree.
+    """
+    _collapse_tree_blanks(root)
+
+    if code_block_handling in ("skip", "announce"):
+        pres = [pre for pre in root.iter("pre") if pre.getparent() is not None]
+        for pre in pres:
+            if code_block_handling == "skip":
+                pre.drop_tree()
+            else:
+                announce = pre.makeelement("p", {})
+                announce.text = CODE_ANNOUNCE_TEXT
+                announce.tail = pre.tail
+                pre.getparent().replace(pre, announce)
+        if pres:
+            _collapse_tree_blanks(root)
+
+    images = [
+        image for image in root.iter("img", "figure") if image.getparent() is not None
+    ]
+    for image in images:
+        image.drop_tree()
+    if images:
+        _collapse_tree_blanks(root)
+
+    tables = [table for table in root.iter("table") if table.getparent() is not None]
+    for table in tables:
+        rows = [
+            " | ".join(_cell_text(cell) for cell in tr.iter("td", "th"))
+            for tr in table.iter("tr")
+        ]
+        _replace_with_text(table, "\n".join(rows))
+    if tables:
+        _collapse_tree_blanks(root)
+
+    text = "\n".join(_text_strings(root))
+    return normalize_whitespace(text)
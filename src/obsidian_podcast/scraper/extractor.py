@@ -3,6 +3,7 @@
 import logging
 
 import httpx
+from lxml.html import HtmlElement
 from readability import Document
 
 from obsidian_podcast.models import Article
@@ -10,10 +11,10 @@ from obsidian_podcast.models import Article
 logger = logging.getLogger(__name__)
 
 
-def extract_content(html: str) -> str | None:
-    """Extract main content from HTML using readability-lxml.
+def _summarize(html: str) -> tuple[Document, str] | None:
+    """Run readability on html, returning the document and its summary.
 
-    Returns the extracted HTML content string, or None if extraction fails.
+    Returns None when extraction fails or finds no content.
     """
     if not html or not html.strip():
         return None
@@ -24,12 +25,35 @@ def extract_content(html: str) -> str | None:
         # readability wraps in <html><body>; extract inner content
         if not content or len(content.strip()) < 10:
             return None
-        return content
+        return doc, content
     except Exception:
         logger.warning("readability extraction failed", exc_info=True)
         return None
 
 
+def extract_content(html: str) -> str | None:
+    """Extract main content from HTML using readability-lxml.
+
+    Returns the extracted HTML content string, or None if extraction fails.
+    """
+    summarized = _summarize(html)
+    return summarized[1] if summarized is not None else None
+
+
+def extract_content_tree(html: str) -> HtmlElement | None:
+    """Extract main content from HTML as readability's own lxml tree.
+
+    Same extraction as extract_content, but returns the element tree for
+    preprocess_tree instead of serialized HTML that preprocess would have
+    to parse again. Returns None if extraction fails.
+    """
+    summarized = _summarize(html)
+    if summarized is None:
+        return None
+    # summary() leaves the cleaned article tree on doc.html
+    return summarized[0].html
+
+
 async def scrape_article(
     client: httpx.AsyncClient,
     article: Article,
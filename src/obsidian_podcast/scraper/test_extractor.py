@@ -178,3 +178,24 @@ class TestScrapeArticle:
         # Should return as-is without making HTTP request
         assert result.is_podcast is True
         mock_client.get.assert_not_called()
+
+
+class TestExtractContentTree:
+    def test_returns_readability_tree(self):
+        from lxml.etree import tounicode
+        from readability.cleaners import clean_attributes
+
+        from obsidian_podcast.scraper.extractor import (
+            extract_content,
+            extract_content_tree,
+        )
+
+        tree = extract_content_tree(SAMPLE_HTML)
+        assert tree is not None
+        html = clean_attributes(tounicode(tree, method="html"))
+        assert html == extract_content(SAMPLE_HTML)
+
+    def test_empty_html_returns_none(self):
+        from obsidian_podcast.scraper.extractor import extract_content_tree
+
+        assert extract_content_tree("") is None
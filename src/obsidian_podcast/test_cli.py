@@ -60,3 +60,53 @@ class TestCLI:
         config_file.write_text("feeds: []\n")
         result = runner.invoke(app, ["run", "--config", str(config_file)])
         assert result.exit_code == 0
+
+    def test_list_filters_by_status(self, runner, tmp_path):
+        from obsidian_podcast.cli import app
+        from obsidian_podcast.db.state import StateDB
+
+        db_path = tmp_path / "state.db"
+        with StateDB(db_path) as db:
+            db.initialize()
+            db.add_article(url="https://example.com/ok", feed_url="f")
+            failed_id = db.add_article(url="https://example.com/ng", feed_url="f")
+            db.update_status(failed_id, "failed", error_message="boom")
+
+        result = runner.invoke(
+            app, ["list", "--status", "failed", "--db", str(db_path)]
+        )
+        assert result.exit_code == 0
+        assert "https://example.com/ng" in result.output
+        assert "https://example.com/ok" not in result.output
+
+    def test_list_missing_db(self, runner, tmp_path):
+        from obsidian_podcast.cli import app
+
+        result = runner.invoke(app, ["list", "--db", str(tmp_path / "none.db")])
+        assert result.exit_code == 1
+        assert "not found" in result.output
+
+    def test_run_prints_summary_and_writes_metrics(self, runner, tmp_path):
+        from obsidian_podcast.cli import app
+
+        out = tmp_path / "metrics.prom"
+        result = runner.invoke(
+            app,
+            ["run", "--metrics-out", str(out), "--metrics-format", "prometheus"],
+        )
+        assert result.exit_code == 0
+        assert "metrics" in result.output.lower()
+        assert "obsidian_podcast_run_elapsed_seconds" in out.read_text()
+
+    def test_run_rejects_unknown_metrics_format(self, runner):
+        from obsidian_podcast.cli import app
+
+        result = runner.invoke(app, ["run", "--metrics-format", "csv"])
+        assert result.exit_code != 0
+
+    def test_run_no_llm_cache(self, runner):
+        from obsidian_podcast.cli import app
+
+        result = runner.invoke(app, ["run", "--no-llm-cache"])
+        assert result.exit_code == 0
+        assert "cache disabled" in result.output
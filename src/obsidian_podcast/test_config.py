@@ -17,6 +17,8 @@ class TestAppConfig:
         assert config.obsidian.output_dir == "Podcast"
         assert config.obsidian.folder_structure == "monthly"
         assert config.summary.enabled is False
+        assert config.fetch.max_concurrency == 16
+        assert config.fetch.per_host_limit == 4
 
     def test_feeds_config(self):
         from obsidian_podcast.config import AppConfig, FeedConfigModel
@@ -81,6 +83,19 @@ class TestConfigPaths:
         config_dir = get_config_dir()
         assert config_dir == tmp_path / ".config" / "obsidian-podcast"
 
+    def test_data_dir(self, monkeypatch, tmp_path):
+        from obsidian_podcast.config import get_data_dir
+
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+        assert get_data_dir() == tmp_path / "obsidian-podcast"
+
+    def test_data_dir_fallback(self, monkeypatch, tmp_path):
+        from obsidian_podcast.config import get_data_dir
+
+        monkeypatch.delenv("XDG_DATA_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert get_data_dir() == tmp_path / ".local" / "share" / "obsidian-podcast"
+
     def test_generate_default_config(self, tmp_path):
         from obsidian_podcast.config import generate_default_config
 
@@ -106,6 +121,7 @@ class TestLLMConfig:
         assert config.api_key_env == ""
         assert config.base_url is None
         assert config.max_chunk_chars == 4000
+        assert config.max_chunk_tokens is None
 
     def test_app_config_has_llm_field(self):
         from obsidian_podcast.config import AppConfig, LLMConfig
@@ -137,3 +153,26 @@ class TestLLMConfig:
         assert config.llm.api_key_env == "ANTHROPIC_API_KEY"
         assert config.llm.base_url == "https://api.anthropic.com"
         assert config.llm.max_chunk_chars == 8000
+        assert config.llm.max_chunk_tokens is None
+
+
+class TestTTSTerms:
+    def test_no_terms_by_default(self):
+        from obsidian_podcast.config import TTSConfig
+
+        assert TTSConfig().load_terms() == {}
+
+    def test_inline_terms_override_file(self, tmp_path):
+        from obsidian_podcast.config import TTSConfig
+
+        terms_file = tmp_path / "terms.yaml"
+        terms_file.write_text(yaml.dump({"Hono": "ホノ", "Bun": "ブン"}))
+        config = TTSConfig(terms={"Bun": "バン"}, terms_path=str(terms_file))
+        assert config.load_terms() == {"Hono": "ホノ", "Bun": "バン"}
+
+    def test_missing_terms_file(self, tmp_path):
+        from obsidian_podcast.config import TTSConfig
+
+        config = TTSConfig(terms_path=str(tmp_path / "missing.yaml"))
+        with pytest.raises(FileNotFoundError):
+            config.load_terms()
@@ -0,0 +1,97 @@
+"""Tests for pipeline metrics collection and output formats."""
+
+import json
+
+
+def _event(step="ScrapeStep", item=0, wall=0.5, error=None):
+    from obsidian_podcast.metrics import StepEvent
+
+    return StepEvent(
+        step=step,
+        item=item,
+        label=f"https://example.com/{item}",
+        wall_time=wall,
+        queue_wait=0.1,
+        bytes_in=100,
+        bytes_out=2048,
+        error=error,
+    )
+
+
+class TestPayloadSize:
+    def test_sizes(self):
+        from obsidian_podcast.metrics import payload_size
+        from obsidian_podcast.models import Article
+        from obsidian_podcast.preprocessor.pool import PreparedText
+
+        assert payload_size(b"abc") == 3
+        assert payload_size("あ") == 3
+        assert payload_size(Article(url="u", feed_url="f", content="abcd")) == 4
+        assert payload_size(PreparedText("abc", "en")) == 3
+        assert payload_size(42) == 0
+        assert payload_size(None) == 0
+
+
+class TestMetricsCollector:
+    def test_aggregates_per_step(self):
+        from obsidian_podcast.metrics import MetricsCollector
+
+        metrics = MetricsCollector()
+        metrics.on_step(_event(item=0, wall=0.5))
+        metrics.on_step(_event(item=1, wall=1.5, error="RuntimeError: boom"))
+        metrics.on_step(_event(step="TTSStep", item=0, wall=3.0))
+
+        scrape = metrics.steps["ScrapeStep"]
+        assert scrape.items == 2
+        assert scrape.failures == 1
+        assert scrape.wall_time == 2.0
+        assert scrape.max_wall_time == 1.5
+        assert scrape.bytes_out == 4096
+        assert metrics.steps["TTSStep"].items == 1
+
+    def test_format_table(self):
+        from obsidian_podcast.metrics import MetricsCollector
+
+        metrics = MetricsCollector()
+        assert "No pipeline metrics" in metrics.format_table()
+
+        metrics.on_step(_event())
+        metrics.add_counter("llm_cache_read_tokens", 10)
+        table = metrics.format_table()
+        assert "ScrapeStep" in table
+        assert "llm_cache_read_tokens: 10" in table
+
+    def test_write_jsonl(self, tmp_path):
+        from obsidian_podcast.metrics import MetricsCollector
+
+        metrics = MetricsCollector()
+        metrics.on_step(_event())
+        path = tmp_path / "metrics.jsonl"
+        metrics.write(path, "jsonl")
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["type"] for r in records] == ["event", "step", "run"]
+        assert records[0]["label"] == "https://example.com/0"
+        assert records[1]["items"] == 1
+
+    def test_write_prometheus(self, tmp_path):
+        from obsidian_podcast.metrics import MetricsCollector
+
+        metrics = MetricsCollector()
+        metrics.on_step(_event())
+        metrics.add_counter("llm_input_tokens_total", 5)
+        path = tmp_path / "metrics.prom"
+        metrics.write(path, "prometheus")
+
+        text = path.read_text()
+        assert "# TYPE obsidian_podcast_step_items_total counter" in text
+        assert 'obsidian_podcast_step_items_total{step="ScrapeStep"} 1' in text
+        assert "obsidian_podcast_llm_input_tokens_total 5" in text
+
+    def test_unknown_format_raises(self, tmp_path):
+        import pytest
+
+        from obsidian_podcast.metrics import MetricsCollector
+
+        with pytest.raises(ValueError, match="Unknown metrics format"):
+            MetricsCollector().write(tmp_path / "m", "csv")
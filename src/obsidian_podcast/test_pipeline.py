@@ -96,3 +96,220 @@ class TestLLMScriptStep:
         pipeline = Pipeline(steps=[step])
         result = await pipeline.run("Input text")
         assert result == "Transformed"
+
+
+class TestPreprocessStep:
+    @pytest.mark.asyncio
+    async def test_run_many_through_pool(self):
+        from obsidian_podcast.pipeline import Pipeline, PreprocessStep
+        from obsidian_podcast.preprocessor.pool import PreprocessPool
+
+        with PreprocessPool(max_workers=2, batch_size=3, sanitize=False) as pool:
+            step = PreprocessStep(pool)
+            assert step.concurrency == 6
+            pipeline = Pipeline(steps=[step])
+            htmls = [f"<p>記事{i}です。</p>" for i in range(10)]
+            results = [r async for r in pipeline.run_many(htmls)]
+
+        assert sorted(r.index for r in results) == list(range(10))
+        for r in results:
+            assert r.ok
+            assert r.output.text == f"記事{r.index}です。"
+
+
+class TestRunMany:
+    @staticmethod
+    async def _collect(pipeline, items):
+        return [result async for result in pipeline.run_many(items)]
+
+    @pytest.mark.asyncio
+    async def test_processes_all_items(self):
+        from obsidian_podcast.pipeline import Pipeline, PipelineStep
+
+        class AddOneStep(PipelineStep[int, int]):
+            concurrency = 3
+
+            async def process(self, input_data: int) -> int:
+                return input_data + 1
+
+        class DoubleStep(PipelineStep[int, int]):
+            async def process(self, input_data: int) -> int:
+                return input_data * 2
+
+        pipeline = Pipeline(steps=[AddOneStep(), DoubleStep()])
+        results = await self._collect(pipeline, range(20))
+
+        assert sorted(r.index for r in results) == list(range(20))
+        for r in results:
+            assert r.ok
+            assert r.output == (r.input + 1) * 2
+
+    @pytest.mark.asyncio
+    async def test_empty_pipeline_and_empty_input(self):
+        from obsidian_podcast.pipeline import Pipeline
+
+        results = await self._collect(Pipeline(steps=[]), ["a", "b"])
+        assert [r.output for r in results] == ["a", "b"]
+        assert await self._collect(Pipeline(steps=[]), []) == []
+
+    @pytest.mark.asyncio
+    async def test_respects_per_step_concurrency(self):
+        import asyncio
+
+        from obsidian_podcast.pipeline import Pipeline, PipelineStep
+
+        class TrackingStep(PipelineStep[int, int]):
+            def __init__(self, concurrency: int) -> None:
+                self.concurrency = concurrency
+                self.active = 0
+                self.peak = 0
+
+            async def process(self, input_data: int) -> int:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.005)
+                self.active -= 1
+                return input_data
+
+        cheap, expensive = TrackingStep(8), TrackingStep(2)
+        pipeline = Pipeline(steps=[cheap, expensive])
+        await self._collect(pipeline, range(30))
+
+        assert cheap.peak > 2
+        assert cheap.peak <= 8
+        assert expensive.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_isolated_to_item(self):
+        from obsidian_podcast.pipeline import Pipeline, PipelineStep
+
+        class FlakyStep(PipelineStep[int, int]):
+            concurrency = 2
+
+            async def process(self, input_data: int) -> int:
+                if input_data == 3:
+                    raise RuntimeError("boom")
+                return input_data
+
+        class RecordingStep(PipelineStep[int, int]):
+            def __init__(self) -> None:
+                self.seen: list[int] = []
+
+            async def process(self, input_data: int) -> int:
+                self.seen.append(input_data)
+                return input_data
+
+        recorder = RecordingStep()
+        pipeline = Pipeline(steps=[FlakyStep(), recorder])
+        results = await self._collect(pipeline, range(6))
+
+        failed = [r for r in results if not r.ok]
+        assert len(results) == 6
+        assert [r.index for r in failed] == [3]
+        assert isinstance(failed[0].error, RuntimeError)
+        assert failed[0].failed_step == "FlakyStep"
+        assert 3 not in recorder.seen
+        assert sorted(recorder.seen) == [0, 1, 2, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_failing_input_iterable_raises(self):
+        import asyncio
+
+        from obsidian_podcast.pipeline import Pipeline, PipelineStep
+
+        class AddOneStep(PipelineStep[int, int]):
+            async def process(self, input_data: int) -> int:
+                return input_data + 1
+
+        def items():
+            yield 1
+            raise ValueError("bad source")
+
+        pipeline = Pipeline(steps=[AddOneStep()])
+        outputs = []
+
+        async def consume():
+            async for result in pipeline.run_many(items()):
+                outputs.append(result.output)
+
+        with pytest.raises(ValueError, match="bad source"):
+            await asyncio.wait_for(consume(), timeout=3)
+        assert outputs == [2]
+
+    @pytest.mark.asyncio
+    async def test_bounded_queues_apply_backpressure(self):
+        import asyncio
+
+        from obsidian_podcast.pipeline import Pipeline, PipelineStep
+
+        class CountingStep(PipelineStep[int, int]):
+            concurrency = 4
+
+            def __init__(self) -> None:
+                self.started = 0
+
+            async def process(self, input_data: int) -> int:
+                self.started += 1
+                return input_data
+
+        class BlockedStep(PipelineStep[int, int]):
+            def __init__(self) -> None:
+                self.release = asyncio.Event()
+
+            async def process(self, input_data: int) -> int:
+                await self.release.wait()
+                return input_data
+
+        first, blocked = CountingStep(), BlockedStep()
+        pipeline = Pipeline(steps=[first, blocked], queue_size=2)
+        consumer = asyncio.create_task(self._collect(pipeline, range(100)))
+        await asyncio.sleep(0.05)
+
+        # Upstream stalls once the queue ahead of the blocked step fills up.
+        assert first.started < 20
+        blocked.release.set()
+        results = await consumer
+        assert len(results) == 100
+
+
+class TestPipelineHooks:
+    @pytest.mark.asyncio
+    async def test_run_reports_each_step(self):
+        from obsidian_podcast.metrics import MetricsCollector
+        from obsidian_podcast.pipeline import Pipeline, PipelineStep
+
+        class UpperStep(PipelineStep[str, str]):
+            async def process(self, input_data: str) -> str:
+                return input_data.upper()
+
+        metrics = MetricsCollector()
+        pipeline = Pipeline(steps=[UpperStep(), UpperStep()], hooks=metrics)
+        assert await pipeline.run("abc") == "ABC"
+
+        assert metrics.steps["UpperStep"].items == 2
+        assert metrics.steps["UpperStep"].bytes_in == 6
+        assert metrics.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_run_many_records_failures_and_queue_wait(self):
+        from obsidian_podcast.metrics import MetricsCollector
+        from obsidian_podcast.pipeline import Pipeline, PipelineStep
+
+        class FlakyStep(PipelineStep[int, int]):
+            async def process(self, input_data: int) -> int:
+                if input_data == 1:
+                    raise ValueError("bad item")
+                return input_data
+
+        metrics = MetricsCollector()
+        pipeline = Pipeline(steps=[FlakyStep()], hooks=metrics)
+        results = [r async for r in pipeline.run_many(range(3))]
+
+        assert len(results) == 3
+        stats = metrics.steps["FlakyStep"]
+        assert stats.items == 3
+        assert stats.failures == 1
+        assert all(e.queue_wait >= 0 for e in metrics.events)
+        failed = [e for e in metrics.events if e.error]
+        assert failed[0].item == 1
+        assert "ValueError: bad item" in failed[0].error
@@ -1,6 +1,8 @@
 """TTS engine base class and factory."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
 
 _registry: dict[str, type["TTSEngine"]] = {}
 
@@ -30,3 +32,24 @@ def get_tts_engine(name: str) -> TTSEngine:
         msg = f"Unknown TTS engine: {name}. Available: {list(_registry.keys())}"
         raise ValueError(msg)
     return _registry[name]()
+
+
+async def synthesize_stream(
+    engine: TTSEngine,
+    segments: AsyncIterable[str],
+    language: str,
+    output_dir: Path,
+    prefix: str = "segment",
+) -> AsyncIterator[Path]:
+    """Synthesize each text segment as soon as it arrives.
+
+    Writes output_dir/{prefix}_0000.mp3, _0001.mp3, ... and yields each path
+    once its audio is ready.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    index = 0
+    async for segment in segments:
+        path = output_dir / f"{prefix}_{index:04d}.mp3"
+        await engine.synthesize(segment, language, str(path))
+        yield path
+        index += 1
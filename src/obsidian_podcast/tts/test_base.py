@@ -66,3 +66,36 @@ class TestTTSFactory:
         register_tts_engine("dummy", DummyTTS)
         engine = get_tts_engine("dummy")
         assert isinstance(engine, DummyTTS)
+
+
+class TestSynthesizeStream:
+    @pytest.mark.asyncio
+    async def test_synthesizes_each_segment_as_it_arrives(self, tmp_path):
+        from obsidian_podcast.tts.base import TTSEngine, synthesize_stream
+
+        calls = []
+
+        class RecordingTTS(TTSEngine):
+            async def synthesize(
+                self, text: str, language: str, output_path: str
+            ) -> None:
+                calls.append((text, language, output_path))
+
+            def supported_languages(self) -> list[str]:
+                return ["ja"]
+
+        async def segments():
+            yield "最初の文。"
+            # The first file must be ready before the next segment exists.
+            assert len(calls) == 1
+            yield "次の文。"
+
+        paths = [
+            p
+            async for p in synthesize_stream(
+                RecordingTTS(), segments(), "ja", tmp_path / "out"
+            )
+        ]
+
+        assert [p.name for p in paths] == ["segment_0000.mp3", "segment_0001.mp3"]
+        assert calls[0] == ("最初の文。", "ja", str(paths[0]))